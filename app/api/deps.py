@@ -18,6 +18,7 @@ from app.core.exceptions import (
     SessionRevokedError,
 )
 from app.models.user import User, UserSession, UserRole
+from app.services.activity_service import activity_service
 
 
 async def get_current_user_optional(
@@ -86,6 +87,9 @@ async def get_current_user(
             f"User account is blocked: {user.blocked_reason or 'No reason provided'}"
         )
 
+    # Buffered in Redis and flushed to users.last_seen_at in batches
+    await activity_service.touch(user.id)
+
     return user
 
 
@@ -0,0 +1,25 @@
+"""
+Pagination helpers shared by the API routers.
+"""
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def fetch_page(db: AsyncSession, query, count_query, page: int, page_size: int) -> tuple:
+    """
+    Fetch one OFFSET page of ``query`` with the total from ``count(*) OVER ()``.
+
+    ``count_query`` only runs when the page is empty (past the end), where
+    no row carries the total.
+    """
+    result = await db.execute(
+        query.add_columns(func.count().over().label("total_count"))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
+    rows = result.all()
+    if rows:
+        return rows, rows[0].total_count
+    total_result = await db.execute(count_query)
+    return rows, total_result.scalar() or 0
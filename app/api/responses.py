@@ -0,0 +1,54 @@
+"""
+Response helpers shared by the API routers.
+"""
+
+from decimal import Decimal
+from typing import Any, Sequence
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.schemas.common import list_adapter
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize an already-built response schema straight to JSON.
+
+    FastAPI would otherwise dump the returned model and validate the result
+    against the route's ``response_model`` once more; the route keeps
+    ``response_model`` for the OpenAPI schema only.
+    """
+    return Response(model.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
+def list_response(schema: type, items: Sequence[BaseModel]) -> Response:
+    """Like ``model_response`` for a ``List[schema]`` route: the whole list in one dump."""
+    return Response(list_adapter(schema).dump_json(list(items)), media_type="application/json")
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in header.split(","))
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        # Same wire format as pydantic: a string, no float rounding
+        return str(value)
+    raise TypeError
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """
+    Encode plain dicts/lists (e.g. from ``BaseSchema.orm_dict``) in one orjson call.
+
+    Datetimes use the ``Z`` suffix and Decimals become strings, as in
+    pydantic's JSON output.
+    """
+    body = orjson.dumps(content, default=_encode_default, option=orjson.OPT_UTC_Z)
+    return Response(body, status_code=status_code, media_type="application/json")
@@ -4,7 +4,7 @@ API v1 routes.
 
 from fastapi import APIRouter
 
-from app.api.v1 import auth, users, ads, categories, vehicles, locations, chat, favorites, moderation, banners, uploads, admin_dashboard
+from app.api.v1 import auth, users, ads, categories, vehicles, locations, chat, favorites, notifications, moderation, banners, uploads, admin_dashboard
 
 api_router = APIRouter()
 
@@ -16,6 +16,7 @@ api_router.include_router(vehicles.router, prefix="/vehicles", tags=["Vehicles"]
 api_router.include_router(locations.router, prefix="/locations", tags=["Locations"])
 api_router.include_router(chat.router, prefix="/chat", tags=["Chat"])
 api_router.include_router(favorites.router, prefix="/favorites", tags=["Favorites"])
+api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
 api_router.include_router(moderation.router, prefix="/moderation", tags=["Moderation"])
 api_router.include_router(banners.router, prefix="/banners", tags=["Banners"])
 api_router.include_router(uploads.router, prefix="/uploads", tags=["Uploads"])
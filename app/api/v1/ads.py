@@ -3,24 +3,39 @@ Advertisement/Listing endpoints.
 CRUD operations, search, filtering, and statistics.
 """
 
-import json
+import base64
+import hashlib
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_, and_
-from sqlalchemy.orm import selectinload
+import orjson
+from sqlalchemy import Integer, select, insert, func, or_, and_, any_, bindparam, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from app.core.database import get_db
 from app.core.config import settings
 from app.core.exceptions import NotFoundError, AuthorizationError, ValidationError
-from app.models.ad import Ad, AdStatus, AdImage, AdVideo
+from app.models.ad import Ad, AdStatus, AdImage, AdVideo, features_mask
+from app.models.ad_list import ad_list_query, ad_list_view_query, ad_list_mv
 from app.models.user import User, UserRole
 from app.models.category import Category
-from app.models.vehicle import Brand, Model, Generation
-from app.models.location import City, Region
+from app.models.vehicle import (
+    VehicleType,
+    Brand,
+    Model,
+    Generation,
+    Modification,
+    BodyType,
+    Transmission,
+    FuelType,
+    DriveType,
+    Color,
+)
+from app.models.location import City, Region, Country, cities_within
 from app.models.favorites import Favorite, Comparison, ViewHistory
 from app.schemas.ad import (
     AdCreate,
@@ -33,141 +48,262 @@ from app.schemas.ad import (
     AdImageCreate,
 )
 from app.schemas.common import PaginatedResponse, MessageOut
+from app.services.ad_cache import ad_cache, ad_cache_key
+from app.services.ad_view_service import ad_view_service
 from app.api.deps import get_current_user, get_current_user_optional, get_current_verified_user, require_moderator
+from app.api.pagination import fetch_page
+from app.api.responses import etag_matches, model_response
 
 
 router = APIRouter()
 
 
+def build_list_items(rows, favorite_ids: frozenset = frozenset()) -> List[AdListResponse]:
+    """Build list items from ad list rows (trusted DB data, no validation)."""
+    return [
+        AdListResponse.model_construct(**row._mapping, is_favorite=row.id in favorite_ids)
+        for row in rows
+    ]
+
+
+def ad_list_page(
+    items: List[AdListResponse],
+    total: int,
+    page: int,
+    page_size: int,
+    next_cursor: Optional[str] = None,
+) -> Response:
+    """
+    Serialize a page of list items straight to JSON.
+
+    The items come from DB rows via model_construct, so the page is dumped
+    by pydantic-core in one call instead of being re-validated against the
+    endpoint's response_model (which is kept for the OpenAPI schema).
+    """
+    page_data = PaginatedResponse[AdListResponse].create_unvalidated(
+        items, total, page, page_size, next_cursor
+    )
+    return model_response(page_data)
+
+
+PUBLIC_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=60"
+
+
+def cache_headers(etag: str, current_user: Optional[User]) -> dict:
+    """
+    Validator headers for a GET response.
+
+    Anonymous responses may be stored by shared caches (CDN); responses that
+    carry per-user flags must be revalidated by the browser only.
+    """
+    return {
+        "ETag": etag,
+        "Cache-Control": PUBLIC_CACHE_CONTROL if current_user is None else "private, no-cache",
+        "Vary": "Cookie",
+    }
+
+
+def list_etag(params: AdSearchParams, total: int, last_updated, views_total, current_user: Optional[User]) -> str:
+    """Weak ETag for a result page: query, matching set version and viewer."""
+    state = (
+        params.model_dump_json(),
+        total,
+        last_updated.isoformat() if last_updated else None,
+        views_total,
+        current_user.id if current_user else None,
+    )
+    return f'W/"{hashlib.blake2b(repr(state).encode(), digest_size=12).hexdigest()}"'
+
+
 async def get_ad_with_relations(db: AsyncSession, ad_id: int) -> Ad:
-    """Load ad with all related data."""
+    """
+    Load ad with all related data.
+
+    Many-to-one references are joined into the main SELECT, the media
+    collections come from one extra query each. Any relationship not
+    listed here raises instead of lazy loading.
+    """
     result = await db.execute(
         select(Ad).options(
-            selectinload(Ad.user),
-            selectinload(Ad.category),
-            selectinload(Ad.vehicle_type),
-            selectinload(Ad.brand),
-            selectinload(Ad.model),
-            selectinload(Ad.generation),
-            selectinload(Ad.modification),
-            selectinload(Ad.body_type),
-            selectinload(Ad.transmission),
-            selectinload(Ad.fuel_type),
-            selectinload(Ad.drive_type),
-            selectinload(Ad.color),
-            selectinload(Ad.city).selectinload(City.region).selectinload(Region.country),
+            joinedload(Ad.user),
+            joinedload(Ad.category),
+            joinedload(Ad.vehicle_type),
+            joinedload(Ad.brand),
+            joinedload(Ad.model),
+            joinedload(Ad.generation),
+            joinedload(Ad.modification),
+            joinedload(Ad.body_type),
+            joinedload(Ad.transmission),
+            joinedload(Ad.fuel_type),
+            joinedload(Ad.drive_type),
+            joinedload(Ad.color),
+            joinedload(Ad.city).joinedload(City.region).joinedload(Region.country),
             selectinload(Ad.images),
             selectinload(Ad.videos),
+            raiseload("*"),
         ).where(Ad.id == ad_id, Ad.deleted_at.is_(None))
     )
     return result.scalar_one_or_none()
 
 
-def build_search_query(params: AdSearchParams):
-    """Build search query from parameters."""
-    query = select(Ad).where(
-        Ad.status == AdStatus.ACTIVE,
-        Ad.deleted_at.is_(None),
-    )
+# Rows embedded in AdResponse besides the ad itself, with how each is joined
+AD_RESPONSE_JOINS = (
+    (User, User.id == Ad.user_id),
+    (Category, Category.id == Ad.category_id),
+    (VehicleType, VehicleType.id == Ad.vehicle_type_id),
+    (Brand, Brand.id == Ad.brand_id),
+    (Model, Model.id == Ad.model_id),
+    (Generation, Generation.id == Ad.generation_id),
+    (Modification, Modification.id == Ad.modification_id),
+    (BodyType, BodyType.id == Ad.body_type_id),
+    (Transmission, Transmission.id == Ad.transmission_id),
+    (FuelType, FuelType.id == Ad.fuel_type_id),
+    (DriveType, DriveType.id == Ad.drive_type_id),
+    (Color, Color.id == Ad.color_id),
+    (City, City.id == Ad.city_id),
+    (Region, Region.id == City.region_id),
+    (Country, Country.id == Region.country_id),
+)
 
-    # Text search
-    if params.q:
-        search_term = f"%{params.q}%"
+
+def ad_response_version_query(ad_id: int):
+    """
+    Ad header row plus the latest ``updated_at`` of everything AdResponse embeds.
+
+    A seller's profile edit or a renamed brand doesn't touch the ads row,
+    so the cache version has to cover the joined rows as well. These are
+    primary key lookups, far cheaper than building the response.
+    """
+    query = select(
+        Ad.status,
+        Ad.user_id,
+        Ad.views_count,
+        Ad.favorites_count,
+        func.greatest(Ad.updated_at, *(model.updated_at for model, _ in AD_RESPONSE_JOINS))
+        .label("version_at"),
+    ).select_from(Ad)
+    for model, on in AD_RESPONSE_JOINS:
+        query = query.outerjoin(model, on)
+    return query.where(Ad.id == ad_id, Ad.deleted_at.is_(None))
+
+
+def build_search_query(params: AdSearchParams, query=None, source=None):
+    """
+    Build search query from parameters.
+
+    Filters are applied to ``query`` (``select(Ad)`` by default). With
+    ``source=ad_list_mv`` they run against the materialized view, which
+    only holds active ads; see ``list_view_supports`` for the filters it
+    can serve.
+    """
+    if query is None:
+        query = select(Ad)
+    if source is None:
+        c = Ad
         query = query.where(
-            or_(
-                Ad.title.ilike(search_term),
-                Ad.description.ilike(search_term),
-            )
+            Ad.status == AdStatus.ACTIVE,
+            Ad.deleted_at.is_(None),
         )
+    else:
+        c = source.c
+
+    # Full-text search (GIN index on the generated search_vector column)
+    if params.q:
+        query = query.where(Ad.search_vector.op("@@")(search_query(params.q)))
 
     # Category
     if params.category_id:
-        query = query.where(Ad.category_id == params.category_id)
+        query = query.where(c.category_id == params.category_id)
 
     # Vehicle filters
     if params.vehicle_type_id:
-        query = query.where(Ad.vehicle_type_id == params.vehicle_type_id)
+        query = query.where(c.vehicle_type_id == params.vehicle_type_id)
 
     if params.brand_id:
-        query = query.where(Ad.brand_id == params.brand_id)
+        query = query.where(c.brand_id == params.brand_id)
     elif params.brand_ids:
-        query = query.where(Ad.brand_id.in_(params.brand_ids))
+        query = query.where(id_in(c.brand_id, params.brand_ids))
 
     if params.model_id:
-        query = query.where(Ad.model_id == params.model_id)
+        query = query.where(c.model_id == params.model_id)
     elif params.model_ids:
-        query = query.where(Ad.model_id.in_(params.model_ids))
+        query = query.where(id_in(c.model_id, params.model_ids))
 
     if params.generation_id:
-        query = query.where(Ad.generation_id == params.generation_id)
+        query = query.where(c.generation_id == params.generation_id)
 
     # Price
     if params.price_from:
-        query = query.where(Ad.price >= params.price_from)
+        query = query.where(c.price >= params.price_from)
     if params.price_to:
-        query = query.where(Ad.price <= params.price_to)
+        query = query.where(c.price <= params.price_to)
 
     # Year
     if params.year_from:
-        query = query.where(Ad.year >= params.year_from)
+        query = query.where(c.year >= params.year_from)
     if params.year_to:
-        query = query.where(Ad.year <= params.year_to)
+        query = query.where(c.year <= params.year_to)
 
     # Mileage
     if params.mileage_from:
-        query = query.where(Ad.mileage >= params.mileage_from)
+        query = query.where(c.mileage >= params.mileage_from)
     if params.mileage_to:
-        query = query.where(Ad.mileage <= params.mileage_to)
+        query = query.where(c.mileage <= params.mileage_to)
 
     # Specs
     if params.body_type_id:
-        query = query.where(Ad.body_type_id == params.body_type_id)
+        query = query.where(c.body_type_id == params.body_type_id)
     elif params.body_type_ids:
-        query = query.where(Ad.body_type_id.in_(params.body_type_ids))
+        query = query.where(id_in(c.body_type_id, params.body_type_ids))
 
     if params.transmission_id:
-        query = query.where(Ad.transmission_id == params.transmission_id)
+        query = query.where(c.transmission_id == params.transmission_id)
     elif params.transmission_ids:
-        query = query.where(Ad.transmission_id.in_(params.transmission_ids))
+        query = query.where(id_in(c.transmission_id, params.transmission_ids))
 
     if params.fuel_type_id:
-        query = query.where(Ad.fuel_type_id == params.fuel_type_id)
+        query = query.where(c.fuel_type_id == params.fuel_type_id)
     elif params.fuel_type_ids:
-        query = query.where(Ad.fuel_type_id.in_(params.fuel_type_ids))
+        query = query.where(id_in(c.fuel_type_id, params.fuel_type_ids))
 
     if params.drive_type_id:
-        query = query.where(Ad.drive_type_id == params.drive_type_id)
+        query = query.where(c.drive_type_id == params.drive_type_id)
     elif params.drive_type_ids:
-        query = query.where(Ad.drive_type_id.in_(params.drive_type_ids))
+        query = query.where(id_in(c.drive_type_id, params.drive_type_ids))
 
     if params.color_id:
-        query = query.where(Ad.color_id == params.color_id)
+        query = query.where(c.color_id == params.color_id)
     elif params.color_ids:
-        query = query.where(Ad.color_id.in_(params.color_ids))
+        query = query.where(id_in(c.color_id, params.color_ids))
 
     # Engine
     if params.engine_volume_from:
-        query = query.where(Ad.engine_volume >= params.engine_volume_from)
+        query = query.where(c.engine_volume >= params.engine_volume_from)
     if params.engine_volume_to:
-        query = query.where(Ad.engine_volume <= params.engine_volume_to)
+        query = query.where(c.engine_volume <= params.engine_volume_to)
     if params.engine_power_from:
-        query = query.where(Ad.engine_power >= params.engine_power_from)
+        query = query.where(c.engine_power >= params.engine_power_from)
     if params.engine_power_to:
-        query = query.where(Ad.engine_power <= params.engine_power_to)
+        query = query.where(c.engine_power <= params.engine_power_to)
 
     # Condition
     if params.condition:
-        query = query.where(Ad.condition == params.condition)
+        query = query.where(c.condition == params.condition)
     if params.is_damaged is not None:
-        query = query.where(Ad.is_damaged == params.is_damaged)
+        query = query.where(c.is_damaged == params.is_damaged)
     if params.steering_wheel:
-        query = query.where(Ad.steering_wheel == params.steering_wheel)
+        query = query.where(c.steering_wheel == params.steering_wheel)
 
     # Location
-    if params.city_id:
-        query = query.where(Ad.city_id == params.city_id)
+    if params.city_id and params.radius_km:
+        query = query.where(c.city_id.in_(cities_within(params.city_id, params.radius_km)))
+    elif params.city_id:
+        query = query.where(c.city_id == params.city_id)
     elif params.region_id:
-        query = query.join(City).where(City.region_id == params.region_id)
+        if source is None:
+            query = query.where(Ad.city.has(City.region_id == params.region_id))
+        else:
+            query = query.where(c.region_id == params.region_id)
 
     # Other filters
     if params.has_photo:
@@ -176,126 +312,201 @@ def build_search_query(params: AdSearchParams):
         query = query.where(Ad.videos.any())
     if params.has_vin:
         query = query.where(Ad.vin.isnot(None))
+    if params.features:
+        # Has all of the requested equipment
+        mask = features_mask(params.features)
+        query = query.where(c.features_mask.op("&")(mask) == mask)
 
     if params.dealer_only:
-        query = query.join(User).where(User.role == UserRole.DEALER)
+        query = query.where(Ad.user.has(User.role == UserRole.DEALER))
     elif params.private_only:
-        query = query.join(User).where(User.role == UserRole.USER)
+        query = query.where(Ad.user.has(User.role == UserRole.USER))
 
     return query
 
 
-def apply_sorting(query, sort_by: str):
+def list_view_supports(params: AdSearchParams) -> bool:
+    """Whether the search can be answered from ad_list_mv alone."""
+    return not (
+        params.q
+        or params.has_photo
+        or params.has_video
+        or params.has_vin
+        or params.dealer_only
+        or params.private_only
+    )
+
+
+def id_in(column, ids):
+    """
+    ``column = ANY(:ids)`` with the list bound as one int[] parameter.
+
+    Unlike ``in_()``, the SQL text doesn't depend on the list length, so
+    every request shares one prepared statement and plan.
+    """
+    return column == any_(bindparam(None, list(ids), type_=ARRAY(Integer)))
+
+
+def search_query(q: str):
+    """tsquery for the user's search text (same config as Ad.search_vector)."""
+    return func.plainto_tsquery("russian", q)
+
+
+def apply_sorting(query, sort_by: str, source=None, q: Optional[str] = None):
     """Apply sorting to query."""
+    c = Ad if source is None else source.c
+    if sort_by == "relevance" and q and source is None:
+        return query.order_by(func.ts_rank(Ad.search_vector, search_query(q)).desc(), Ad.published_at.desc())
     if sort_by == "date":
-        return query.order_by(Ad.is_top.desc(), Ad.is_featured.desc(), Ad.published_at.desc())
+        return query.order_by(c.is_top.desc(), c.is_featured.desc(), c.published_at.desc(), c.id.desc())
     elif sort_by == "price_asc":
-        return query.order_by(Ad.is_top.desc(), Ad.price.asc())
+        return query.order_by(c.is_top.desc(), c.price.asc())
     elif sort_by == "price_desc":
-        return query.order_by(Ad.is_top.desc(), Ad.price.desc())
+        return query.order_by(c.is_top.desc(), c.price.desc())
     elif sort_by == "mileage":
-        return query.order_by(Ad.is_top.desc(), Ad.mileage.asc())
+        return query.order_by(c.is_top.desc(), c.mileage.asc())
     elif sort_by == "year":
-        return query.order_by(Ad.is_top.desc(), Ad.year.desc())
-    return query.order_by(Ad.published_at.desc())
+        return query.order_by(c.is_top.desc(), c.year.desc())
+    return query.order_by(c.published_at.desc())
+
+
+def list_totals(source=None) -> tuple:
+    """count, latest updated_at and total views of the matching ads (for total and the ETag)."""
+    c = Ad if source is None else source.c
+    return func.count(), func.max(c.updated_at), func.sum(c.views_count)
+
+
+def encode_cursor(row) -> Optional[str]:
+    """Keyset cursor pointing after ``row`` in the "date" sort order."""
+    if row.published_at is None:
+        return None
+    key = [row.is_top, row.is_featured, row.published_at.isoformat(), row.id]
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode()
+
+
+def after_cursor(cursor: str, source=None):
+    """WHERE clause selecting the rows that follow ``cursor`` in the "date" sort order."""
+    c = Ad if source is None else source.c
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor))
+        # Exactly what encode_cursor writes; anything else would reach the
+        # database as a mistyped bind
+        if not (
+            isinstance(key, list)
+            and len(key) == 4
+            and type(key[0]) is bool
+            and type(key[1]) is bool
+            and isinstance(key[2], str)
+            and type(key[3]) is int
+            and 0 < key[3] < 2**31
+        ):
+            raise ValueError("malformed cursor")
+        is_top, is_featured, published_at, ad_id = key
+        published_at = datetime.fromisoformat(published_at)
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid cursor", {"cursor": cursor})
+    # Every key is sorted DESC, so "after" is a plain row comparison
+    return tuple_(c.is_top, c.is_featured, c.published_at, c.id) < tuple_(
+        is_top, is_featured, published_at, ad_id
+    )
 
 
 # ============ Public Endpoints ============
 
 @router.get("/", response_model=PaginatedResponse[AdListResponse])
 async def list_ads(
-    params: AdSearchParams = Depends(),
+    request: Request,
+    params: Annotated[AdSearchParams, Query()],
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),  # Optional - public endpoint
 ):
     """
     Search and list ads with filters.
+
+    Pages come with their total from ``count(*) OVER ()`` in the same
+    query. With ``cursor`` (sort_by=date only) the page is found by keyset
+    instead of OFFSET, and the total needs one separate aggregate.
+
+    The ETag covers the matching set (count, latest update, total views),
+    so a conditional GET is answered with 304 before anything is serialized.
     """
-    # Build query
-    query = build_search_query(params)
-    query = apply_sorting(query, params.sort_by)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply pagination
-    offset = (params.page - 1) * params.page_size
-    query = query.offset(offset).limit(params.page_size)
-
-    # Load with relations for list view
-    query = query.options(
-        selectinload(Ad.brand),
-        selectinload(Ad.model),
-        selectinload(Ad.generation),
-        selectinload(Ad.transmission),
-        selectinload(Ad.fuel_type),
-        selectinload(Ad.city).selectinload(City.region),
-        selectinload(Ad.images),
-    )
+    if params.cursor and params.sort_by != "date":
+        raise ValidationError("cursor is only supported with sort_by=date", {"cursor": params.cursor})
+
+    # Serve from the pre-joined view when every filter is available there
+    if settings.AD_LIST_MV_ENABLED and list_view_supports(params):
+        source = ad_list_mv
+        count_query = select(*list_totals(source)).select_from(ad_list_mv)
+        query = ad_list_view_query()
+    else:
+        source = None
+        count_query = select(*list_totals())
+        query = ad_list_query()
+
+    query = build_search_query(params, query, source)
+    query = apply_sorting(query, params.sort_by, source, params.q)
+    if params.cursor:
+        query = query.where(after_cursor(params.cursor, source)).limit(params.page_size)
+    else:
+        query = query.add_columns(
+            *(column.over().label(f"list_{i}") for i, column in enumerate(list_totals(source)))
+        )
+        query = query.offset((params.page - 1) * params.page_size).limit(params.page_size)
 
     result = await db.execute(query)
-    ads = result.scalars().all()
-
-    # Get user's favorites for marking
-    user_favorites = set()
-    if current_user:
+    rows = result.all()
+
+    if rows and not params.cursor:
+        total, last_updated, views_total = rows[0][-3:]
+    else:
+        # Keyset pages (and pages past the end) don't see the whole set
+        total_result = await db.execute(build_search_query(params, count_query, source))
+        total, last_updated, views_total = total_result.one()
+
+    etag = list_etag(params, total, last_updated, views_total, current_user)
+    headers = cache_headers(etag, current_user)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Get user's favorites among this page for marking
+    user_favorites = frozenset()
+    if current_user and rows:
         fav_result = await db.execute(
-            select(Favorite.ad_id).where(Favorite.user_id == current_user.id)
+            select(Favorite.ad_id).where(
+                Favorite.user_id == current_user.id,
+                id_in(Favorite.ad_id, [row.id for row in rows]),
+            )
         )
-        user_favorites = set(fav_result.scalars().all())
-
-    # Build response
-    items = []
-    for ad in ads:
-        main_image = ad.images[0].url if ad.images else None
-        items.append(AdListResponse(
-            id=ad.id,
-            status=ad.status,
-            user_id=ad.user_id,
-            title=ad.title,
-            price=ad.price,
-            currency=ad.currency,
-            year=ad.year,
-            mileage=ad.mileage,
-            main_image_url=main_image,
-            brand_name=ad.brand.name,
-            model_name=ad.model.name,
-            generation_name=ad.generation.name if ad.generation else None,
-            engine_volume=ad.engine_volume,
-            engine_power=ad.engine_power,
-            transmission_name=ad.transmission.name if ad.transmission else None,
-            fuel_type_name=ad.fuel_type.name if ad.fuel_type else None,
-            city_name=ad.city.name,
-            region_name=ad.city.region.name,
-            published_at=ad.published_at,
-            created_at=ad.created_at,
-            views_count=ad.views_count,
-            is_featured=ad.is_featured,
-            is_top=ad.is_top,
-            is_urgent=ad.is_urgent,
-            is_favorite=ad.id in user_favorites,
-        ))
-
-    return PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=params.page,
-        page_size=params.page_size,
-    )
+        user_favorites = frozenset(fav_result.scalars().all())
+
+    items = build_list_items(rows, user_favorites)
+
+    next_cursor = None
+    if params.sort_by == "date" and len(rows) == params.page_size:
+        next_cursor = encode_cursor(rows[-1])
+
+    page = ad_list_page(items, total, params.page, params.page_size, next_cursor)
+    page.headers.update(headers)
+    return page
 
 
 @router.get("/{ad_id}", response_model=AdResponse)
 async def get_ad(
     ad_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),  # Optional - public endpoint
 ):
     """
     Get ad by ID with full details.
+
+    The full response is cached per version of the ad and the rows it
+    embeds (see ``ad_cache``); only the counters and user-specific flags
+    are read fresh on every request.
     """
-    ad = await get_ad_with_relations(db, ad_id)
+    result = await db.execute(ad_response_version_query(ad_id))
+    ad = result.first()
     if not ad:
         raise NotFoundError("Ad not found", "ad", ad_id)
 
@@ -304,15 +515,14 @@ async def get_ad(
         if not current_user or (current_user.id != ad.user_id and not current_user.is_moderator):
             raise NotFoundError("Ad not found", "ad", ad_id)
 
-    # Increment view count
-    ad.views_count += 1
+    # Count the view in Redis; ads.views_count is updated in batches
+    pending_views = await ad_view_service.record_view(ad_id)
 
     # Track view history for logged-in users
     if current_user and current_user.id != ad.user_id:
         view = ViewHistory(user_id=current_user.id, ad_id=ad_id)
         db.add(view)
-
-    await db.commit()
+        await db.commit()
 
     # Check if favorited/compared
     is_favorite = False
@@ -334,11 +544,31 @@ async def get_ad(
         )
         is_in_comparison = comp_result.scalar_one_or_none() is not None
 
-    response = AdResponse.model_validate(ad)
-    response.is_favorite = is_favorite
-    response.is_in_comparison = is_in_comparison
-
-    return response
+    # The view counter moves on every request and is left out of the ETag
+    cache_key = ad_cache_key(ad_id, ad.version_at)
+    version = int(ad.version_at.timestamp() * 1_000_000)
+    etag = f'W/"{ad_id}-{version}-{ad.favorites_count}-{int(is_favorite)}{int(is_in_comparison)}"'
+    headers = cache_headers(etag, current_user)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+    ad_response = await ad_cache.get(cache_key)
+    if ad_response is None:
+        full_ad = await get_ad_with_relations(db, ad_id)
+        if not full_ad:
+            raise NotFoundError("Ad not found", "ad", ad_id)
+        ad_response = AdResponse.model_validate(full_ad)
+        await ad_cache.set(cache_key, ad_response)
+
+    return ad_response.model_copy(
+        update={
+            "views_count": ad.views_count + pending_views,
+            "favorites_count": ad.favorites_count,
+            "is_favorite": is_favorite,
+            "is_in_comparison": is_in_comparison,
+        }
+    )
 
 
 # ============ Authenticated Endpoints ============
@@ -356,7 +586,7 @@ async def create_ad(
     # Parse features if provided
     features_json = None
     if ad_data.features:
-        features_json = json.dumps(ad_data.features)
+        features_json = orjson.dumps(ad_data.features).decode()
 
     # Create ad
     ad = Ad(
@@ -397,31 +627,35 @@ async def create_ad(
         latitude=ad_data.latitude,
         longitude=ad_data.longitude,
         features=features_json,
+        features_mask=features_mask(ad_data.features),
     )
     db.add(ad)
     await db.flush()
 
-    # Add images
-    for i, img_data in enumerate(ad_data.images):
-        image = AdImage(
-            ad_id=ad.id,
-            url=img_data.url,
-            thumbnail_url=img_data.thumbnail_url,
-            sort_order=img_data.sort_order or i,
-            is_main=img_data.is_main or (i == 0),
-        )
-        db.add(image)
-
-    # Add videos
-    for i, vid_data in enumerate(ad_data.videos):
-        video = AdVideo(
-            ad_id=ad.id,
-            url=vid_data.url,
-            video_type=vid_data.video_type,
-            thumbnail_url=vid_data.thumbnail_url,
-            sort_order=i,
-        )
-        db.add(video)
+    # Add images and videos: one multi-row INSERT each
+    if ad_data.images:
+        await db.execute(insert(AdImage), [
+            {
+                "ad_id": ad.id,
+                "url": img_data.url,
+                "thumbnail_url": img_data.thumbnail_url,
+                "sort_order": img_data.sort_order or i,
+                "is_main": img_data.is_main or (i == 0),
+            }
+            for i, img_data in enumerate(ad_data.images)
+        ])
+
+    if ad_data.videos:
+        await db.execute(insert(AdVideo), [
+            {
+                "ad_id": ad.id,
+                "url": vid_data.url,
+                "video_type": vid_data.video_type,
+                "thumbnail_url": vid_data.thumbnail_url,
+                "sort_order": i,
+            }
+            for i, vid_data in enumerate(ad_data.videos)
+        ])
 
     await db.commit()
 
@@ -452,8 +686,9 @@ async def update_ad(
 
     # Handle features
     if "features" in update_dict:
+        update_dict["features_mask"] = features_mask(update_dict["features"])
         if update_dict["features"]:
-            update_dict["features"] = json.dumps(update_dict["features"])
+            update_dict["features"] = orjson.dumps(update_dict["features"]).decode()
         else:
             update_dict["features"] = None
 
@@ -573,7 +808,6 @@ async def republish_ad(
 
     ad.status = AdStatus.PENDING  # Back to moderation
     await db.commit()
-    await db.refresh(ad)
 
     return AdResponse.model_validate(ad)
 
@@ -599,45 +833,49 @@ async def get_ad_stats(
     if ad.user_id != current_user.id and not current_user.is_admin:
         raise AuthorizationError("You can only view stats for your own ads")
 
-    # Calculate period-based views
-    now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start = today_start - timedelta(days=7)
-    month_start = today_start - timedelta(days=30)
-
-    # Count views per period
-    views_today_result = await db.execute(
-        select(func.count(ViewHistory.id)).where(
-            ViewHistory.ad_id == ad_id,
-            ViewHistory.viewed_at >= today_start,
+    # Views per day are counted in Redis
+    period_views = await ad_view_service.get_period_views(ad_id)
+    if period_views is None:
+        # Fall back to logged-in view history
+        now = datetime.now(timezone.utc)
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today_start - timedelta(days=7)
+        month_start = today_start - timedelta(days=30)
+
+        # Count views per period
+        views_today_result = await db.execute(
+            select(func.count(ViewHistory.id)).where(
+                ViewHistory.ad_id == ad_id,
+                ViewHistory.viewed_at >= today_start,
+            )
         )
-    )
-    views_today = views_today_result.scalar() or 0
+        views_today = views_today_result.scalar() or 0
 
-    views_week_result = await db.execute(
-        select(func.count(ViewHistory.id)).where(
-            ViewHistory.ad_id == ad_id,
-            ViewHistory.viewed_at >= week_start,
+        views_week_result = await db.execute(
+            select(func.count(ViewHistory.id)).where(
+                ViewHistory.ad_id == ad_id,
+                ViewHistory.viewed_at >= week_start,
+            )
         )
-    )
-    views_week = views_week_result.scalar() or 0
+        views_week = views_week_result.scalar() or 0
 
-    views_month_result = await db.execute(
-        select(func.count(ViewHistory.id)).where(
-            ViewHistory.ad_id == ad_id,
-            ViewHistory.viewed_at >= month_start,
+        views_month_result = await db.execute(
+            select(func.count(ViewHistory.id)).where(
+                ViewHistory.ad_id == ad_id,
+                ViewHistory.viewed_at >= month_start,
+            )
         )
-    )
-    views_month = views_month_result.scalar() or 0
+        views_month = views_month_result.scalar() or 0
+        period_views = {"today": views_today, "week": views_week, "month": views_month}
 
     return AdStats(
-        views_count=ad.views_count,
+        views_count=ad.views_count + await ad_view_service.get_pending_views(ad_id),
         favorites_count=ad.favorites_count,
         messages_count=ad.messages_count,
         phone_views_count=ad.phone_views_count,
-        views_today=views_today,
-        views_week=views_week,
-        views_month=views_month,
+        views_today=period_views["today"],
+        views_week=period_views["week"],
+        views_month=period_views["month"],
     )
 
 
@@ -654,70 +892,23 @@ async def get_my_ads(
     """
     Get current user's ads.
     """
-    query = select(Ad).where(
+    conditions = [
         Ad.user_id == current_user.id,
         Ad.deleted_at.is_(None),
-    )
-
+    ]
     if status_filter:
-        query = query.where(Ad.status == status_filter)
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Paginate
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Ad.created_at.desc())
-
-    query = query.options(
-        selectinload(Ad.brand),
-        selectinload(Ad.model),
-        selectinload(Ad.city).selectinload(City.region),
-        selectinload(Ad.images),
+        conditions.append(Ad.status == status_filter)
+
+    rows, total = await fetch_page(
+        db,
+        ad_list_query().where(*conditions).order_by(Ad.created_at.desc()),
+        select(func.count(Ad.id)).where(*conditions),
+        page,
+        page_size,
     )
+    items = build_list_items(rows)
 
-    result = await db.execute(query)
-    ads = result.scalars().all()
-
-    items = []
-    for ad in ads:
-        main_image = ad.images[0].url if ad.images else None
-        items.append(AdListResponse(
-            id=ad.id,
-            status=ad.status,
-            user_id=ad.user_id,
-            title=ad.title,
-            price=ad.price,
-            currency=ad.currency,
-            year=ad.year,
-            mileage=ad.mileage,
-            main_image_url=main_image,
-            brand_name=ad.brand.name,
-            model_name=ad.model.name,
-            generation_name=ad.generation.name if ad.generation else None,
-            engine_volume=ad.engine_volume,
-            engine_power=ad.engine_power,
-            transmission_name=ad.transmission.name if ad.transmission else None,
-            fuel_type_name=ad.fuel_type.name if ad.fuel_type else None,
-            city_name=ad.city.name,
-            region_name=ad.city.region.name,
-            published_at=ad.published_at,
-            created_at=ad.created_at,
-            views_count=ad.views_count,
-            is_featured=ad.is_featured,
-            is_top=ad.is_top,
-            is_urgent=ad.is_urgent,
-            is_favorite=False,
-        ))
-
-    return PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return ad_list_page(items, total, page, page_size)
 
 
 # ============ Moderation ============
@@ -732,67 +923,21 @@ async def get_pending_ads(
     """
     Get ads pending moderation (moderator only).
     """
-    query = select(Ad).where(
+    conditions = [
         Ad.status == AdStatus.PENDING,
         Ad.deleted_at.is_(None),
-    ).order_by(Ad.created_at.asc())
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Paginate
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
-
-    query = query.options(
-        selectinload(Ad.brand),
-        selectinload(Ad.model),
-        selectinload(Ad.city).selectinload(City.region),
-        selectinload(Ad.images),
+    ]
+
+    rows, total = await fetch_page(
+        db,
+        ad_list_query().where(*conditions).order_by(Ad.created_at.asc()),
+        select(func.count(Ad.id)).where(*conditions),
+        page,
+        page_size,
     )
+    items = build_list_items(rows)
 
-    result = await db.execute(query)
-    ads = result.scalars().all()
-
-    items = []
-    for ad in ads:
-        main_image = ad.images[0].url if ad.images else None
-        items.append(AdListResponse(
-            id=ad.id,
-            status=ad.status,
-            user_id=ad.user_id,
-            title=ad.title,
-            price=ad.price,
-            currency=ad.currency,
-            year=ad.year,
-            mileage=ad.mileage,
-            main_image_url=main_image,
-            brand_name=ad.brand.name,
-            model_name=ad.model.name,
-            generation_name=ad.generation.name if ad.generation else None,
-            engine_volume=ad.engine_volume,
-            engine_power=ad.engine_power,
-            transmission_name=None,
-            fuel_type_name=None,
-            city_name=ad.city.name,
-            region_name=ad.city.region.name,
-            published_at=ad.published_at,
-            created_at=ad.created_at,
-            views_count=ad.views_count,
-            is_featured=ad.is_featured,
-            is_top=ad.is_top,
-            is_urgent=ad.is_urgent,
-            is_favorite=False,
-        ))
-
-    return PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return ad_list_page(items, total, page, page_size)
 
 
 @router.post("/{ad_id}/moderate", response_model=AdResponse)
@@ -828,7 +973,6 @@ async def moderate_ad(
     ad.moderated_by = moderator.id
 
     await db.commit()
-    await db.refresh(ad)
 
     return AdResponse.model_validate(ad)
 
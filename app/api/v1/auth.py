@@ -306,22 +306,12 @@ async def logout_all(
     """
     Logout all sessions for current user.
     """
-    result = await db.execute(
-        select(UserSession).where(
-            UserSession.user_id == current_user.id,
-            UserSession.revoked == False,
-        )
-    )
-    sessions = result.scalars().all()
-
-    for session in sessions:
-        session.revoke()
-
+    revoked_count = await UserSession.revoke_many(db, current_user.id)
     await db.commit()
 
     clear_auth_cookies(response)
 
-    return MessageOut(message=f"Logged out from {len(sessions)} sessions")
+    return MessageOut(message=f"Logged out from {revoked_count} sessions")
 
 
 @router.post("/verify-email", response_model=MessageOut)
@@ -460,15 +450,7 @@ async def confirm_password_reset(
         reset.used = True
 
     # Revoke all sessions for security
-    result = await db.execute(
-        select(UserSession).where(
-            UserSession.user_id == user.id,
-            UserSession.revoked == False,
-        )
-    )
-    sessions = result.scalars().all()
-    for session in sessions:
-        session.revoke()
+    await UserSession.revoke_many(db, user.id)
 
     await db.commit()
 
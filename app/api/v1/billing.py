@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.exceptions import NotFoundError, ValidationError, ConflictError
 from app.models.billing import (
@@ -31,6 +32,7 @@ from app.schemas.billing import (
 )
 from app.schemas.common import PaginatedResponse, MessageOut
 from app.api.deps import get_current_user, require_admin
+from app.api.responses import list_response, model_response
 from app.services.payment_service import payment_service
 
 
@@ -51,7 +53,7 @@ async def list_tariffs(
         feature_type: Filter by feature type (featured, top, urgent)
     """
     tariffs = await payment_service.get_active_tariffs(db, feature_type)
-    return [TariffResponse.model_validate(t) for t in tariffs]
+    return list_response(TariffResponse, tariffs)
 
 
 @router.get("/tariffs/{tariff_id}", response_model=TariffResponse)
@@ -65,7 +67,7 @@ async def get_tariff(
     if not tariff:
         raise NotFoundError("Tariff not found", "tariff", tariff_id)
     
-    return TariffResponse.model_validate(tariff)
+    return tariff
 
 
 @router.post("/tariffs", response_model=TariffResponse, status_code=status.HTTP_201_CREATED)
@@ -140,7 +142,7 @@ async def create_payment(
         )
         await db.commit()
     
-    return PaymentResponse.model_validate(payment)
+    return PaymentResponse.from_orm_fast(payment)
 
 
 @router.get("/payments", response_model=PaginatedResponse[PaymentResponse])
@@ -167,14 +169,9 @@ async def list_user_payments(
     result = await db.execute(query.offset(offset).limit(page_size))
     payments = result.scalars().all()
     
-    items = [PaymentResponse.model_validate(p) for p in payments]
-    
-    return PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return model_response(PaginatedResponse.from_orm_rows(
+        PaymentResponse, payments, total, page, page_size, trusted=True
+    ))
 
 
 @router.get("/payments/{payment_id}", response_model=PaymentResponse)
@@ -195,7 +192,7 @@ async def get_payment(
     if not payment:
         raise NotFoundError("Payment not found", "payment", payment_id)
     
-    return PaymentResponse.model_validate(payment)
+    return PaymentResponse.from_orm_fast(payment)
 
 
 @router.post("/payments/{payment_id}/confirm", response_model=PaymentResponse)
@@ -233,7 +230,7 @@ async def confirm_payment(
         raise ValidationError("Failed to confirm payment")
     
     await db.refresh(payment)
-    return PaymentResponse.model_validate(payment)
+    return PaymentResponse.from_orm_fast(payment)
 
 
 @router.post("/payments/{payment_id}/refund", response_model=MessageOut)
@@ -305,7 +302,7 @@ async def get_ad_boosts(
     
     boosts = await payment_service.get_active_boosts_for_ad(db, ad_id)
     
-    return [AdBoostResponse.model_validate(b) for b in boosts]
+    return list_response(AdBoostResponse, [AdBoostResponse.from_orm_fast(b) for b in boosts])
 
 
 # ============ Admin Endpoints ============
@@ -343,14 +340,9 @@ async def list_all_payments(
     )
     payments = result.scalars().all()
     
-    items = [PaymentResponse.model_validate(p) for p in payments]
-    
-    return PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return model_response(PaginatedResponse.from_orm_rows(
+        PaymentResponse, payments, total, page, page_size, trusted=True
+    ))
 
 
 @router.post("/admin/expire-boosts", response_model=MessageOut)
@@ -405,4 +397,4 @@ async def confirm_payment_test(
         raise ValidationError("Failed to confirm payment")
     
     await db.refresh(payment)
-    return PaymentResponse.model_validate(payment)
\ No newline at end of file
+    return PaymentResponse.from_orm_fast(payment)
\ No newline at end of file
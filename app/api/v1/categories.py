@@ -16,31 +16,16 @@ from app.schemas.category import (
     CategoryResponse,
     CategoryCreate,
     CategoryUpdate,
-    CategoryWithChildren,
     CategoryTree,
 )
 from app.schemas.common import MessageOut
 from app.api.deps import get_current_user, require_admin
+from app.api.responses import list_response, model_response
 
 
 router = APIRouter()
 
 
-async def build_category_tree(
-    categories: List[Category],
-    parent_id: int = None,
-) -> List[CategoryWithChildren]:
-    """Build nested category tree."""
-    result = []
-    for cat in categories:
-        if cat.parent_id == parent_id:
-            children = await build_category_tree(categories, cat.id)
-            cat_response = CategoryWithChildren.model_validate(cat)
-            cat_response.children = children
-            result.append(cat_response)
-    return result
-
-
 @router.get("/", response_model=List[CategoryResponse])
 async def list_categories(
     parent_id: int = None,
@@ -69,7 +54,7 @@ async def list_categories(
     result = await db.execute(query)
     categories = result.scalars().all()
 
-    return [CategoryResponse.model_validate(c) for c in categories]
+    return list_response(CategoryResponse, [CategoryResponse.from_orm_fast(c) for c in categories])
 
 
 @router.get("/tree", response_model=CategoryTree)
@@ -87,9 +72,7 @@ async def get_category_tree(
     )
     categories = result.scalars().all()
 
-    tree = await build_category_tree(list(categories))
-
-    return CategoryTree(categories=tree)
+    return model_response(CategoryTree.build(categories))
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
@@ -108,7 +91,7 @@ async def get_category(
     if not category:
         raise NotFoundError("Category not found", "category", category_id)
 
-    return CategoryResponse.model_validate(category)
+    return CategoryResponse.from_orm_fast(category)
 
 
 @router.get("/slug/{slug}", response_model=CategoryResponse)
@@ -127,7 +110,7 @@ async def get_category_by_slug(
     if not category:
         raise NotFoundError("Category not found", "category", slug)
 
-    return CategoryResponse.model_validate(category)
+    return CategoryResponse.from_orm_fast(category)
 
 
 # Admin endpoints
@@ -168,7 +151,7 @@ async def create_category(
     await db.commit()
     await db.refresh(category)
 
-    return CategoryResponse.model_validate(category)
+    return CategoryResponse.from_orm_fast(category)
 
 
 @router.patch("/{category_id}", response_model=CategoryResponse)
@@ -221,7 +204,7 @@ async def update_category(
     await db.commit()
     await db.refresh(category)
 
-    return CategoryResponse.model_validate(category)
+    return CategoryResponse.from_orm_fast(category)
 
 
 @router.delete("/{category_id}", response_model=MessageOut)
@@ -9,7 +9,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import select, func, or_, and_, case
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
@@ -29,6 +29,7 @@ from app.schemas.chat import (
 from app.schemas.user import UserResponse
 from app.schemas.common import PaginatedResponse, MessageOut
 from app.api.deps import get_current_user
+from app.api.responses import json_response, model_response
 
 
 router = APIRouter()
@@ -105,7 +106,6 @@ async def list_dialogs(
     total = total_result.scalar() or 0
 
     # Count total unread
-    from sqlalchemy import case
     unread_query = select(func.sum(
         case(
             (Dialog.seller_id == current_user.id, Dialog.seller_unread_count),
@@ -139,27 +139,28 @@ async def list_dialogs(
         if dialog.ad.images:
             main_image = dialog.ad.images[0].url if hasattr(dialog.ad, 'images') else None
 
-        dialog_responses.append(DialogResponse(
-            id=dialog.id,
-            ad_id=dialog.ad_id,
-            ad_title=dialog.ad.title,
-            ad_main_image=main_image,
-            ad_price=f"{dialog.ad.price} {dialog.ad.currency.value}",
-            seller_id=dialog.seller_id,
-            buyer_id=dialog.buyer_id,
-            other_user=UserResponse.model_validate(other_user),
-            last_message_text=dialog.last_message_text,
-            last_message_at=dialog.last_message_at,
-            unread_count=unread_count,
-            is_blocked=dialog.is_blocked(),
-            created_at=dialog.created_at,
-        ))
-
-    return DialogListResponse(
-        dialogs=dialog_responses,
-        total=total,
-        unread_total=unread_total,
-    )
+        # Shaped like DialogResponse, which documents this route
+        dialog_responses.append({
+            "id": dialog.id,
+            "ad_id": dialog.ad_id,
+            "ad_title": dialog.ad.title,
+            "ad_main_image": main_image,
+            "ad_price": f"{dialog.ad.price} {dialog.ad.currency.value}",
+            "seller_id": dialog.seller_id,
+            "buyer_id": dialog.buyer_id,
+            "other_user": UserResponse.orm_dict(other_user),
+            "last_message_text": dialog.last_message_text,
+            "last_message_at": dialog.last_message_at,
+            "unread_count": unread_count,
+            "is_blocked": dialog.is_blocked(),
+            "created_at": dialog.created_at,
+        })
+
+    return json_response({
+        "dialogs": dialog_responses,
+        "total": total,
+        "unread_total": unread_total,
+    })
 
 
 @router.post("/dialogs", response_model=DialogResponse, status_code=status.HTTP_201_CREATED)
@@ -207,7 +208,7 @@ async def create_dialog(
         ad_price=f"{dialog.ad.price} {dialog.ad.currency.value}",
         seller_id=dialog.seller_id,
         buyer_id=dialog.buyer_id,
-        other_user=UserResponse.model_validate(other_user),
+        other_user=UserResponse.from_orm_fast(other_user),
         last_message_text=dialog.last_message_text,
         last_message_at=dialog.last_message_at,
         unread_count=unread_count,
@@ -263,7 +264,7 @@ async def get_dialog(
             id=m.id,
             dialog_id=m.dialog_id,
             sender_id=m.sender_id,
-            sender=UserResponse.model_validate(m.sender),
+            sender=UserResponse.from_orm_fast(m.sender),
             text=m.text,
             attachments=None,
             is_read=m.is_read,
@@ -289,7 +290,7 @@ async def get_dialog(
         ad_price=f"{dialog.ad.price} {dialog.ad.currency.value}",
         seller_id=dialog.seller_id,
         buyer_id=dialog.buyer_id,
-        other_user=UserResponse.model_validate(other_user),
+        other_user=UserResponse.from_orm_fast(other_user),
         last_message_text=dialog.last_message_text,
         last_message_at=dialog.last_message_at,
         unread_count=0,
@@ -387,7 +388,7 @@ async def send_message(
         id=message.id,
         dialog_id=message.dialog_id,
         sender_id=message.sender_id,
-        sender=UserResponse.model_validate(message.sender),
+        sender=UserResponse.from_orm_fast(message.sender),
         text=message.text,
         attachments=None,
         is_read=message.is_read,
@@ -447,7 +448,7 @@ async def get_messages(
             id=m.id,
             dialog_id=m.dialog_id,
             sender_id=m.sender_id,
-            sender=UserResponse.model_validate(m.sender),
+            sender=UserResponse.from_orm_fast(m.sender),
             text=m.text,
             attachments=None,
             is_read=m.is_read,
@@ -575,7 +576,6 @@ async def get_unread_count(
     """
     Get total unread message count.
     """
-    from sqlalchemy import case
     result = await db.execute(
         select(func.sum(
             case(
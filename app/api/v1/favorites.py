@@ -18,6 +18,7 @@ from app.models.location import City, Region
 from app.schemas.ad import AdListResponse
 from app.schemas.common import PaginatedResponse, MessageOut
 from app.api.deps import get_current_user
+from app.api.responses import model_response
 
 
 router = APIRouter()
@@ -94,12 +95,7 @@ async def get_favorites(
             is_favorite=True,
         ))
 
-    return PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return model_response(PaginatedResponse.create_unvalidated(items, total, page, page_size))
 
 
 @router.post("/{ad_id}", response_model=MessageOut, status_code=status.HTTP_201_CREATED)
@@ -4,7 +4,6 @@ Geolocation, countries, regions, cities.
 """
 
 from typing import List, Optional
-from math import radians, cos, sin, asin, sqrt
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,7 +12,7 @@ from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.core.exceptions import NotFoundError
-from app.models.location import Country, Region, City
+from app.models.location import Country, Region, City, distance_km, within_radius
 from app.models.user import User
 from app.schemas.location import (
     CountryResponse,
@@ -34,20 +33,6 @@ from app.api.deps import require_admin
 router = APIRouter()
 
 
-def haversine(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
-    """
-    Calculate the great circle distance in kilometers between two points 
-    on the earth (specified in decimal degrees).
-    """
-    lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
-    r = 6371  # Radius of earth in kilometers
-    return c * r
-
-
 # ============ Countries ============
 
 @router.get("/countries", response_model=List[CountryResponse])
@@ -59,7 +44,7 @@ async def list_countries(
         select(Country).where(Country.is_active == True).order_by(Country.sort_order, Country.name)
     )
     countries = result.scalars().all()
-    return [CountryResponse.model_validate(c) for c in countries]
+    return CountryResponse.validate_list(countries)
 
 
 @router.get("/countries/{country_id}", response_model=CountryWithRegions)
@@ -130,7 +115,7 @@ async def list_regions(
         ).order_by(Region.sort_order, Region.name)
     )
     regions = result.scalars().all()
-    return [RegionResponse.model_validate(r) for r in regions]
+    return RegionResponse.validate_list(regions)
 
 
 @router.get("/regions/{region_id}", response_model=RegionWithCities)
@@ -199,7 +184,7 @@ async def list_cities(
 
     result = await db.execute(query)
     cities = result.scalars().all()
-    return [CityResponse.model_validate(c) for c in cities]
+    return CityResponse.validate_list(cities)
 
 
 @router.get("/cities/{city_id}", response_model=CityWithRegion)
@@ -291,30 +276,19 @@ async def get_nearby_cities(
 ):
     """
     Get cities within radius of coordinates.
-    Uses Haversine formula for distance calculation.
+    Distances are computed in the database (haversine), only for cities
+    inside the radius's bounding box.
     """
-    # Get all cities with coordinates
+    distance = distance_km(latitude, longitude, City.latitude, City.longitude)
     result = await db.execute(
-        select(City).options(
+        select(City, distance.label("distance")).options(
             selectinload(City.region).selectinload(Region.country)
         ).where(
-            City.latitude.isnot(None),
-            City.longitude.isnot(None),
             City.is_active == True,
-        )
+            *within_radius(latitude, longitude, radius_km),
+        ).order_by(distance).limit(limit)
     )
-    all_cities = result.scalars().all()
-
-    # Calculate distances and filter
-    nearby = []
-    for city in all_cities:
-        distance = haversine(longitude, latitude, city.longitude, city.latitude)
-        if distance <= radius_km:
-            nearby.append((city, distance))
-
-    # Sort by distance and limit
-    nearby.sort(key=lambda x: x[1])
-    nearby = nearby[:limit]
+    nearby = result.all()
 
     return [
         CityWithRegion(
@@ -9,6 +9,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.core.exceptions import NotFoundError, ValidationError
@@ -28,6 +29,8 @@ router = APIRouter()
 class ReportCreate:
     """Schema for creating a report."""
 
+    __slots__ = ("report_type", "target_id", "reason", "description")
+
     def __init__(
         self,
         report_type: ReportType,
@@ -44,6 +47,20 @@ class ReportCreate:
 class ReportResponse:
     """Schema for report response."""
 
+    __slots__ = (
+        "id",
+        "reporter_id",
+        "report_type",
+        "target_id",
+        "reason",
+        "description",
+        "status",
+        "resolved_by",
+        "resolved_at",
+        "resolution_note",
+        "created_at",
+    )
+
     def __init__(self, report: Report):
         self.id = report.id
         self.reporter_id = report.reporter_id
@@ -284,6 +301,12 @@ async def list_reports(
     offset = (page - 1) * page_size
     query = query.offset(offset).limit(page_size).order_by(Report.created_at.desc())
 
+    # Batch-load reporter/resolver names only (no password hashes, company data, ...)
+    query = query.options(
+        selectinload(Report.reporter).load_only(User.id, User.name),
+        selectinload(Report.resolver).load_only(User.id, User.name),
+    )
+
     result = await db.execute(query)
     reports = result.scalars().all()
 
@@ -292,11 +315,14 @@ async def list_reports(
             {
                 "id": r.id,
                 "reporter_id": r.reporter_id,
+                "reporter_name": r.reporter.name if r.reporter else None,
                 "report_type": r.report_type.value,
                 "target_id": r.target_id,
                 "reason": r.reason.value,
                 "description": r.description,
                 "status": r.status.value,
+                "resolved_by": r.resolved_by,
+                "resolver_name": r.resolver.name if r.resolver else None,
                 "created_at": r.created_at.isoformat(),
             }
             for r in reports
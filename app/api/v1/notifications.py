@@ -1,15 +1,16 @@
 """
 Notification endpoints: list, get, mark as read, preferences.
 """
-from datetime import datetime, timezone
-from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.exceptions import NotFoundError
 from app.api.deps import get_current_user
+from app.api.pagination import fetch_page
+from app.api.responses import json_response
 from app.models.notification import Notification, NotificationPreference
 from app.models.user import User
 from app.schemas.notification import (
@@ -18,12 +19,18 @@ from app.schemas.notification import (
     NotificationPreferenceUpdate,
     NotificationMarkRead,
 )
-from app.schemas.common import PaginatedResponse, MessageOut
+from app.schemas.common import PaginatedResponse, MessageOut, page_count
+from app.services.pref_cache import invalidate_prefs
 
 
 router = APIRouter()
 
 
+# The list is read straight from the columns NotificationResponse declares
+NOTIFICATION_FIELDS = tuple(NotificationResponse.model_fields)
+NOTIFICATION_COLUMNS = tuple(Notification.__table__.c[name] for name in NOTIFICATION_FIELDS)
+
+
 @router.get("/", response_model=PaginatedResponse[NotificationResponse])
 async def list_notifications(
     unread_only: bool = False,
@@ -32,72 +39,34 @@ async def list_notifications(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    query = select(Notification).where(
+    conditions = [
         Notification.user_id == current_user.id,
         Notification.is_archived == False,
-    )
+    ]
     if unread_only:
-        query = query.where(Notification.is_read == False)
-
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Notification.created_at.desc())
-    result = await db.execute(query)
-    notifications = result.scalars().all()
-
-    items = [NotificationResponse.model_validate(n) for n in notifications]
-
-    return PaginatedResponse.create(items=items, total=total, page=page, page_size=page_size)
-
-
-@router.get("/{notification_id}", response_model=NotificationResponse)
-async def get_notification(
-    notification_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    result = await db.execute(select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id))
-    notification = result.scalar_one_or_none()
-    if not notification:
-        from app.core.exceptions import NotFoundError
-
-        raise NotFoundError("Notification not found")
-    return NotificationResponse.model_validate(notification)
-
-
-@router.post("/mark-read", response_model=MessageOut)
-async def mark_read(
-    data: NotificationMarkRead,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    result = await db.execute(select(Notification).where(Notification.id.in_(data.message_ids), Notification.user_id == current_user.id))
-    notifications = result.scalars().all()
-    for n in notifications:
-        n.mark_as_read()
-    await db.commit()
-    return MessageOut(message=f"Marked {len(notifications)} messages as read")
-
+        conditions.append(Notification.is_read == False)
+
+    rows, total = await fetch_page(
+        db,
+        select(*NOTIFICATION_COLUMNS).where(*conditions).order_by(Notification.created_at.desc()),
+        select(func.count()).select_from(Notification).where(*conditions),
+        page,
+        page_size,
+    )
 
-@router.delete("/{notification_id}", response_model=MessageOut)
-async def delete_notification(
-    notification_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    result = await db.execute(select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id))
-    notification = result.scalar_one_or_none()
-    if not notification:
-        from app.core.exceptions import NotFoundError
+    # Plain rows from our own table: no ORM objects or pydantic models, just
+    # dicts for orjson (zip drops the trailing total_count column)
+    return json_response({
+        "items": [dict(zip(NOTIFICATION_FIELDS, row)) for row in rows],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "pages": page_count(total, page_size),
+        "next_cursor": None,
+    })
 
-        raise NotFoundError("Notification not found")
-    notification.archive()
-    await db.commit()
-    return MessageOut(message="Notification deleted")
 
+# Registered before /{notification_id} so "preferences" isn't parsed as an id
 
 @router.get("/preferences", response_model=NotificationPreferenceResponse)
 async def get_preferences(
@@ -109,9 +78,10 @@ async def get_preferences(
     if not prefs:
         prefs = NotificationPreference(user_id=current_user.id)
         db.add(prefs)
+        # The flush fills in the id and the column defaults, and the session
+        # doesn't expire on commit, so no refresh SELECT is needed
         await db.commit()
-        await db.refresh(prefs)
-    return NotificationPreferenceResponse.model_validate(prefs)
+    return NotificationPreferenceResponse.from_orm_fast(prefs)
 
 
 @router.patch("/preferences", response_model=NotificationPreferenceResponse)
@@ -126,323 +96,47 @@ async def update_preferences(
         prefs = NotificationPreference(user_id=current_user.id)
         db.add(prefs)
         await db.flush()
-    update_dict = update_data.model_dump(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(prefs, field, value)
-    await db.commit()
-    await db.refresh(prefs)
-    return NotificationPreferenceResponse.model_validate(prefs)
-"""Notification endpoints (list, get, mark read, preferences)."""
-from datetime import datetime, timezone, timedelta
-from typing import Optional
-
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.core.database import get_db
-from app.api.deps import get_current_user
-from app.models.notification import Notification, NotificationPreference
-from app.models.user import User
-from app.schemas.notification import (
-    NotificationResponse,
-    NotificationListResponse,
-    NotificationPreferenceResponse,
-    NotificationPreferenceUpdate,
-)
-from app.schemas.common import MessageOut, PaginatedResponse
-
-
-router = APIRouter()
-
-
-@router.get("/", response_model=PaginatedResponse[NotificationResponse])
-async def list_notifications(
-    unread_only: bool = False,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    query = select(Notification).where(
-        Notification.user_id == current_user.id,
-        Notification.is_archived == False,
-    )
-    if unread_only:
-        query = query.where(Notification.is_read == False)
-
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Notification.created_at.desc())
-
-    result = await db.execute(query)
-    notifications = result.scalars().all()
-
-    items = [NotificationResponse.model_validate(n) for n in notifications]
-
-    return PaginatedResponse.create(items=items, total=total, page=page, page_size=page_size)
-
-
-@router.get("/{notification_id}", response_model=NotificationResponse)
-async def get_notification(notification_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id))
-    notification = result.scalar_one_or_none()
-    if not notification:
-        from app.core.exceptions import NotFoundError
-
-        raise NotFoundError("Notification not found")
-    return NotificationResponse.model_validate(notification)
-
-
-@router.post("/read", response_model=MessageOut)
-async def mark_read(payload: dict, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    ids = payload.get("notification_ids", [])
-    if not ids:
-        return MessageOut(message="No notifications specified")
-
-    result = await db.execute(select(Notification).where(Notification.id.in_(ids), Notification.user_id == current_user.id))
-    notifications = result.scalars().all()
-    for n in notifications:
-        n.mark_as_read()
-    await db.commit()
-    return MessageOut(message=f"Marked {len(notifications)} notifications as read")
-
-
-@router.delete("/{notification_id}", response_model=MessageOut)
-async def delete_notification(notification_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id))
-    notification = result.scalar_one_or_none()
-    if not notification:
-        from app.core.exceptions import NotFoundError
-
-        raise NotFoundError("Notification not found")
-    notification.archive()
-    await db.commit()
-    return MessageOut(message="Notification archived")
-
-
-# Preferences
-@router.get("/preferences", response_model=NotificationPreferenceResponse)
-async def get_preferences(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(NotificationPreference).where(NotificationPreference.user_id == current_user.id))
-    prefs = result.scalar_one_or_none()
-    if not prefs:
-        prefs = NotificationPreference(user_id=current_user.id)
-        db.add(prefs)
-        await db.commit()
-        await db.refresh(prefs)
-    return NotificationPreferenceResponse.model_validate(prefs)
-
-
-@router.patch("/preferences", response_model=NotificationPreferenceResponse)
-async def update_preferences(update_data: NotificationPreferenceUpdate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(NotificationPreference).where(NotificationPreference.user_id == current_user.id))
-    prefs = result.scalar_one_or_none()
-    if not prefs:
-        prefs = NotificationPreference(user_id=current_user.id)
-        db.add(prefs)
-        await db.flush()
-
-    update_dict = update_data.model_dump(exclude_unset=True)
+    update_dict = update_data.model_dump_unset()
     for field, value in update_dict.items():
         setattr(prefs, field, value)
-
     await db.commit()
-    await db.refresh(prefs)
-    return NotificationPreferenceResponse.model_validate(prefs)
-"""Notification endpoints for users."""
-from typing import Optional
-from datetime import datetime, timezone
+    await invalidate_prefs(current_user.id)
+    return NotificationPreferenceResponse.from_orm_fast(prefs)
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
 
-from app.core.database import get_db
-from app.core.exceptions import NotFoundError
-from app.models.notification import Notification, NotificationPreference
-from app.models.user import User
-from app.schemas.notification import (
-    NotificationResponse,
-    NotificationListResponse,
-    NotificationPreferenceResponse,
-    NotificationPreferenceUpdate,
-)
-from app.schemas.common import PaginatedResponse, MessageOut
-from app.api.deps import get_current_user
-
-
-router = APIRouter()
-
-
-@router.get("/", response_model=PaginatedResponse[NotificationResponse])
-async def list_notifications(
-    unread_only: bool = False,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    query = select(Notification).where(
-        Notification.user_id == current_user.id,
-        Notification.is_archived == False,
-    )
-    if unread_only:
-        query = query.where(Notification.is_read == False)
-
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Notification.created_at.desc())
-    result = await db.execute(query)
-    notifications = result.scalars().all()
-    items = [NotificationResponse.model_validate(n) for n in notifications]
-
-    return PaginatedResponse.create(items=items, total=total, page=page, page_size=page_size)
-
-
-@router.get("/{notification_id}", response_model=NotificationResponse)
-async def get_notification(
-    notification_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    result = await db.execute(
-        select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id)
-    )
-    notification = result.scalar_one_or_none()
-    if not notification:
-        raise NotFoundError("Notification not found", "notification", notification_id)
-    return NotificationResponse.model_validate(notification)
-
-
-@router.post("/{notification_id}/read", response_model=MessageOut)
-async def mark_notification_read(
-    notification_id: int,
+@router.post("/mark-read", response_model=MessageOut)
+async def mark_read(
+    data: NotificationMarkRead,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     result = await db.execute(
-        select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id)
+        update(Notification)
+        .where(Notification.id.in_(data.message_ids), Notification.user_id == current_user.id)
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
     )
-    notification = result.scalar_one_or_none()
-    if not notification:
-        raise NotFoundError("Notification not found", "notification", notification_id)
-    notification.mark_as_read()
     await db.commit()
-    return MessageOut(message="Notification marked as read")
+    return MessageOut(message=f"Marked {result.rowcount} messages as read")
 
 
-@router.delete("/{notification_id}", response_model=MessageOut)
-async def delete_notification(
-    notification_id: int,
+@router.post("/mark-all-read", response_model=MessageOut)
+async def mark_all_read(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     result = await db.execute(
-        select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id)
+        update(Notification)
+        .where(
+            Notification.user_id == current_user.id,
+            Notification.is_read == False,
+            Notification.is_archived == False,
+        )
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
     )
-    notification = result.scalar_one_or_none()
-    if not notification:
-        raise NotFoundError("Notification not found", "notification", notification_id)
-    notification.archive()
-    await db.commit()
-    return MessageOut(message="Notification deleted")
-
-
-# Preferences
-@router.get("/preferences", response_model=NotificationPreferenceResponse)
-async def get_preferences(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(NotificationPreference).where(NotificationPreference.user_id == current_user.id))
-    preferences = result.scalar_one_or_none()
-    if not preferences:
-        preferences = NotificationPreference(user_id=current_user.id)
-        db.add(preferences)
-        await db.commit()
-        await db.refresh(preferences)
-    return NotificationPreferenceResponse.model_validate(preferences)
-
-
-@router.patch("/preferences", response_model=NotificationPreferenceResponse)
-async def update_preferences(
-    update_data: NotificationPreferenceUpdate,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    result = await db.execute(select(NotificationPreference).where(NotificationPreference.user_id == current_user.id))
-    preferences = result.scalar_one_or_none()
-    if not preferences:
-        preferences = NotificationPreference(user_id=current_user.id)
-        db.add(preferences)
-        await db.flush()
-
-    update_dict = update_data.model_dump(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(preferences, field, value)
-
     await db.commit()
-    await db.refresh(preferences)
-    return NotificationPreferenceResponse.model_validate(preferences)
-"""
-Notification endpoints: list, get, mark read, delete, preferences.
-"""
-from typing import Optional
-from datetime import datetime, timezone
-
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-
-from app.core.database import get_db
-from app.core.exceptions import NotFoundError
-from app.models.notification import Notification, NotificationPreference
-from app.models.user import User
-from app.schemas.notification import (
-    NotificationResponse,
-    NotificationListResponse,
-    NotificationPreferenceResponse,
-    NotificationPreferenceUpdate,
-    NotificationMarkRead,
-)
-from app.schemas.common import PaginatedResponse, MessageOut
-from app.api.deps import get_current_user
-
-
-router = APIRouter()
-
-
-@router.get("/", response_model=PaginatedResponse[NotificationResponse])
-async def list_notifications(
-    unread_only: bool = False,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    query = select(Notification).where(
-        Notification.user_id == current_user.id,
-        Notification.is_archived == False,
-    )
-    if unread_only:
-        query = query.where(Notification.is_read == False)
-
-    total_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(total_query)
-    total = total_result.scalar() or 0
-
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Notification.created_at.desc())
-    result = await db.execute(query)
-    notifications = result.scalars().all()
-
-    items = [NotificationResponse.model_validate(n) for n in notifications]
-
-    return PaginatedResponse.create(items=items, total=total, page=page, page_size=page_size)
+    return MessageOut(message=f"Marked {result.rowcount} messages as read")
 
 
 @router.get("/{notification_id}", response_model=NotificationResponse)
@@ -451,30 +145,11 @@ async def get_notification(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id)
-    )
+    result = await db.execute(select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id))
     notification = result.scalar_one_or_none()
     if not notification:
         raise NotFoundError("Notification not found", "notification", notification_id)
-    return NotificationResponse.model_validate(notification)
-
-
-@router.post("/mark-read", response_model=MessageOut)
-async def mark_read(
-    body: NotificationMarkRead,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    if not body.ids:
-        return MessageOut(message="No ids provided")
-
-    result = await db.execute(select(Notification).where(Notification.id.in_(body.ids), Notification.user_id == current_user.id))
-    notifications = result.scalars().all()
-    for n in notifications:
-        n.mark_as_read()
-    await db.commit()
-    return MessageOut(message=f"Marked {len(notifications)} notifications as read")
+    return NotificationResponse.from_orm_fast(notification)
 
 
 @router.delete("/{notification_id}", response_model=MessageOut)
@@ -483,165 +158,13 @@ async def delete_notification(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id))
-    notification = result.scalar_one_or_none()
-    if not notification:
-        raise NotFoundError("Notification not found", "notification", notification_id)
-    notification.archive()
-    await db.commit()
-    return MessageOut(message="Notification deleted")
-
-
-@router.get("/preferences", response_model=NotificationPreferenceResponse)
-async def get_preferences(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    result = await db.execute(select(NotificationPreference).where(NotificationPreference.user_id == current_user.id))
-    preferences = result.scalar_one_or_none()
-    if not preferences:
-        preferences = NotificationPreference(user_id=current_user.id)
-        db.add(preferences)
-        await db.commit()
-        await db.refresh(preferences)
-    return NotificationPreferenceResponse.model_validate(preferences)
-
-
-@router.patch("/preferences", response_model=NotificationPreferenceResponse)
-async def update_preferences(
-    update_data: NotificationPreferenceUpdate,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    result = await db.execute(select(NotificationPreference).where(NotificationPreference.user_id == current_user.id))
-    preferences = result.scalar_one_or_none()
-    if not preferences:
-        preferences = NotificationPreference(user_id=current_user.id)
-        db.add(preferences)
-        await db.flush()
-
-    update_dict = update_data.model_dump(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(preferences, field, value)
-
-    await db.commit()
-    await db.refresh(preferences)
-    return NotificationPreferenceResponse.model_validate(preferences)
-"""Notification endpoints for AVTO LAIF."""
-from datetime import datetime, timezone
-from typing import Optional
-
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-
-from app.core.database import get_db
-from app.core.exceptions import NotFoundError
-from app.models.notification import Notification, NotificationPreference
-from app.models.user import User
-from app.schemas.notification import (
-    NotificationResponse,
-    NotificationListResponse,
-    NotificationPreferenceResponse,
-    NotificationPreferenceUpdate,
-    NotificationMarkRead,
-)
-from app.schemas.common import PaginatedResponse, MessageOut
-from app.api.deps import get_current_user
-
-
-router = APIRouter()
-
-
-@router.get("/", response_model=PaginatedResponse[NotificationResponse])
-async def list_notifications(
-    unread_only: bool = False,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    query = select(Notification).where(
-        Notification.user_id == current_user.id,
-        Notification.is_archived == False,
+    result = await db.execute(
+        update(Notification)
+        .where(Notification.id == notification_id, Notification.user_id == current_user.id)
+        .values(is_archived=True)
+        .execution_options(synchronize_session=False)
     )
-
-    if unread_only:
-        query = query.where(Notification.is_read == False)
-
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Notification.created_at.desc())
-
-    result = await db.execute(query)
-    notifications = result.scalars().all()
-    items = [NotificationResponse.model_validate(n) for n in notifications]
-
-    return PaginatedResponse.create(items=items, total=total, page=page, page_size=page_size)
-
-
-@router.get("/{notification_id}", response_model=NotificationResponse)
-async def get_notification(notification_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id))
-    notification = result.scalar_one_or_none()
-    if not notification:
-        raise NotFoundError("Notification not found")
-    return NotificationResponse.model_validate(notification)
-
-
-@router.post("/mark-read", response_model=MessageOut)
-async def mark_read(data: NotificationMarkRead, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    if not data.message_ids:
-        return MessageOut(message="No message ids provided")
-
-    result = await db.execute(select(Notification).where(Notification.id.in_(data.message_ids), Notification.user_id == current_user.id))
-    notifications = result.scalars().all()
-    for n in notifications:
-        n.mark_as_read()
-    await db.commit()
-    return MessageOut(message=f"Marked {len(notifications)} messages as read")
-
-
-@router.delete("/{notification_id}", response_model=MessageOut)
-async def delete_notification(notification_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(Notification).where(Notification.id == notification_id, Notification.user_id == current_user.id))
-    notification = result.scalar_one_or_none()
-    if not notification:
-        raise NotFoundError("Notification not found")
-    notification.archive()
+    if not result.rowcount:
+        raise NotFoundError("Notification not found", "notification", notification_id)
     await db.commit()
     return MessageOut(message="Notification deleted")
-
-
-# Preferences
-@router.get("/preferences", response_model=NotificationPreferenceResponse)
-async def get_preferences(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(NotificationPreference).where(NotificationPreference.user_id == current_user.id))
-    preferences = result.scalar_one_or_none()
-    if not preferences:
-        preferences = NotificationPreference(user_id=current_user.id)
-        db.add(preferences)
-        await db.commit()
-        await db.refresh(preferences)
-    return NotificationPreferenceResponse.model_validate(preferences)
-
-
-@router.patch("/preferences", response_model=NotificationPreferenceResponse)
-async def update_preferences(update_data: NotificationPreferenceUpdate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(select(NotificationPreference).where(NotificationPreference.user_id == current_user.id))
-    preferences = result.scalar_one_or_none()
-    if not preferences:
-        preferences = NotificationPreference(user_id=current_user.id)
-        db.add(preferences)
-        await db.flush()
-
-    update_dict = update_data.model_dump(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(preferences, field, value)
-
-    await db.commit()
-    await db.refresh(preferences)
-    return NotificationPreferenceResponse.model_validate(preferences)
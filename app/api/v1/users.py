@@ -30,6 +30,7 @@ from app.schemas.user import (
 )
 from app.schemas.common import MessageOut
 from app.api.deps import get_current_user, require_admin
+from app.api.responses import model_response
 
 
 router = APIRouter()
@@ -54,7 +55,7 @@ async def update_current_user_profile(
     """
     Update current user's profile.
     """
-    update_dict = update_data.model_dump(exclude_unset=True)
+    update_dict = update_data.model_dump_unset()
 
     # Check phone uniqueness if updating
     if "phone" in update_dict and update_dict["phone"]:
@@ -104,18 +105,15 @@ async def get_user_sessions(
     Get list of active sessions for current user.
     """
     result = await db.execute(
-        select(UserSession).where(
-            UserSession.user_id == current_user.id,
-            UserSession.revoked == False,
-            UserSession.expires_at > datetime.now(timezone.utc),
-        ).order_by(UserSession.last_used_at.desc())
+        UserSession.active_sessions(current_user.id)
+        .order_by(UserSession.last_used_at.desc())
     )
     sessions = result.scalars().all()
 
-    return SessionListResponse(
-        sessions=[SessionResponse.model_validate(s) for s in sessions],
+    return model_response(SessionListResponse.model_construct(
+        sessions=[SessionResponse.from_orm_fast(s) for s in sessions],
         total=len(sessions),
-    )
+    ))
 
 
 @router.delete("/me/sessions/{session_id}", response_model=MessageOut)
@@ -156,15 +154,7 @@ async def delete_account(
     current_user.is_active = False
 
     # Revoke all sessions
-    result = await db.execute(
-        select(UserSession).where(
-            UserSession.user_id == current_user.id,
-            UserSession.revoked == False,
-        )
-    )
-    sessions = result.scalars().all()
-    for session in sessions:
-        session.revoke()
+    await UserSession.revoke_many(db, current_user.id)
 
     await db.commit()
 
@@ -238,7 +228,7 @@ async def list_users(
     result = await db.execute(query)
     users = result.scalars().all()
 
-    return [UserProfileResponse.model_validate(u) for u in users]
+    return UserProfileResponse.validate_list(users)
 
 
 @router.post("/{user_id}/block", response_model=MessageOut)
@@ -267,15 +257,7 @@ async def block_user(
     user.blocked_at = datetime.now(timezone.utc)
 
     # Revoke all sessions
-    result = await db.execute(
-        select(UserSession).where(
-            UserSession.user_id == user_id,
-            UserSession.revoked == False,
-        )
-    )
-    sessions = result.scalars().all()
-    for session in sessions:
-        session.revoke()
+    await UserSession.revoke_many(db, user_id)
 
     await db.commit()
 
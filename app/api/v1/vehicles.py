@@ -5,10 +5,10 @@ Provides cascading selection for vehicle types, brands, models, generations, mod
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.core.database import get_db
 from app.core.exceptions import NotFoundError, ConflictError
@@ -34,6 +34,7 @@ from app.schemas.vehicle import (
     ModelCreate,
     GenerationResponse,
     GenerationCreate,
+    ModificationSummaryResponse,
     ModificationResponse,
     ModificationCreate,
     BodyTypeResponse,
@@ -45,6 +46,8 @@ from app.schemas.vehicle import (
 )
 from app.schemas.common import MessageOut
 from app.api.deps import require_admin
+from app.api.responses import etag_matches, json_response, list_response
+from app.services.catalog_cache import catalog_cache
 
 
 router = APIRouter()
@@ -59,13 +62,7 @@ async def list_vehicle_types(
     """
     Get all vehicle types.
     """
-    result = await db.execute(
-        select(VehicleType).where(
-            VehicleType.is_active == True
-        ).order_by(VehicleType.sort_order, VehicleType.name)
-    )
-    types = result.scalars().all()
-    return [VehicleTypeResponse.model_validate(t) for t in types]
+    return list_response(VehicleTypeResponse, await catalog_cache.get(db, "vehicle_types"))
 
 
 @router.post("/types", response_model=VehicleTypeResponse, status_code=status.HTTP_201_CREATED)
@@ -93,19 +90,12 @@ async def list_brands(
     """
     Get brands, optionally filtered by vehicle type.
     """
-    query = select(Brand).where(Brand.is_active == True)
-
-    if vehicle_type_id:
-        query = query.where(Brand.vehicle_type_id == vehicle_type_id)
-
-    if popular_only:
-        query = query.where(Brand.is_popular == True)
-
-    query = query.order_by(Brand.sort_order, Brand.name)
-
-    result = await db.execute(query)
-    brands = result.scalars().all()
-    return [BrandResponse.model_validate(b) for b in brands]
+    brands = await catalog_cache.get(db, "brands")
+    return list_response(BrandResponse, [
+        b for b in brands
+        if (not vehicle_type_id or b.vehicle_type_id == vehicle_type_id)
+        and (not popular_only or b.is_popular)
+    ])
 
 
 @router.get("/brands/{brand_id}", response_model=BrandResponse)
@@ -146,19 +136,11 @@ async def list_models(
     """
     Get models for a specific brand.
     """
-    query = select(Model).where(
-        Model.brand_id == brand_id,
-        Model.is_active == True,
-    )
-
-    if popular_only:
-        query = query.where(Model.is_popular == True)
-
-    query = query.order_by(Model.sort_order, Model.name)
-
-    result = await db.execute(query)
-    models = result.scalars().all()
-    return [ModelResponse.model_validate(m) for m in models]
+    models = await catalog_cache.get(db, "models")
+    return list_response(ModelResponse, [
+        m for m in models
+        if m.brand_id == brand_id and (not popular_only or m.is_popular)
+    ])
 
 
 @router.get("/models/{model_id}", response_model=ModelResponse)
@@ -167,7 +149,10 @@ async def get_model(
     db: AsyncSession = Depends(get_db),
 ):
     """Get model by ID."""
-    result = await db.execute(select(Model).where(Model.id == model_id))
+    # ModelResponse only carries brand_id; skip the mapper's selectin of Brand
+    result = await db.execute(
+        select(Model).options(lazyload(Model.brand)).where(Model.id == model_id)
+    )
     model = result.scalar_one_or_none()
     if not model:
         raise NotFoundError("Model not found", "model", model_id)
@@ -198,14 +183,8 @@ async def list_generations(
     """
     Get generations for a specific model.
     """
-    result = await db.execute(
-        select(Generation).where(
-            Generation.model_id == model_id,
-            Generation.is_active == True,
-        ).order_by(Generation.year_start.desc(), Generation.sort_order)
-    )
-    generations = result.scalars().all()
-    return [GenerationResponse.model_validate(g) for g in generations]
+    generations = await catalog_cache.get(db, "generations")
+    return list_response(GenerationResponse, [g for g in generations if g.model_id == model_id])
 
 
 @router.get("/generations/{generation_id}", response_model=GenerationResponse)
@@ -214,7 +193,13 @@ async def get_generation(
     db: AsyncSession = Depends(get_db),
 ):
     """Get generation by ID."""
-    result = await db.execute(select(Generation).where(Generation.id == generation_id))
+    # Without this the selectin parents cascade Generation -> Model -> Brand,
+    # three queries for a response that only carries model_id
+    result = await db.execute(
+        select(Generation)
+        .options(lazyload(Generation.model))
+        .where(Generation.id == generation_id)
+    )
     generation = result.scalar_one_or_none()
     if not generation:
         raise NotFoundError("Generation not found", "generation", generation_id)
@@ -237,42 +222,49 @@ async def create_generation(
 
 # ============ Modifications ============
 
-@router.get("/modifications", response_model=List[ModificationResponse])
+def modification_dict(modification: Modification) -> dict:
+    """
+    ModificationResponse-shaped dict with the reference names filled in.
+
+    The spec has ~30 flat fields; building the plain dict and encoding it
+    directly skips a validate/dump/re-validate cycle per modification.
+    """
+    data = ModificationResponse.orm_dict(modification)
+    for relation in ("fuel_type", "transmission", "drive_type", "body_type"):
+        reference = getattr(modification, relation)
+        if reference is not None:
+            data[f"{relation}_name"] = reference.name
+    return data
+
+
+@router.get("/modifications", response_model=List[ModificationSummaryResponse])
 async def list_modifications(
     generation_id: int,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get modifications for a specific generation.
-    Includes full technical specifications.
+    Summary fields only; GET /modifications/{id} has the full specs.
     """
+    # A handful of columns instead of ~30 per row, fuel type name joined in
     result = await db.execute(
-        select(Modification).options(
-            selectinload(Modification.fuel_type),
-            selectinload(Modification.transmission),
-            selectinload(Modification.drive_type),
-            selectinload(Modification.body_type),
+        select(
+            Modification.id,
+            Modification.generation_id,
+            Modification.name,
+            Modification.slug,
+            Modification.engine_type,
+            Modification.engine_power_hp,
+            FuelType.name.label("fuel_type_name"),
+        ).outerjoin(
+            FuelType, FuelType.id == Modification.fuel_type_id
         ).where(
             Modification.generation_id == generation_id,
             Modification.is_active == True,
         ).order_by(Modification.sort_order, Modification.name)
     )
-    modifications = result.scalars().all()
-
-    result_list = []
-    for mod in modifications:
-        mod_dict = ModificationResponse.model_validate(mod).model_dump()
-        if mod.fuel_type:
-            mod_dict["fuel_type_name"] = mod.fuel_type.name
-        if mod.transmission:
-            mod_dict["transmission_name"] = mod.transmission.name
-        if mod.drive_type:
-            mod_dict["drive_type_name"] = mod.drive_type.name
-        if mod.body_type:
-            mod_dict["body_type_name"] = mod.body_type.name
-        result_list.append(ModificationResponse(**mod_dict))
 
-    return result_list
+    return json_response([row._asdict() for row in result])
 
 
 @router.get("/modifications/{modification_id}", response_model=ModificationResponse)
@@ -293,17 +285,7 @@ async def get_modification(
     if not modification:
         raise NotFoundError("Modification not found", "modification", modification_id)
 
-    mod_dict = ModificationResponse.model_validate(modification).model_dump()
-    if modification.fuel_type:
-        mod_dict["fuel_type_name"] = modification.fuel_type.name
-    if modification.transmission:
-        mod_dict["transmission_name"] = modification.transmission.name
-    if modification.drive_type:
-        mod_dict["drive_type_name"] = modification.drive_type.name
-    if modification.body_type:
-        mod_dict["body_type_name"] = modification.body_type.name
-
-    return ModificationResponse(**mod_dict)
+    return json_response(modification_dict(modification))
 
 
 @router.post("/modifications", response_model=ModificationResponse, status_code=status.HTTP_201_CREATED)
@@ -327,11 +309,7 @@ async def list_body_types(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all body types."""
-    result = await db.execute(
-        select(BodyType).where(BodyType.is_active == True).order_by(BodyType.sort_order, BodyType.name)
-    )
-    body_types = result.scalars().all()
-    return [BodyTypeResponse.model_validate(bt) for bt in body_types]
+    return list_response(BodyTypeResponse, await catalog_cache.get(db, "body_types"))
 
 
 @router.get("/transmissions", response_model=List[TransmissionResponse])
@@ -339,11 +317,7 @@ async def list_transmissions(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all transmission types."""
-    result = await db.execute(
-        select(Transmission).where(Transmission.is_active == True).order_by(Transmission.sort_order)
-    )
-    transmissions = result.scalars().all()
-    return [TransmissionResponse.model_validate(t) for t in transmissions]
+    return list_response(TransmissionResponse, await catalog_cache.get(db, "transmissions"))
 
 
 @router.get("/fuel-types", response_model=List[FuelTypeResponse])
@@ -351,11 +325,7 @@ async def list_fuel_types(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all fuel types."""
-    result = await db.execute(
-        select(FuelType).where(FuelType.is_active == True).order_by(FuelType.sort_order)
-    )
-    fuel_types = result.scalars().all()
-    return [FuelTypeResponse.model_validate(ft) for ft in fuel_types]
+    return list_response(FuelTypeResponse, await catalog_cache.get(db, "fuel_types"))
 
 
 @router.get("/drive-types", response_model=List[DriveTypeResponse])
@@ -363,11 +333,7 @@ async def list_drive_types(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all drive types."""
-    result = await db.execute(
-        select(DriveType).where(DriveType.is_active == True).order_by(DriveType.sort_order)
-    )
-    drive_types = result.scalars().all()
-    return [DriveTypeResponse.model_validate(dt) for dt in drive_types]
+    return list_response(DriveTypeResponse, await catalog_cache.get(db, "drive_types"))
 
 
 @router.get("/colors", response_model=List[ColorResponse])
@@ -375,51 +341,24 @@ async def list_colors(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all colors."""
-    result = await db.execute(
-        select(Color).where(Color.is_active == True).order_by(Color.sort_order, Color.name)
-    )
-    colors = result.scalars().all()
-    return [ColorResponse.model_validate(c) for c in colors]
+    return list_response(ColorResponse, await catalog_cache.get(db, "colors"))
+
+
+REFERENCES_CACHE_CONTROL = "public, max-age=300"
 
 
 @router.get("/references", response_model=VehicleFullHierarchy)
 async def get_all_references(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get all reference data for forms.
-    Useful for caching on client side.
+    Useful for caching on client side: send the ETag back in If-None-Match
+    to get a 304 while the catalog is unchanged.
     """
-    # Fetch all reference data in parallel
-    vehicle_types_result = await db.execute(
-        select(VehicleType).where(VehicleType.is_active == True).order_by(VehicleType.sort_order)
-    )
-    brands_result = await db.execute(
-        select(Brand).where(Brand.is_active == True, Brand.is_popular == True).order_by(Brand.sort_order)
-    )
-    body_types_result = await db.execute(
-        select(BodyType).where(BodyType.is_active == True).order_by(BodyType.sort_order)
-    )
-    transmissions_result = await db.execute(
-        select(Transmission).where(Transmission.is_active == True).order_by(Transmission.sort_order)
-    )
-    fuel_types_result = await db.execute(
-        select(FuelType).where(FuelType.is_active == True).order_by(FuelType.sort_order)
-    )
-    drive_types_result = await db.execute(
-        select(DriveType).where(DriveType.is_active == True).order_by(DriveType.sort_order)
-    )
-    colors_result = await db.execute(
-        select(Color).where(Color.is_active == True).order_by(Color.sort_order)
-    )
-
-    return VehicleFullHierarchy(
-        vehicle_types=[VehicleTypeResponse.model_validate(vt) for vt in vehicle_types_result.scalars().all()],
-        brands=[BrandResponse.model_validate(b) for b in brands_result.scalars().all()],
-        body_types=[BodyTypeResponse.model_validate(bt) for bt in body_types_result.scalars().all()],
-        transmissions=[TransmissionResponse.model_validate(t) for t in transmissions_result.scalars().all()],
-        fuel_types=[FuelTypeResponse.model_validate(ft) for ft in fuel_types_result.scalars().all()],
-        drive_types=[DriveTypeResponse.model_validate(dt) for dt in drive_types_result.scalars().all()],
-        colors=[ColorResponse.model_validate(c) for c in colors_result.scalars().all()],
-    )
-
+    body, etag = await catalog_cache.get_references(db)
+    headers = {"ETag": etag, "Cache-Control": REFERENCES_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
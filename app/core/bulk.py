@@ -0,0 +1,88 @@
+"""
+Bulk loading helpers.
+
+Large reference-data loads (vehicle catalog, locations) go through
+PostgreSQL COPY via asyncpg's ``copy_records_to_table``; small batches use
+a regular multi-row INSERT (insertmanyvalues), where COPY's setup cost
+doesn't pay off.
+"""
+
+from typing import Any, Iterable, Mapping, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+COPY_THRESHOLD = 100
+
+
+def _copy_columns(table, rows: Sequence[Mapping[str, Any]]) -> list:
+    """
+    Columns to COPY: every key present in ``rows`` plus columns that only
+    have a Python-side default (COPY never applies those).
+    """
+    keys = set().union(*(row.keys() for row in rows))
+    return [
+        col for col in table.columns
+        if col.key in keys or (col.default is not None and col.server_default is None)
+    ]
+
+
+def _default_value(col) -> Any:
+    default = col.default
+    if default is None:
+        return None
+    if default.is_callable:
+        return default.arg(None)
+    return default.arg
+
+
+async def bulk_copy(
+    session: AsyncSession,
+    model,
+    rows: Iterable[Mapping[str, Any]],
+    threshold: int = COPY_THRESHOLD,
+) -> int:
+    """
+    Insert ``rows`` (dicts keyed by column) into ``model``'s table.
+
+    Batches of at least ``threshold`` rows are streamed with COPY on the
+    session's own connection, so they commit or roll back with the rest of
+    the transaction. Values go through the column types' bind processors,
+    so enums and JSON are stored exactly as an INSERT would store them.
+
+    Returns:
+        Number of inserted rows
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+
+    table = model.__table__
+    if len(rows) < threshold:
+        await session.execute(insert(table), rows)
+        return len(rows)
+
+    connection = await session.connection()
+    dialect = connection.dialect
+    columns = _copy_columns(table, rows)
+    converters = []
+    for col in columns:
+        processor = col.type._cached_bind_processor(dialect)
+        converters.append((col.key, _default_value(col), processor))
+
+    records = [
+        tuple(
+            processor(row.get(key, default)) if processor else row.get(key, default)
+            for key, default, processor in converters
+        )
+        for row in rows
+    ]
+
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=[col.name for col in columns],
+    )
+    return len(records)
@@ -59,6 +59,19 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_CACHE_TTL: int = 3600
+    CATALOG_CACHE_TTL: int = 300  # seconds vehicle reference tables stay in process memory
+    LAST_SEEN_FLUSH_INTERVAL: int = 30  # seconds between last_seen_at flushes
+    AD_VIEWS_FLUSH_INTERVAL: int = 30  # seconds between views_count flushes
+    READ_RECEIPTS_FLUSH_INTERVAL: float = 0.05  # seconds between chat mark-read flushes
+    READ_RECEIPTS_BATCH_SIZE: int = 100  # flush early once this many ids are buffered
+
+    # Maintenance
+    CLEANUP_INTERVAL: int = 3600  # seconds between expired-row cleanups
+    CLEANUP_BATCH_SIZE: int = 10000
+    MODERATION_LOG_PARTITIONS_AHEAD: int = 3  # monthly moderation_logs partitions kept ready
+    SESSION_RETENTION_DAYS: int = 7  # keep expired/revoked sessions this long
+    AD_LIST_MV_ENABLED: bool = True  # serve public ad lists from ad_list_mv
+    AD_LIST_MV_REFRESH_INTERVAL: int = 60  # seconds between view refreshes
 
     # JWT Settings
     JWT_SECRET_KEY: str = "change-me-in-production"
@@ -66,6 +79,9 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
 
+    # Password hashing (bcrypt work factor; the test suite lowers it)
+    BCRYPT_ROUNDS: int = 12
+
     # Cookie Settings
     COOKIE_SECURE: bool = False
     COOKIE_HTTPONLY: bool = True
@@ -99,6 +115,7 @@ class Settings(BaseSettings):
     SMTP_USER: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
     EMAIL_FROM: str = "noreply@avtolaif.ru"
+    EMAIL_QUEUE_SIZE: int = 1000  # outgoing emails buffered for the sender task
 
     # SMS
     SMS_PROVIDER: str = "twilio"
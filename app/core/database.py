@@ -3,8 +3,9 @@ Database configuration and session management.
 Uses SQLAlchemy 2.0 async with PostgreSQL.
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -29,12 +30,23 @@ if not settings.DATABASE_URL or settings.DATABASE_URL.strip() == "":
         "Add a PostgreSQL service in Railway and link it to your app."
     )
 
+def _json_serializer(value: Any) -> str:
+    # asyncpg's JSON/JSONB codecs take str, hence the decode()
+    return orjson.dumps(value).decode()
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     echo=settings.DATABASE_ECHO,
     pool_pre_ping=True,
+    # Bulk inserts (e.g. notification fan-out) are sent as multi-row
+    # INSERT ... VALUES ... RETURNING batches instead of one row per round-trip
+    insertmanyvalues_page_size=1000,
+    # C-accelerated (de)serialization of JSON/JSONB columns
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -45,8 +45,11 @@ class CacheKeys:
 
     USER_SESSION = "session:"
     USER_PROFILE = "user:"
+    USER_LAST_SEEN = "user:lastseen"
     AD_DETAIL = "ad:"
     AD_LIST = "ads:"
+    AD_VIEWS = "ad:views"  # hash of ad_id -> views not yet flushed to ads.views_count
+    AD_VIEWS_DAY = "ad:views:day:"  # per-day sorted set of ad_id by views
     CATEGORY = "category:"
     BRAND = "brand:"
     MODEL = "model:"
@@ -54,6 +57,7 @@ class CacheKeys:
     MODIFICATION = "mod:"
     LOCATION = "location:"
     ONLINE_USERS = "online:"
+    NOTIFICATION_PREFS = "notif:pref:"
     RATE_LIMIT = "rate:"
 
 
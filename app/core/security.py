@@ -24,13 +24,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def hash_password(password: str) -> str:
     """Hash a password for storage."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
-def generate_token_hash(token: str) -> str:
-    """Generate a hash of a token for secure storage."""
-    return hashlib.sha256(token.encode()).hexdigest()
+def generate_token_hash(token: str) -> bytes:
+    """Generate a hash of a token for secure storage (raw 32-byte SHA-256 digest)."""
+    return hashlib.sha256(token.encode()).digest()
 
 
 def generate_random_token(length: int = 64) -> str:
@@ -81,7 +81,7 @@ def create_access_token(
 def create_refresh_token(
     subject: str | int,
     expires_delta: Optional[timedelta] = None,
-) -> Tuple[str, str, datetime]:
+) -> Tuple[str, bytes, datetime]:
     """
     Create a JWT refresh token.
     
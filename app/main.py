@@ -3,12 +3,11 @@ AVTO LAIF Backend - Main Application Entry Point
 FastAPI application with WebSocket support for real-time chat.
 """
 
-import json
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,7 +19,22 @@ from app.core.database import init_db, close_db, get_db
 from app.core.redis import RedisClient
 from app.core.exceptions import AppException
 from app.api.v1 import api_router
-from app.services.websocket import manager, authenticate_websocket, handle_websocket_message
+from app.services.websocket import (
+    INVALID_JSON_EVENT,
+    PONG_EVENT,
+    manager,
+    read_receipts,
+    authenticate_websocket,
+    decode_incoming,
+    handle_websocket_message,
+    send_event,
+)
+from app.services.activity_service import activity_service
+from app.services.cleanup_service import cleanup_service
+from app.services.ad_list_service import ad_list_view_service
+from app.services.ad_view_service import ad_view_service
+from app.services.catalog_cache import catalog_cache
+from app.services.email_service import email_service
 from app.admin import create_admin
 
 
@@ -51,10 +65,42 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Redis connection failed (optional): {e}")
     
+    # Periodically flush buffered last-seen timestamps to the database
+    activity_service.start()
+    
+    # Periodically add buffered ad views to ads.views_count
+    ad_view_service.start()
+    
+    # Periodically purge expired sessions and verification tokens, expire old ads
+    cleanup_service.start()
+    
+    # Keep the pre-joined ad list view fresh
+    ad_list_view_service.start()
+    
+    # Drop cached vehicle reference data when another worker changes it
+    catalog_cache.start()
+    
+    # Send outgoing email from one task over a reused SMTP connection
+    email_service.start()
+    
+    # Write chat read receipts in batches
+    read_receipts.start()
+    
+    # Build the OpenAPI schema once now; FastAPI keeps it on app.openapi_schema
+    # instead of walking every route and model on the first /docs request
+    app.openapi()
+    
     yield
     
     # Shutdown
     print("Shutting down AVTO LAIF Backend...")
+    catalog_cache.stop()
+    ad_list_view_service.stop()
+    cleanup_service.stop()
+    await activity_service.stop()
+    await ad_view_service.stop()
+    await email_service.stop()
+    await read_receipts.stop()
     await close_db()
     await RedisClient.close()
     print("Cleanup complete")
@@ -68,6 +114,7 @@ app = FastAPI(
     docs_url="/docs",  # Always enable docs for API testing
     redoc_url="/redoc",  # Always enable ReDoc
     openapi_url="/openapi.json",  # Always enable OpenAPI JSON
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -448,7 +495,7 @@ async def websocket_chat(
     - subscribed: Subscription confirmed { dialog_id }
     - new_message: New message received { dialog_id, message }
     - message_sent: Message sent confirmation { message_id, dialog_id, created_at }
-    - message_read: Message read notification { dialog_id, message_id, reader_id, read_at }
+    - messages_read: Messages read notification { dialog_id, message_ids, reader_id, read_at }
     - typing: Typing indicator { dialog_id, user_id, is_typing }
     - online_status: User online status { user_id, is_online }
     - error: Error message { message }
@@ -464,7 +511,7 @@ async def websocket_chat(
 
     try:
         # Send connection confirmation
-        await websocket.send_json({
+        await send_event(websocket, {
             "type": "connected",
             "user_id": user.id,
             "user_name": user.name,
@@ -472,15 +519,14 @@ async def websocket_chat(
 
         # Listen for messages
         while True:
+            data = await websocket.receive_text()
             try:
-                data = await websocket.receive_text()
-                message = json.loads(data)
+                message = decode_incoming(data)
+            except ValueError:
+                await websocket.send_text(INVALID_JSON_EVENT)
+                continue
+            if message is not None:
                 await handle_websocket_message(connection, message, db)
-            except json.JSONDecodeError:
-                await websocket.send_json({
-                    "type": "error",
-                    "message": "Invalid JSON",
-                })
 
     except WebSocketDisconnect:
         await manager.disconnect(connection)
@@ -509,13 +555,13 @@ async def websocket_status(
     try:
         while True:
             # Just keep connection alive with pings
+            data = await websocket.receive_text()
             try:
-                data = await websocket.receive_text()
-                message = json.loads(data)
-                if message.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
-            except json.JSONDecodeError:
-                pass
+                message = decode_incoming(data)
+            except ValueError:
+                continue
+            if message is not None and message["type"] == "ping":
+                await websocket.send_text(PONG_EVENT)
     except WebSocketDisconnect:
         await manager.disconnect(connection)
     except Exception:
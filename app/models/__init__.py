@@ -19,9 +19,11 @@ from app.models.vehicle import (
 )
 from app.models.location import Country, Region, City
 from app.models.ad import Ad, AdStatus, AdImage, AdVideo
+from app.models.ad_list import ad_list_mv
 from app.models.chat import Dialog, Message
 from app.models.favorites import Favorite, Comparison, ViewHistory
 from app.models.moderation import Report, ModerationLog
+from app.models.notification import Notification, NotificationPreference, NotificationType
 
 
 __all__ = [
@@ -52,6 +54,7 @@ __all__ = [
     "AdStatus",
     "AdImage",
     "AdVideo",
+    "ad_list_mv",
     # Chat
     "Dialog",
     "Message",
@@ -62,5 +65,9 @@ __all__ = [
     # Moderation
     "Report",
     "ModerationLog",
+    # Notification
+    "Notification",
+    "NotificationPreference",
+    "NotificationType",
 ]
 
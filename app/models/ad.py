@@ -9,7 +9,10 @@ from decimal import Decimal
 from typing import Optional, List, TYPE_CHECKING
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    CheckConstraint,
+    Computed,
     DateTime,
     Enum,
     ForeignKey,
@@ -18,7 +21,10 @@ from sqlalchemy import (
     String,
     Text,
     Float,
+    Index,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -75,6 +81,45 @@ class Currency(str, enum.Enum):
     EUR = "EUR"
 
 
+class FeatureFlag(enum.IntEnum):
+    """
+    Filterable equipment features; the value is the bit in Ad.features_mask.
+
+    Append new members only (bits are stored), at most 63 of them so the
+    mask stays a non-negative BIGINT.
+    """
+    ABS = 0
+    ESP = 1
+    AIRBAGS = 2
+    AIR_CONDITIONING = 3
+    CLIMATE_CONTROL = 4
+    CRUISE_CONTROL = 5
+    PARKING_SENSORS = 6
+    REAR_CAMERA = 7
+    NAVIGATION = 8
+    BLUETOOTH = 9
+    HEATED_SEATS = 10
+    LEATHER_SEATS = 11
+    SUNROOF = 12
+    ALLOY_WHEELS = 13
+    XENON_HEADLIGHTS = 14
+    LED_HEADLIGHTS = 15
+    KEYLESS_ENTRY = 16
+    START_STOP = 17
+    TOW_BAR = 18
+    ALARM = 19
+
+
+def features_mask(features: Optional[List[str]]) -> int:
+    """Bitmask of the known FeatureFlag names in ``features`` (others are ignored)."""
+    mask = 0
+    for name in features or ():
+        flag = FeatureFlag.__members__.get(name.strip().upper())
+        if flag is not None:
+            mask |= 1 << flag
+    return mask
+
+
 class Ad(Base, TimestampMixin, SoftDeleteMixin):
     """
     Main advertisement model.
@@ -82,6 +127,59 @@ class Ad(Base, TimestampMixin, SoftDeleteMixin):
     """
 
     __tablename__ = "ads"
+    __table_args__ = (
+        CheckConstraint("features_mask >= 0", name="ck_ads_features_mask"),
+        # Public listings only ever look at live, non-deleted ads; the keys
+        # follow apply_sorting() so ORDER BY ... LIMIT reads the index in
+        # order. The INCLUDE list lets count(*) with the common range
+        # filters run as an index-only scan.
+        Index(
+            "ix_ads_live_date",
+            text("is_top DESC"),
+            text("is_featured DESC"),
+            text("published_at DESC"),
+            postgresql_include=["id", "price", "year", "mileage", "brand_id", "model_id", "city_id"],
+            postgresql_where=text("status = 'ACTIVE' AND deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_ads_live_price",
+            text("is_top DESC"),
+            "price",
+            postgresql_where=text("status = 'ACTIVE' AND deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_ads_live_mileage",
+            text("is_top DESC"),
+            "mileage",
+            postgresql_where=text("status = 'ACTIVE' AND deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_ads_live_year",
+            text("is_top DESC"),
+            text("year DESC"),
+            postgresql_where=text("status = 'ACTIVE' AND deleted_at IS NULL"),
+        ),
+        Index("ix_ads_search_vector", "search_vector", postgresql_using="gin"),
+        # Brand / city facet pages sorted by date
+        Index(
+            "ix_ads_live_brand_date",
+            "brand_id",
+            text("published_at DESC"),
+            postgresql_where=text("status = 'ACTIVE' AND deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_ads_live_city_date",
+            "city_id",
+            text("published_at DESC"),
+            postgresql_where=text("status = 'ACTIVE' AND deleted_at IS NULL"),
+        ),
+        # Cleanup job moving past-due listings to EXPIRED
+        Index(
+            "ix_ads_live_expires",
+            "expires_at",
+            postgresql_where=text("status = 'ACTIVE' AND deleted_at IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
@@ -231,8 +329,20 @@ class Ad(Base, TimestampMixin, SoftDeleteMixin):
     latitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
+    # Full-text search over title + description, maintained by PostgreSQL
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('russian', coalesce(title, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+    
     # Features/Equipment (stored as JSON or separate table)
     features: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON array
+    # FeatureFlag bits of ``features``, for "has all of" filters
+    features_mask: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
     
     # Dates
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
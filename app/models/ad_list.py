@@ -0,0 +1,146 @@
+"""
+Denormalized ad list rows.
+
+``ad_list_query()`` selects exactly what ``AdListResponse`` needs, joined to
+the catalog and location tables. ``ad_list_mv`` stores the same join for all
+active ads as a materialized view, so the public listing scans one table
+instead of re-running the join on every request.
+"""
+
+from sqlalchemy import column, event, select, table, text
+
+from app.core.database import Base
+from app.models.ad import Ad, AdImage, AdStatus
+from app.models.location import City, Region
+from app.models.vehicle import Brand, Model, Generation, Transmission, FuelType
+
+
+# First image by sort_order, same as Ad.main_image_url
+_main_image_url = (
+    select(AdImage.url)
+    .where(AdImage.ad_id == Ad.id)
+    .order_by(AdImage.sort_order)
+    .limit(1)
+    .correlate(Ad)
+    .scalar_subquery()
+)
+
+# Exactly the columns AdListResponse needs
+AD_LIST_COLUMNS = (
+    Ad.id,
+    Ad.status,
+    Ad.user_id,
+    Ad.title,
+    Ad.price,
+    Ad.currency,
+    Ad.year,
+    Ad.mileage,
+    _main_image_url.label("main_image_url"),
+    Brand.name.label("brand_name"),
+    Model.name.label("model_name"),
+    Generation.name.label("generation_name"),
+    Ad.engine_volume,
+    Ad.engine_power,
+    Transmission.name.label("transmission_name"),
+    FuelType.name.label("fuel_type_name"),
+    City.name.label("city_name"),
+    Region.name.label("region_name"),
+    Ad.published_at,
+    Ad.created_at,
+    Ad.views_count,
+    Ad.is_featured,
+    Ad.is_top,
+    Ad.is_urgent,
+)
+
+# Extra ads columns kept in the view so search filters and sorting can run on it
+AD_LIST_FILTER_COLUMNS = (
+    Ad.category_id,
+    Ad.vehicle_type_id,
+    Ad.brand_id,
+    Ad.model_id,
+    Ad.generation_id,
+    Ad.body_type_id,
+    Ad.transmission_id,
+    Ad.fuel_type_id,
+    Ad.drive_type_id,
+    Ad.color_id,
+    Ad.condition,
+    Ad.is_damaged,
+    Ad.steering_wheel,
+    Ad.city_id,
+    City.region_id,
+    Ad.updated_at,
+    Ad.features_mask,
+)
+
+
+def ad_list_query(*columns):
+    """
+    SELECT the AdListResponse columns (plus ``columns``), joined to the
+    reference tables.
+
+    Rows are plain tuples: no ORM identity map, no related objects.
+    """
+    return (
+        select(*AD_LIST_COLUMNS, *columns)
+        .select_from(Ad)
+        .join(Brand, Brand.id == Ad.brand_id)
+        .join(Model, Model.id == Ad.model_id)
+        .outerjoin(Generation, Generation.id == Ad.generation_id)
+        .outerjoin(Transmission, Transmission.id == Ad.transmission_id)
+        .outerjoin(FuelType, FuelType.id == Ad.fuel_type_id)
+        .join(City, City.id == Ad.city_id)
+        .join(Region, Region.id == City.region_id)
+    )
+
+
+ad_list_mv_query = ad_list_query(*AD_LIST_FILTER_COLUMNS).where(
+    Ad.status == AdStatus.ACTIVE,
+    Ad.deleted_at.is_(None),
+)
+
+# Not part of Base.metadata: created by the hook below, never by create_all
+ad_list_mv = table(
+    "ad_list_mv",
+    *(column(col.name, col.type) for col in ad_list_mv_query.selected_columns),
+)
+
+AD_LIST_FIELDS = tuple(col.name for col in select(*AD_LIST_COLUMNS).selected_columns)
+
+
+def ad_list_view_query():
+    """SELECT the AdListResponse columns from ad_list_mv."""
+    return select(*(ad_list_mv.c[name] for name in AD_LIST_FIELDS))
+
+
+AD_LIST_MV_INDEXES = (
+    # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_ad_list_mv_id ON ad_list_mv (id)",
+    # Default "date" sort of apply_sorting()
+    "CREATE INDEX IF NOT EXISTS ix_ad_list_mv_published "
+    "ON ad_list_mv (is_top DESC, is_featured DESC, published_at DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_ad_list_mv_brand_model ON ad_list_mv (brand_id, model_id)",
+    "CREATE INDEX IF NOT EXISTS ix_ad_list_mv_city ON ad_list_mv (city_id)",
+    "CREATE INDEX IF NOT EXISTS ix_ad_list_mv_region ON ad_list_mv (region_id)",
+    "CREATE INDEX IF NOT EXISTS ix_ad_list_mv_price ON ad_list_mv (price)",
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_ad_list_mv(target, connection, **kw) -> None:
+    """Create the ad list materialized view once all its tables exist."""
+    view_sql = ad_list_mv_query.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+    # Driver-level execution: the rendered SELECT is not a text() template
+    connection.exec_driver_sql(f"CREATE MATERIALIZED VIEW IF NOT EXISTS ad_list_mv AS {view_sql}")
+    for ddl in AD_LIST_MV_INDEXES:
+        connection.execute(text(ddl))
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def drop_ad_list_mv(target, connection, **kw) -> None:
+    """Drop the view first, it depends on the tables being dropped."""
+    connection.execute(text("DROP MATERIALIZED VIEW IF EXISTS ad_list_mv"))
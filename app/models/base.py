@@ -2,29 +2,88 @@
 Base model class with common fields and utilities.
 """
 
+import enum
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Enum, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 
 
+class StringEnum(Enum):
+    """
+    Non-native ``Enum`` with precompiled encode/decode tables.
+
+    The stock processors run ``_db_value_for_elem`` / ``_object_value_for_elem``
+    for every value of every row. Here both directions are a single
+    ``dict.__getitem__``; unknown values raise ``KeyError`` (a
+    ``LookupError``, like the base class).
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        # Members and their raw string values both map to the stored value
+        encode = {None: None, **self._valid_lookup}
+        parent_processor = String.bind_processor(self, dialect)
+        if parent_processor is None:
+            return encode.__getitem__
+
+        def process(value):
+            return parent_processor(encode[value])
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        decode = {None: None, **self._object_lookup}
+        parent_processor = String.result_processor(self, dialect, coltype)
+        if parent_processor is None:
+            return decode.__getitem__
+
+        def process(value):
+            return decode[parent_processor(value)]
+
+        return process
+
+
+def string_enum(enum_class: type[enum.Enum], length: int = 32) -> StringEnum:
+    """
+    Store a Python enum as VARCHAR guarded by a CHECK constraint.
+
+    Avoids native PostgreSQL ENUM types: bind parameters stay plain text,
+    and adding a value does not need an ``ALTER TYPE`` migration.
+    Values (not member names) are stored and loaded back as enum members.
+    """
+    return StringEnum(
+        enum_class,
+        native_enum=False,
+        create_constraint=True,
+        length=length,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
 class TimestampMixin:
-    """Mixin that adds created_at and updated_at columns."""
+    """
+    Mixin that adds created_at and updated_at columns.
+
+    Both are filled by PostgreSQL; eager_defaults makes the ORM read them
+    back with INSERT/UPDATE ... RETURNING instead of a follow-up SELECT.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
-        onupdate=lambda: datetime.now(timezone.utc),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -13,10 +13,13 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
+    Sequence,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -28,6 +31,11 @@ if TYPE_CHECKING:
     from app.models.ad import Ad
 
 
+# Invoice numbers are drawn from a database sequence inside the INSERT itself,
+# so issuing an invoice needs no SELECT for the current maximum and no lock.
+invoice_seq = Sequence("invoice_seq", metadata=Base.metadata)
+
+
 class FeatureType(str, enum.Enum):
     """Types of paid features."""
     FEATURED = "featured"  # Ad appears in featured section
@@ -128,6 +136,22 @@ class AdBoost(Base, TimestampMixin):
     """
 
     __tablename__ = "ad_boosts"
+    __table_args__ = (
+        # expire_old_boosts: active boosts past expires_at. Partial, so it
+        # only holds the (small) active set.
+        Index(
+            "ix_ad_boosts_active_expires",
+            "expires_at",
+            postgresql_where=text("is_active = true"),
+        ),
+        # get_active_boosts_for_ad: active, unexpired boosts of one ad
+        Index(
+            "ix_ad_boosts_ad_active",
+            "ad_id",
+            "expires_at",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
@@ -149,6 +173,7 @@ class AdBoost(Base, TimestampMixin):
         Integer,
         ForeignKey("payments.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,  # refund_payment joins boosts by payment
     )
     
     # Amount
@@ -218,6 +243,10 @@ class Payment(Base, TimestampMixin):
     """
 
     __tablename__ = "payments"
+    __table_args__ = (
+        # Payment history of a user, newest first (backward scan, no sort)
+        Index("ix_payments_user_created", "user_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
@@ -276,7 +305,8 @@ class Payment(Base, TimestampMixin):
     refund_reason: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Metadata (JSON)
-    metadata: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # "metadata" is reserved on declarative classes; the column keeps its name
+    extra_data: Mapped[Optional[str]] = mapped_column("metadata", Text, nullable=True)
 
     # Relationships
     user: Mapped["User"] = relationship("User")
@@ -312,6 +342,7 @@ class Invoice(Base, TimestampMixin):
     """
 
     __tablename__ = "invoices"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
@@ -323,12 +354,16 @@ class Invoice(Base, TimestampMixin):
         unique=True,
     )
     
-    # Invoice number
+    # Invoice number (INV-<year>-<8 digit sequence>, generated by the database)
     invoice_number: Mapped[str] = mapped_column(
         String(50),
         unique=True,
         nullable=False,
         index=True,
+        server_default=text(
+            "'INV-' || to_char(now(), 'YYYY') || '-' || "
+            "lpad(nextval('invoice_seq')::text, 8, '0')"
+        ),
     )
     
     # Invoice details
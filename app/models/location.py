@@ -5,8 +5,8 @@ Country -> Region -> City hierarchy.
 
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Float
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Float, func, select
+from sqlalchemy.orm import Mapped, aliased, mapped_column, relationship
 
 from app.core.database import Base
 from app.models.base import TimestampMixin
@@ -67,6 +67,10 @@ class City(Base, TimestampMixin):
     """City reference with coordinates."""
 
     __tablename__ = "cities"
+    __table_args__ = (
+        # Bounding-box prefilter of radius searches
+        Index("ix_cities_lat_lon", "latitude", "longitude"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     region_id: Mapped[int] = mapped_column(
@@ -109,3 +113,50 @@ class City(Base, TimestampMixin):
             return (self.latitude, self.longitude)
         return None
 
+
+# ============ Distance search ============
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.195  # 2 * pi * EARTH_RADIUS_KM / 360
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    """Great-circle (haversine) distance in km as a SQL expression."""
+    def rad(value):
+        return func.radians(value, type_=Float)
+
+    a = (
+        func.power(func.sin(rad(lat2 - lat1) / 2.0, type_=Float), 2)
+        + func.cos(rad(lat1), type_=Float)
+        * func.cos(rad(lat2), type_=Float)
+        * func.power(func.sin(rad(lon2 - lon1) / 2.0, type_=Float), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(a, type_=Float), type_=Float)
+
+
+def within_radius(lat, lon, radius_km: float) -> tuple:
+    """
+    WHERE clauses for cities within ``radius_km`` of (lat, lon).
+
+    The latitude/longitude box is checked first so the (latitude, longitude)
+    index narrows the candidates; the exact distance is only computed for
+    those. ``lat``/``lon`` may be plain numbers or SQL expressions.
+    """
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    # Longitude degrees shrink towards the poles; clamp to avoid dividing by ~0
+    lon_delta = radius_km / (KM_PER_DEGREE_LAT * func.greatest(func.cos(func.radians(lat, type_=Float), type_=Float), 0.01, type_=Float))
+    return (
+        City.latitude.between(lat - lat_delta, lat + lat_delta),
+        City.longitude.between(lon - lon_delta, lon + lon_delta),
+        distance_km(lat, lon, City.latitude, City.longitude) <= radius_km,
+    )
+
+
+def cities_within(city_id: int, radius_km: float):
+    """SELECT the ids of cities within ``radius_km`` of city ``city_id``."""
+    center = aliased(City)
+    return (
+        select(City.id)
+        .join(center, center.id == city_id)
+        .where(*within_radius(center.latitude, center.longitude, radius_km))
+    )
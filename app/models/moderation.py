@@ -3,22 +3,25 @@ Moderation and reporting models.
 """
 
 import enum
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Optional, TYPE_CHECKING
 
 from sqlalchemy import (
     Boolean,
     DateTime,
-    Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    event,
+    func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import TimestampMixin, string_enum
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -69,6 +72,10 @@ class Report(Base, TimestampMixin):
     """User reports on ads, users, or messages."""
 
     __tablename__ = "reports"
+    __table_args__ = (
+        # Moderator queue: WHERE status = ? ORDER BY created_at DESC
+        Index("ix_reports_status_created", "status", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
@@ -82,21 +89,21 @@ class Report(Base, TimestampMixin):
     
     # Report target
     report_type: Mapped[ReportType] = mapped_column(
-        Enum(ReportType),
+        string_enum(ReportType),
         nullable=False,
     )
     target_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     
     # Report details
     reason: Mapped[ReportReason] = mapped_column(
-        Enum(ReportReason),
+        string_enum(ReportReason),
         nullable=False,
     )
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Status
     status: Mapped[ReportStatus] = mapped_column(
-        Enum(ReportStatus),
+        string_enum(ReportStatus),
         default=ReportStatus.PENDING,
         nullable=False,
         index=True,
@@ -136,7 +143,7 @@ class Report(Base, TimestampMixin):
         """Resolve the report."""
         self.status = status
         self.resolved_by = moderator_id
-        self.resolved_at = datetime.now(timezone.utc)
+        self.resolved_at = func.now()
         self.resolution_note = note
 
 
@@ -144,8 +151,22 @@ class ModerationLog(Base, TimestampMixin):
     """Log of all moderation actions."""
 
     __tablename__ = "moderation_logs"
+    __table_args__ = (
+        # Action history of a single target, newest first
+        Index("ix_modlog_target", "target_type", "target_id", "created_at"),
+        # Append-only log queried by time window: monthly range partitions
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # Overrides TimestampMixin.created_at: the partition key has to be part
+    # of the primary key
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        primary_key=True,
+    )
     
     # Moderator who performed the action
     moderator_id: Mapped[int] = mapped_column(
@@ -157,7 +178,7 @@ class ModerationLog(Base, TimestampMixin):
     
     # Action details
     action: Mapped[ModerationAction] = mapped_column(
-        Enum(ModerationAction),
+        string_enum(ModerationAction),
         nullable=False,
     )
     target_type: Mapped[str] = mapped_column(String(50), nullable=False)  # 'user', 'ad', 'message'
@@ -180,3 +201,63 @@ class ModerationLog(Base, TimestampMixin):
     def __repr__(self) -> str:
         return f"<ModerationLog(id={self.id}, action={self.action}, target={self.target_type}:{self.target_id})>"
 
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def moderation_log_partition_name(month: date) -> str:
+    """Name of the monthly moderation_logs partition containing ``month``."""
+    return f"moderation_logs_{month:%Y_%m}"
+
+
+def moderation_log_partition_ddl(month: date) -> str:
+    """DDL for the monthly moderation_logs partition containing ``month``."""
+    start = month.replace(day=1)
+    end = _next_month(start)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {moderation_log_partition_name(start)} "
+        f"PARTITION OF moderation_logs "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def moderation_log_attach_partition_ddl(month: date) -> list[str]:
+    """
+    Statements that add the partition for ``month`` to a live table.
+
+    Rows of that month which already landed in the DEFAULT partition would
+    make a plain CREATE ... PARTITION OF fail, so the partition is built
+    standalone, those rows are moved into it and it is then attached.
+    Run them after locking moderation_logs_default (SHARE ROW EXCLUSIVE),
+    so no rows for the month arrive there meanwhile.
+    """
+    start = month.replace(day=1)
+    end = _next_month(start)
+    name = moderation_log_partition_name(start)
+    in_month = f"created_at >= '{start.isoformat()}' AND created_at < '{end.isoformat()}'"
+    return [
+        f"CREATE TABLE {name} (LIKE moderation_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        f"INSERT INTO {name} SELECT * FROM moderation_logs_default WHERE {in_month}",
+        f"DELETE FROM moderation_logs_default WHERE {in_month}",
+        f"ALTER TABLE moderation_logs ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')",
+    ]
+
+
+@event.listens_for(ModerationLog.__table__, "after_create")
+def create_moderation_log_partitions(target, connection, **kw) -> None:
+    """
+    Create partitions for the current and next 12 months, plus a DEFAULT
+    partition so inserts never fail when a month has not been created yet.
+
+    Later months are added ahead of time by cleanup_service.
+    """
+    month = datetime.now(timezone.utc).date().replace(day=1)
+    for _ in range(13):
+        connection.execute(text(moderation_log_partition_ddl(month)))
+        month = _next_month(month)
+    connection.execute(text(
+        "CREATE TABLE IF NOT EXISTS moderation_logs_default "
+        "PARTITION OF moderation_logs DEFAULT"
+    ))
@@ -9,26 +9,42 @@ from typing import Optional, List, TYPE_CHECKING
 
 from sqlalchemy import (
     Boolean,
+    ColumnElement,
+    Computed,
     DateTime,
-    Enum,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
+    Select,
     String,
     Text,
     func,
+    select,
+    text,
+    update,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.config import settings
 from app.core.database import Base
-from app.models.base import TimestampMixin, SoftDeleteMixin
+from app.models.base import TimestampMixin, SoftDeleteMixin, string_enum
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
     from app.models.ad import Ad
     from app.models.chat import Dialog, Message
     from app.models.favorites import Favorite, Comparison, ViewHistory
     from app.models.location import City
 
 
+# Lazy loading strategy for User relationships. Outside production an
+# implicit lazy load raises instead of silently issuing one query per row
+# (N+1), so callers have to ask for selectinload()/joinedload() explicitly.
+USER_RELATIONSHIP_LAZY = "select" if settings.is_production else "raise_on_sql"
+
+
 class UserRole(str, enum.Enum):
     """User roles for access control."""
     GUEST = "guest"
@@ -44,10 +60,45 @@ class AccountType(str, enum.Enum):
     COMPANY = "company"
 
 
+class UserFlag(enum.IntFlag):
+    """Bits of User.flags (rarely filtered per-user settings)."""
+    TWO_FACTOR_ENABLED = 1
+    NOTIFY_EMAIL = 2
+    NOTIFY_SMS = 4
+    NOTIFY_PUSH = 8
+
+
+DEFAULT_USER_FLAGS = UserFlag.NOTIFY_EMAIL | UserFlag.NOTIFY_PUSH
+
+
+def flag_property(flag: UserFlag) -> hybrid_property:
+    """Expose one bit of ``User.flags`` as a boolean attribute, usable in SQL."""
+
+    def fget(self) -> bool:
+        flags = self.flags if self.flags is not None else DEFAULT_USER_FLAGS
+        return bool(flags & flag)
+
+    def fset(self, value: bool) -> None:
+        flags = self.flags if self.flags is not None else DEFAULT_USER_FLAGS
+        self.flags = int(flags | flag) if value else int(flags & ~flag)
+
+    def expr(cls) -> ColumnElement[bool]:
+        return cls.flags.op("&")(int(flag)) != 0
+
+    return hybrid_property(fget, fset, expr=expr)
+
+
 class User(Base, TimestampMixin, SoftDeleteMixin):
     """User model with full profile information."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_can_post",
+            "can_post_ads_stored",
+            postgresql_where=text("can_post_ads_stored"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
@@ -62,12 +113,12 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
     
     # Account settings
     role: Mapped[UserRole] = mapped_column(
-        Enum(UserRole),
+        string_enum(UserRole),
         default=UserRole.USER,
         nullable=False,
     )
     account_type: Mapped[AccountType] = mapped_column(
-        Enum(AccountType),
+        string_enum(AccountType),
         default=AccountType.INDIVIDUAL,
         nullable=False,
     )
@@ -80,9 +131,24 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
     blocked_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     blocked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
+    # Packed boolean settings, see UserFlag
+    flags: Mapped[int] = mapped_column(
+        Integer,
+        default=int(DEFAULT_USER_FLAGS),
+        server_default=text(str(int(DEFAULT_USER_FLAGS))),
+        nullable=False,
+    )
+    
     # Two-factor auth (prepared for future)
-    two_factor_enabled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    two_factor_secret: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    two_factor_enabled = flag_property(UserFlag.TWO_FACTOR_ENABLED)
+    # Never part of a response: left out of every user SELECT unless
+    # explicitly requested with undefer()
+    two_factor_secret: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
+    )
     
     # Location
     city_id: Mapped[Optional[int]] = mapped_column(
@@ -98,67 +164,120 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
     company_address: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     company_website: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
-    # Notification settings
-    notify_email: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    notify_sms: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    notify_push: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    # Notification settings (stored in flags)
+    notify_email = flag_property(UserFlag.NOTIFY_EMAIL)
+    notify_sms = flag_property(UserFlag.NOTIFY_SMS)
+    notify_push = flag_property(UserFlag.NOTIFY_PUSH)
     
     # Statistics
     last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Generated by the database; read through the can_post_ads hybrid
+    can_post_ads_stored: Mapped[bool] = mapped_column(
+        Boolean,
+        Computed("is_active AND NOT is_blocked AND email_verified", persisted=True),
+    )
     
     # Relationships
     sessions: Mapped[List["UserSession"]] = relationship(
         "UserSession",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=USER_RELATIONSHIP_LAZY,
     )
     ads: Mapped[List["Ad"]] = relationship(
         "Ad",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=USER_RELATIONSHIP_LAZY,
+    )
+    city: Mapped[Optional["City"]] = relationship(
+        "City",
+        back_populates="users",
+        lazy=USER_RELATIONSHIP_LAZY,
     )
-    city: Mapped[Optional["City"]] = relationship("City", back_populates="users")
     favorites: Mapped[List["Favorite"]] = relationship(
         "Favorite",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=USER_RELATIONSHIP_LAZY,
     )
     comparisons: Mapped[List["Comparison"]] = relationship(
         "Comparison",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=USER_RELATIONSHIP_LAZY,
     )
     view_history: Mapped[List["ViewHistory"]] = relationship(
         "ViewHistory",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=USER_RELATIONSHIP_LAZY,
     )
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
 
-    @property
+    @hybrid_property
     def is_admin(self) -> bool:
         return self.role == UserRole.ADMIN
 
-    @property
+    @hybrid_property
     def is_moderator(self) -> bool:
         return self.role in (UserRole.MODERATOR, UserRole.ADMIN)
 
+    @is_moderator.inplace.expression
+    @classmethod
+    def _is_moderator_expression(cls) -> ColumnElement[bool]:
+        return cls.role.in_([UserRole.MODERATOR, UserRole.ADMIN])
+
     @property
     def is_dealer(self) -> bool:
         return self.role == UserRole.DEALER
 
-    @property
+    @hybrid_property
     def can_post_ads(self) -> bool:
         return self.is_active and not self.is_blocked and self.email_verified
 
+    @can_post_ads.inplace.expression
+    @classmethod
+    def _can_post_ads_expression(cls) -> ColumnElement[bool]:
+        # Served by the ix_users_can_post partial index on the stored column
+        return cls.can_post_ads_stored
+
 
 class UserSession(Base, TimestampMixin):
     """User session for tracking active sessions and refresh tokens."""
 
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        # Refresh token lookups are pure equality on the raw SHA-256 digest
+        Index("ix_user_sessions_token_hash", "refresh_token_hash", postgresql_using="hash"),
+        # Only non-revoked sessions are ever listed or revoked in bulk.
+        # expires_at cannot be part of the predicate (now() is not immutable).
+        Index(
+            "ix_user_sessions_active",
+            "user_id",
+            postgresql_where=text("revoked = false"),
+        ),
+        # Used by the periodic cleanup of expired/revoked sessions
+        Index(
+            "ix_user_sessions_expires",
+            "expires_at",
+            postgresql_where=text("revoked = false"),
+        ),
+        Index(
+            "ix_user_sessions_revoked_at",
+            "revoked_at",
+            postgresql_where=text("revoked = true"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -169,7 +288,7 @@ class UserSession(Base, TimestampMixin):
     )
     
     # Token tracking (store hash, not actual token)
-    refresh_token_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    refresh_token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     
     # Session metadata
     user_agent: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
@@ -184,7 +303,7 @@ class UserSession(Base, TimestampMixin):
     # Last activity
     last_used_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
@@ -203,10 +322,53 @@ class UserSession(Base, TimestampMixin):
             return False
         return True
 
+    @classmethod
+    def active_sessions(cls, user_id: int) -> Select:
+        """
+        Query for a user's valid sessions, filtered in SQL.
+
+        Served by the ix_user_sessions_active partial index; use it instead
+        of loading every session and checking ``is_valid`` in Python.
+        """
+        return select(cls).where(
+            cls.user_id == user_id,
+            cls.revoked == False,
+            cls.expires_at > func.now(),
+        )
+
+    @classmethod
+    async def revoke_many(
+        cls,
+        db: "AsyncSession",
+        user_id: int,
+        except_id: Optional[int] = None,
+    ) -> int:
+        """
+        Revoke all active sessions of a user with a single UPDATE.
+
+        Args:
+            db: Database session
+            user_id: Owner of the sessions
+            except_id: Session to keep (e.g. the current one)
+
+        Returns:
+            Number of sessions revoked
+        """
+        stmt = (
+            update(cls)
+            .where(cls.user_id == user_id, cls.revoked == False)
+            .values(revoked=True, revoked_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        if except_id is not None:
+            stmt = stmt.where(cls.id != except_id)
+        result = await db.execute(stmt)
+        return result.rowcount
+
     def revoke(self) -> None:
         """Revoke this session."""
         self.revoked = True
-        self.revoked_at = datetime.now(timezone.utc)
+        self.revoked_at = func.now()
 
 
 class EmailVerification(Base, TimestampMixin):
@@ -221,7 +383,7 @@ class EmailVerification(Base, TimestampMixin):
         nullable=False,
     )
     token: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
     used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
 
@@ -238,7 +400,7 @@ class PhoneVerification(Base, TimestampMixin):
     )
     phone: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     code: Mapped[str] = mapped_column(String(10), nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
     attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
@@ -255,6 +417,6 @@ class PasswordReset(Base, TimestampMixin):
         nullable=False,
     )
     token: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
     used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
@@ -84,7 +84,8 @@ class Model(Base, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Relationships
-    brand: Mapped["Brand"] = relationship("Brand", back_populates="models")
+    # Model and Brand are almost always shown together
+    brand: Mapped["Brand"] = relationship("Brand", back_populates="models", lazy="selectin")
     generations: Mapped[List["Generation"]] = relationship("Generation", back_populates="model")
 
     def __repr__(self) -> str:
@@ -115,7 +116,7 @@ class Generation(Base, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Relationships
-    model: Mapped["Model"] = relationship("Model", back_populates="generations")
+    model: Mapped["Model"] = relationship("Model", back_populates="generations", lazy="selectin")
     modifications: Mapped[List["Modification"]] = relationship(
         "Modification",
         back_populates="generation",
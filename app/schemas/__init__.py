@@ -23,6 +23,7 @@ from app.schemas.vehicle import (
     BrandResponse,
     ModelResponse,
     GenerationResponse,
+    ModificationSummaryResponse,
     ModificationResponse,
 )
 from app.schemas.category import CategoryResponse, CategoryCreate
@@ -55,6 +56,7 @@ __all__ = [
     "BrandResponse",
     "ModelResponse",
     "GenerationResponse",
+    "ModificationSummaryResponse",
     "ModificationResponse",
     # Category
     "CategoryResponse",
@@ -9,7 +9,7 @@ from typing import Optional, List
 from pydantic import BaseModel, Field
 
 from app.models.ad import AdStatus, Condition, SteeringWheel, PTSType, Currency
-from app.schemas.common import BaseSchema
+from app.schemas.common import BaseSchema, FrozenSchema
 from app.schemas.user import UserResponse
 from app.schemas.vehicle import (
     VehicleTypeResponse,
@@ -27,7 +27,7 @@ from app.schemas.category import CategoryResponse
 from app.schemas.location import CityWithRegion
 
 
-class AdImageResponse(BaseSchema):
+class AdImageResponse(FrozenSchema):
     """Ad image response."""
 
     id: int
@@ -46,7 +46,7 @@ class AdImageCreate(BaseModel):
     is_main: bool = False
 
 
-class AdVideoResponse(BaseSchema):
+class AdVideoResponse(FrozenSchema):
     """Ad video response."""
 
     id: int
@@ -168,7 +168,7 @@ class AdUpdate(BaseModel):
     features: Optional[List[str]] = None
 
 
-class AdResponse(BaseSchema):
+class AdResponse(FrozenSchema):
     """Full ad response."""
 
     id: int
@@ -269,7 +269,7 @@ class AdResponse(BaseSchema):
     is_in_comparison: bool = False
 
 
-class AdListResponse(BaseSchema):
+class AdListResponse(FrozenSchema):
     """Ad response for list views (simplified)."""
 
     id: int
@@ -379,15 +379,17 @@ class AdSearchParams(BaseModel):
     has_photo: Optional[bool] = None
     has_video: Optional[bool] = None
     has_vin: Optional[bool] = None
+    features: Optional[List[str]] = None  # FeatureFlag names, all required (?features=a&features=b)
     dealer_only: Optional[bool] = None
     private_only: Optional[bool] = None
     
     # Sorting
-    sort_by: str = "date"  # date, price_asc, price_desc, mileage, year
+    sort_by: str = "date"  # date, price_asc, price_desc, mileage, year, relevance (with q)
     
     # Pagination
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = None  # next_cursor of the previous page (sort_by=date); replaces page
 
 
 class AdModerationAction(BaseModel):
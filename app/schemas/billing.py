@@ -4,12 +4,13 @@ Schemas for notifications and billing.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List
+from typing import Dict, Optional, List
 import json
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict
 
-from app.models.notification import NotificationType, NotificationChannel
+from app.models.notification import NotificationType
 from app.models.billing import PaymentStatus, PaymentProvider, FeatureType
 from app.schemas.common import BaseSchema
 
@@ -195,6 +196,8 @@ class InvoiceResponse(BaseSchema):
 
 class StripeWebhookRequest(BaseModel):
     """Stripe webhook request."""
+
+    model_config = ConfigDict(defer_build=True)
     
     id: str
     type: str
@@ -203,6 +206,8 @@ class StripeWebhookRequest(BaseModel):
 
 class YandexWebhookRequest(BaseModel):
     """Yandex.Kassa webhook request."""
+
+    model_config = ConfigDict(defer_build=True)
     
     type: str
     event: dict
@@ -210,6 +215,8 @@ class YandexWebhookRequest(BaseModel):
 
 class SberbankWebhookRequest(BaseModel):
     """Sberbank webhook request."""
+
+    model_config = ConfigDict(defer_build=True)
     
     orderNumber: str
     operation: str
@@ -219,8 +226,25 @@ class SberbankWebhookRequest(BaseModel):
 
 # ============ Billing Statistics ============
 
+class TariffStats(TypedDict):
+    """Sales of one tariff."""
+
+    name: str
+    count: int
+    revenue: Decimal
+
+
+class DailyRevenue(TypedDict):
+    """Revenue for one day."""
+
+    date: str
+    amount: Decimal
+
+
 class BillingStatsResponse(BaseModel):
     """Billing statistics response."""
+
+    model_config = ConfigDict(defer_build=True)
     
     total_revenue: Decimal
     currency: str
@@ -228,6 +252,6 @@ class BillingStatsResponse(BaseModel):
     completed_payments: int
     failed_payments: int
     total_refunds: int
-    payment_methods: dict  # {provider: count}
-    top_tariffs: List[dict]  # [{name, count, revenue}]
-    daily_revenue: List[dict]  # [{date, amount}]
\ No newline at end of file
+    payment_methods: Dict[str, int]  # {provider: count}
+    top_tariffs: List[TariffStats]
+    daily_revenue: List[DailyRevenue]
\ No newline at end of file
@@ -2,7 +2,8 @@
 Category schemas.
 """
 
-from typing import Optional, List
+from collections import defaultdict
+from typing import Any, Iterable, Optional, List
 
 from pydantic import BaseModel, Field
 
@@ -86,6 +87,36 @@ class CategoryTree(BaseModel):
 
     categories: List[CategoryWithChildren]
 
+    @classmethod
+    def build(cls, categories: Iterable[Any]) -> "CategoryTree":
+        """
+        Assemble the tree from flat category rows (kept in their order).
+
+        One pass groups rows by parent; nodes are then built children-first
+        with model_construct, without recursion or validation. Rows whose
+        parent is not among ``categories`` are left out, like their parent.
+        """
+        children_of: dict[Optional[int], list] = defaultdict(list)
+        for category in categories:
+            children_of[category.parent_id].append(category)
+
+        # Depth-first walk from the roots; reversed, every child precedes its parent
+        reachable = []
+        stack = list(children_of[None])
+        while stack:
+            category = stack.pop()
+            reachable.append(category)
+            stack.extend(children_of.get(category.id, ()))
+
+        fields = CategoryResponse.model_fields
+        built: dict[int, CategoryWithChildren] = {}
+        for category in reversed(reachable):
+            built[category.id] = CategoryWithChildren.model_construct(
+                **{name: getattr(category, name) for name in fields},
+                children=[built[child.id] for child in children_of.get(category.id, ())],
+            )
+        return cls.model_construct(categories=[built[root.id] for root in children_of[None]])
+
 
 # Required for self-referencing model
 CategoryWithChildren.model_rebuild()
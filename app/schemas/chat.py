@@ -3,14 +3,26 @@ Chat/Messaging schemas.
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Annotated, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import NotRequired, TypedDict
 
-from app.schemas.common import BaseSchema
+from app.schemas.common import BaseSchema, FrozenSchema
 from app.schemas.user import UserResponse
 
 
+class MessageAttachmentData(TypedDict):
+    """Attachment entry on a message (mirrors the MessageAttachment columns)."""
+
+    file_type: str  # image, document
+    file_name: str
+    file_url: str
+    file_size: NotRequired[Optional[int]]
+    mime_type: NotRequired[Optional[str]]
+    thumbnail_url: NotRequired[Optional[str]]
+
+
 class MessageCreate(BaseModel):
     """Create message schema."""
 
@@ -18,7 +30,7 @@ class MessageCreate(BaseModel):
     attachments: Optional[List[dict]] = None
 
 
-class MessageResponse(BaseSchema):
+class MessageResponse(FrozenSchema):
     """Message response."""
 
     id: int
@@ -26,7 +38,7 @@ class MessageResponse(BaseSchema):
     sender_id: int
     sender: UserResponse
     text: Optional[str] = None
-    attachments: Optional[List[dict]] = None
+    attachments: Optional[List[MessageAttachmentData]] = None
     is_read: bool
     read_at: Optional[datetime] = None
     is_delivered: bool
@@ -95,6 +107,8 @@ class TypingIndicator(BaseModel):
 class OnlineStatus(BaseModel):
     """User online status."""
 
+    model_config = ConfigDict(frozen=True)
+
     user_id: int
     is_online: bool
     last_seen_at: Optional[datetime] = None
@@ -111,22 +125,27 @@ class WSMessage(BaseModel):
 class WSNewMessage(BaseModel):
     """New message via WebSocket."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str = "new_message"
     message: MessageResponse
 
 
-class WSMessageRead(BaseModel):
-    """Message read notification via WebSocket."""
+class WSMessagesRead(BaseModel):
+    """Messages read notification via WebSocket (one per mark_read batch)."""
 
-    type: str = "message_read"
+    type: str = "messages_read"
     dialog_id: int
-    message_id: int
+    message_ids: List[int]
+    reader_id: int
     read_at: datetime
 
 
 class WSTyping(BaseModel):
     """Typing indicator via WebSocket."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str = "typing"
     dialog_id: int
     user_id: int
@@ -141,6 +160,49 @@ class WSOnlineStatus(BaseModel):
     is_online: bool
 
 
+# Client -> server WebSocket frames. TypedDicts, so a validated frame is
+# still the plain dict the handlers index into.
+
+class WSPingIn(TypedDict):
+    type: Literal["ping"]
+
+
+class WSSubscribeIn(TypedDict):
+    type: Literal["subscribe"]
+    dialog_id: int
+
+
+class WSUnsubscribeIn(TypedDict):
+    type: Literal["unsubscribe"]
+    dialog_id: int
+
+
+class WSTypingIn(TypedDict):
+    type: Literal["typing"]
+    dialog_id: int
+    is_typing: NotRequired[bool]
+
+
+class WSMessageIn(TypedDict):
+    type: Literal["message"]
+    dialog_id: int
+    text: str
+
+
+class WSMarkReadIn(TypedDict):
+    type: Literal["mark_read"]
+    dialog_id: int
+    # Bound to the INTEGER id column: an out-of-range id would fail the
+    # whole batched UPDATE it lands in
+    message_ids: List[Annotated[int, Field(ge=1, le=2**31 - 1)]]
+
+
+WSIncoming = Annotated[
+    Union[WSPingIn, WSSubscribeIn, WSUnsubscribeIn, WSTypingIn, WSMessageIn, WSMarkReadIn],
+    Field(discriminator="type"),
+]
+
+
 class ChatBlock(BaseModel):
     """Block/unblock user in chat."""
 
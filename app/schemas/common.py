@@ -2,23 +2,143 @@
 Common schemas used across the application.
 """
 
+import sys
 from datetime import datetime
-from typing import Generic, List, Optional, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, Iterable, List, Optional, TypeVar, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 T = TypeVar("T")
 
+_MISSING = object()
+
+# schema class -> ((field name, nested schema class or None, is list), ...)
+_ORM_FIELD_PLANS: dict[type, tuple] = {}
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: type) -> TypeAdapter:
+    """``TypeAdapter(List[schema])``, built once per schema and process."""
+    return TypeAdapter(List[schema])
+
+
+def page_count(total: int, page_size: int) -> int:
+    """Number of pages needed for ``total`` items (ceiling division)."""
+    return -(-total // page_size) if page_size > 0 else 0
+
+
+def _nested_schema(annotation: Any) -> tuple[Optional[type], bool]:
+    """Schema class inside ``annotation`` (X, Optional[X], List[X]) and whether it's a list."""
+    is_list = False
+    while get_origin(annotation) is not None:
+        if get_origin(annotation) is list:
+            is_list = True
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None, False
+        annotation = args[0]
+    if isinstance(annotation, type) and issubclass(annotation, BaseSchema):
+        return annotation, is_list
+    return None, False
+
 
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
 
     model_config = ConfigDict(
         from_attributes=True,
+        # Keep the raw str value: no Enum lookup on validation, no .value on dump
+        use_enum_values=True,
         populate_by_name=True,
     )
 
+    @classmethod
+    def validate_list(cls, rows: Iterable[Any]) -> list:
+        """Validate many ORM rows (or dicts) in one call of the cached list adapter."""
+        return list_adapter(cls).validate_python(list(rows), from_attributes=True)
+
+    def model_dump_unset(self) -> dict:
+        """
+        ``model_dump(exclude_unset=True)`` for flat update schemas.
+
+        Reads only the fields the client sent instead of walking every
+        field; values are returned as-is, so use it only where no field
+        is a nested model.
+        """
+        return {name: getattr(self, name) for name in self.model_fields_set}
+
+    @classmethod
+    def _orm_field_plan(cls) -> tuple:
+        plan = _ORM_FIELD_PLANS.get(cls)
+        if plan is None:
+            # Interned names keep the getattr/dict-key lookups on the
+            # pointer-comparison fast path for every row.
+            plan = _ORM_FIELD_PLANS[cls] = tuple(
+                (sys.intern(name), *_nested_schema(field.annotation))
+                for name, field in cls.model_fields.items()
+            )
+        return plan
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """
+        Build the schema from a trusted ORM object without validation.
+
+        Reads the same attributes as ``model_validate`` (from_attributes),
+        building nested schemas the same way, then uses ``model_construct``.
+        Only for rows loaded from our own database: types are not checked.
+        """
+        plan = cls._orm_field_plan()
+        data = {}
+        for name, nested, is_list in plan:
+            value = getattr(obj, name, _MISSING)
+            if value is _MISSING:
+                continue
+            if nested is not None and value is not None:
+                if is_list:
+                    value = [nested.from_orm_fast(item) for item in value]
+                else:
+                    value = nested.from_orm_fast(value)
+            data[name] = value
+        return cls.model_construct(**data)
+
+    @classmethod
+    def orm_dict(cls, obj: Any) -> dict:
+        """
+        Like ``from_orm_fast``, but produce the plain dict the schema would dump.
+
+        For read paths that encode straight to JSON and never need the model.
+        Fields the object lacks get the schema default.
+        """
+        data = {}
+        for name, nested, is_list in cls._orm_field_plan():
+            value = getattr(obj, name, _MISSING)
+            if value is _MISSING:
+                value = cls.model_fields[name].get_default(call_default_factory=True)
+            elif nested is not None and value is not None:
+                if is_list:
+                    value = [nested.orm_dict(item) for item in value]
+                else:
+                    value = nested.orm_dict(value)
+            data[name] = value
+        return data
+
+
+class FrozenSchema(BaseSchema):
+    """
+    Read-only response schema.
+
+    Instances are immutable (use ``model_copy(update=...)`` to derive one)
+    and unknown attributes are ignored rather than tracked.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+    )
+
 
 class TimestampSchema(BaseSchema):
     """Schema with timestamp fields."""
@@ -35,6 +155,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int
     page_size: int
     pages: int
+    # Keyset cursor for the next page, where the endpoint supports one
+    next_cursor: Optional[str] = None
 
     @classmethod
     def create(
@@ -44,15 +166,50 @@ class PaginatedResponse(BaseModel, Generic[T]):
         page: int,
         page_size: int,
     ) -> "PaginatedResponse[T]":
-        pages = (total + page_size - 1) // page_size if page_size > 0 else 0
-        return cls(
+        # Items are schema instances built upstream; don't validate them again
+        return cls.create_unvalidated(items, total, page, page_size)
+
+    @classmethod
+    def create_unvalidated(
+        cls,
+        items: List[T],
+        total: int,
+        page: int,
+        page_size: int,
+        next_cursor: Optional[str] = None,
+    ) -> "PaginatedResponse[T]":
+        """Build a page from trusted ``items`` (already built from DB rows)."""
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
-            pages=pages,
+            pages=page_count(total, page_size),
+            next_cursor=next_cursor,
         )
 
+    @classmethod
+    def from_orm_rows(
+        cls,
+        schema: type,
+        rows: Iterable[Any],
+        total: int,
+        page: int,
+        page_size: int,
+        trusted: bool = False,
+    ) -> "PaginatedResponse[T]":
+        """
+        Build a page of ``schema`` items straight from ORM rows.
+
+        Rows are validated in a single call of the cached list adapter;
+        ``trusted=True`` skips validation and uses ``from_orm_fast``.
+        """
+        if trusted:
+            items = [schema.from_orm_fast(row) for row in rows]
+        else:
+            items = schema.validate_list(rows)
+        return cls.create_unvalidated(items, total, page, page_size)
+
 
 class MessageOut(BaseModel):
     """Simple message response."""
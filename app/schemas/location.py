@@ -4,7 +4,7 @@ Location schemas.
 
 from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.schemas.common import BaseSchema
 
@@ -23,6 +23,8 @@ class CountryResponse(BaseSchema):
 class CountryCreate(BaseModel):
     """Create country."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     slug: str
     code: str
@@ -44,6 +46,8 @@ class RegionResponse(BaseSchema):
 class RegionCreate(BaseModel):
     """Create region."""
 
+    model_config = ConfigDict(defer_build=True)
+
     country_id: int
     name: str
     slug: str
@@ -66,6 +70,8 @@ class CityResponse(BaseSchema):
 class CityCreate(BaseModel):
     """Create city."""
 
+    model_config = ConfigDict(defer_build=True)
+
     region_id: int
     name: str
     slug: str
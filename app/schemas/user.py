@@ -3,15 +3,33 @@ User-related schemas for authentication and profile management.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
-import phonenumbers
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from app.models.user import UserRole, AccountType
 from app.schemas.common import BaseSchema, TimestampSchema
 
 
+@lru_cache(maxsize=10_000)
+def _parse_phone(v: str, region: str) -> str:
+    """Normalize a phone number to E.164 (cached; raises ValueError if invalid)."""
+    # Imported on first use: phonenumbers loads its region metadata on import
+    import phonenumbers
+
+    try:
+        parsed = phonenumbers.parse(v, region)
+    except phonenumbers.NumberParseException:
+        raise ValueError("Invalid phone number format")
+    if not phonenumbers.is_valid_number(parsed):
+        raise ValueError("Invalid phone number")
+    return phonenumbers.format_number(
+        parsed,
+        phonenumbers.PhoneNumberFormat.E164,
+    )
+
+
 class UserCreate(BaseModel):
     """Schema for user registration."""
 
@@ -27,16 +45,7 @@ class UserCreate(BaseModel):
     def validate_phone(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        try:
-            parsed = phonenumbers.parse(v, "RU")
-            if not phonenumbers.is_valid_number(parsed):
-                raise ValueError("Invalid phone number")
-            return phonenumbers.format_number(
-                parsed,
-                phonenumbers.PhoneNumberFormat.E164,
-            )
-        except phonenumbers.NumberParseException:
-            raise ValueError("Invalid phone number format")
+        return _parse_phone(v, "RU")
 
     @field_validator("accept_terms")
     @classmethod
@@ -53,7 +62,7 @@ class UserLogin(BaseModel):
     password: str
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(BaseSchema):
     """Schema for updating user profile."""
 
     name: Optional[str] = Field(None, min_length=2, max_length=100)
@@ -189,6 +198,8 @@ class RefreshTokenResponse(BaseModel):
 class SessionResponse(BaseSchema):
     """Schema for user session info."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: int
     user_agent: Optional[str] = None
     ip_address: Optional[str] = None
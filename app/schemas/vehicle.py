@@ -4,7 +4,7 @@ Vehicle reference schemas.
 
 from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.schemas.common import BaseSchema
 
@@ -96,6 +96,18 @@ class GenerationCreate(BaseModel):
     sort_order: int = 0
 
 
+class ModificationSummaryResponse(BaseSchema):
+    """Modification as listed for a generation (pick list, no full specs)."""
+
+    id: int
+    generation_id: int
+    name: str
+    slug: str
+    engine_type: Optional[str] = None
+    engine_power_hp: Optional[int] = None
+    fuel_type_name: Optional[str] = None
+
+
 class ModificationResponse(BaseSchema):
     """Modification response with full specs."""
 
@@ -248,6 +260,9 @@ class GenerationWithModificationsResponse(GenerationResponse):
 class VehicleFullHierarchy(BaseModel):
     """Full vehicle hierarchy for cascading selection."""
 
+    # Only ever built with model_construct from cached rows and dumped
+    model_config = ConfigDict(defer_build=True)
+
     vehicle_types: List[VehicleTypeResponse]
     brands: List[BrandResponse]
     body_types: List[BodyTypeResponse]
@@ -0,0 +1,117 @@
+"""
+User activity tracking with write-behind to PostgreSQL.
+
+Requests only record "user X was seen at T" in a Redis hash; a background
+task periodically drains the hash into a single batched UPDATE, so the
+auth path never writes to the users table.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from redis.exceptions import ResponseError
+from sqlalchemy import case, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.redis import RedisClient, CacheKeys
+from app.models.user import User
+
+
+class ActivityService:
+    """Buffers last-seen timestamps in Redis and flushes them in batches."""
+
+    def __init__(self) -> None:
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def touch(self, user_id: int) -> None:
+        """Record that a user is active right now (best effort)."""
+        try:
+            client = await RedisClient.get_client()
+            await client.hset(CacheKeys.USER_LAST_SEEN, str(user_id), int(time.time()))
+        except Exception:
+            pass  # Activity tracking must never fail a request
+
+    async def flush(self, db: AsyncSession) -> int:
+        """
+        Move buffered timestamps into users.last_seen_at.
+
+        Returns:
+            Number of users updated
+        """
+        client = await RedisClient.get_client()
+        # Same scheme as ad_view_service.flush: move the hash aside under a
+        # per-flush key and delete it only after the commit
+        processing = f"{CacheKeys.USER_LAST_SEEN}:flushing:{uuid.uuid4().hex}"
+        try:
+            await client.rename(CacheKeys.USER_LAST_SEEN, processing)
+        except ResponseError:
+            return 0  # Nothing buffered
+
+        buffered = await client.hgetall(processing)
+        last_seen = {
+            int(user_id): datetime.fromtimestamp(int(ts), timezone.utc)
+            for user_id, ts in buffered.items()
+        }
+        try:
+            await db.execute(
+                update(User)
+                .where(User.id.in_(list(last_seen)))
+                # Activity is not a profile change: keep updated_at as it is
+                .values(last_seen_at=case(last_seen, value=User.id), updated_at=User.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        except BaseException:
+            # Failed or cancelled before the commit: put the timestamps back
+            await self._restore(client, processing, buffered)
+            raise
+
+        await client.delete(processing)
+        return len(last_seen)
+
+    async def _restore(self, client, processing: str, buffered: dict) -> None:
+        """Return unflushed timestamps to the live hash and drop ``processing``."""
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                for user_id, ts in buffered.items():
+                    # A user seen again since the rename already has a newer time
+                    pipe.hsetnx(CacheKeys.USER_LAST_SEEN, user_id, ts)
+                pipe.delete(processing)
+                await pipe.execute()
+        except Exception as exc:
+            print(f"[activity_service] Failed to restore last-seen from {processing}: {exc}")
+
+    async def _run_flusher(self, interval: int) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with async_session_maker() as db:
+                    await self.flush(db)
+            except Exception as exc:
+                print(f"[activity_service] last-seen flush failed: {exc}")
+
+    def start(self, interval: int = settings.LAST_SEEN_FLUSH_INTERVAL) -> None:
+        """Start the periodic flusher (called on application startup)."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run_flusher(interval))
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out whatever is still buffered."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            # Let an interrupted flush put its timestamps back before the last one
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        try:
+            async with async_session_maker() as db:
+                await self.flush(db)
+        except Exception as exc:
+            print(f"[activity_service] last-seen flush failed: {exc}")
+
+
+activity_service = ActivityService()
@@ -0,0 +1,85 @@
+"""
+Read-through cache for full ad responses.
+
+Building an ``AdResponse`` joins a dozen tables, while ad pages are read far
+more often than they change. Responses are cached under a key that includes
+the latest ``updated_at`` of the ad and every row it embeds (seller, brand,
+city, ...), so any write to them produces a new key and stale entries are
+simply never read again (Redis expires them).
+
+A small in-process LRU sits in front of Redis so the hottest ads are served
+without a network round trip. Its entries expire after LOCAL_CACHE_TTL too.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+from app.core.redis import CacheKeys, cache_get, cache_set
+from app.schemas.ad import AdResponse
+
+
+AD_CACHE_TTL = 3600
+LOCAL_CACHE_SIZE = 4096
+LOCAL_CACHE_TTL = 60
+
+
+def ad_cache_key(ad_id: int, version_at: datetime) -> str:
+    """Cache key for one version of an ad (latest ``updated_at`` of its rows)."""
+    version = int(version_at.timestamp() * 1_000_000)
+    return f"{CacheKeys.AD_DETAIL}{ad_id}:v{version}"
+
+
+class AdCache:
+    """Two-tier (process LRU, then Redis) cache of AdResponse by version key."""
+
+    def __init__(
+        self,
+        maxsize: int = LOCAL_CACHE_SIZE,
+        ttl: int = AD_CACHE_TTL,
+        local_ttl: int = LOCAL_CACHE_TTL,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        # key -> (expires, response)
+        self._local: OrderedDict[str, tuple[float, AdResponse]] = OrderedDict()
+
+    def _remember(self, key: str, response: AdResponse) -> None:
+        self._local[key] = (time.monotonic() + self.local_ttl, response)
+        self._local.move_to_end(key)
+        if len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[AdResponse]:
+        """Get a cached response, or None on a miss (or if Redis is down)."""
+        entry = self._local.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._local.move_to_end(key)
+                return entry[1]
+            del self._local[key]
+
+        try:
+            cached = await cache_get(key)
+        except Exception as exc:
+            print(f"[ad_cache] Failed to read {key}: {exc}")
+            return None
+        if cached is None:
+            return None
+
+        response = AdResponse.model_validate_json(cached)
+        self._remember(key, response)
+        return response
+
+    async def set(self, key: str, response: AdResponse) -> None:
+        """Store a response in both tiers."""
+        self._remember(key, response)
+        try:
+            await cache_set(key, response.model_dump_json(), self.ttl)
+        except Exception as exc:
+            print(f"[ad_cache] Failed to write {key}: {exc}")
+
+
+ad_cache = AdCache()
@@ -0,0 +1,82 @@
+"""
+Refresh of the ad_list_mv materialized view.
+
+The public ad list reads from ad_list_mv, so new, edited and sold ads show
+up there after at most one refresh interval. CONCURRENTLY keeps the view
+readable while it is rebuilt.
+
+Every worker process runs the service, but only the one holding a
+PostgreSQL advisory lock refreshes: the view is rebuilt once per interval,
+not once per worker. The others keep trying for the lock, so one of them
+takes over when the refreshing worker goes away.
+"""
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engine
+
+
+# pg_advisory_lock key of the refreshing worker
+AD_LIST_REFRESH_LOCK = 0x61645F6C6973  # "ad_lis"
+
+
+class AdListViewService:
+    """Periodically refreshes the ad list materialized view."""
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self, conn) -> None:
+        """Rebuild ad_list_mv from the live tables."""
+        await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY ad_list_mv"))
+        await conn.commit()
+
+    async def _run(self, interval: int) -> None:
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    # Session-level lock: held as long as this connection is
+                    # kept, across the refresh transactions below
+                    leader = await conn.scalar(
+                        text("SELECT pg_try_advisory_lock(:key)"),
+                        {"key": AD_LIST_REFRESH_LOCK},
+                    )
+                    await conn.commit()
+                    if leader:
+                        try:
+                            while True:
+                                await asyncio.sleep(interval)
+                                await self.refresh(conn)
+                        finally:
+                            # The connection goes back to the pool, which
+                            # would keep the lock
+                            await conn.rollback()
+                            await conn.execute(
+                                text("SELECT pg_advisory_unlock(:key)"),
+                                {"key": AD_LIST_REFRESH_LOCK},
+                            )
+                            await conn.commit()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                print(f"[ad_list_service] view refresh failed: {exc}")
+            # Another worker refreshes (or ours failed): try again later
+            await asyncio.sleep(interval)
+
+    def start(self, interval: int = settings.AD_LIST_MV_REFRESH_INTERVAL) -> None:
+        """Start the periodic refresh (called on application startup)."""
+        if self._task is None and settings.AD_LIST_MV_ENABLED:
+            self._task = asyncio.create_task(self._run(interval))
+
+    def stop(self) -> None:
+        """Stop the periodic refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+ad_list_view_service = AdListViewService()
@@ -0,0 +1,176 @@
+"""
+Ad view counting with write-behind to PostgreSQL.
+
+Every ad page view used to run ``UPDATE ads SET views_count = views_count + 1``,
+taking a row lock on the hottest ads. Views are now counted in Redis and
+a background task adds the accumulated deltas to ``ads.views_count`` in one
+batched UPDATE per flush.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from redis.exceptions import ResponseError
+from sqlalchemy import Integer, column, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.redis import RedisClient, CacheKeys
+from app.models.ad import Ad
+
+
+# Per-day counters back the today/week/month stats
+DAY_KEY_TTL = 32 * 24 * 3600
+FLUSH_CHUNK_SIZE = 1000
+
+
+def _day_key(day: datetime) -> str:
+    return f"{CacheKeys.AD_VIEWS_DAY}{day:%Y%m%d}"
+
+
+class AdViewService:
+    """Buffers ad view counts in Redis and flushes them in batches."""
+
+    def __init__(self) -> None:
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def record_view(self, ad_id: int) -> int:
+        """
+        Count one view of an ad.
+
+        Returns:
+            Views recorded since the last flush (including this one), to be
+            added to ``ads.views_count`` when displaying it; 0 if Redis is down
+        """
+        day_key = _day_key(datetime.now(timezone.utc))
+        try:
+            client = await RedisClient.get_client()
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hincrby(CacheKeys.AD_VIEWS, str(ad_id), 1)
+                pipe.zincrby(day_key, 1, str(ad_id))
+                pipe.expire(day_key, DAY_KEY_TTL)
+                pending, _, _ = await pipe.execute()
+            return int(pending)
+        except Exception as exc:
+            print(f"[ad_view_service] Failed to record view: {exc}")
+            return 0
+
+    async def get_pending_views(self, ad_id: int) -> int:
+        """Views recorded since the last flush."""
+        try:
+            client = await RedisClient.get_client()
+            return int(await client.hget(CacheKeys.AD_VIEWS, str(ad_id)) or 0)
+        except Exception:
+            return 0
+
+    async def get_period_views(self, ad_id: int) -> Optional[dict[str, int]]:
+        """
+        Views for today, the last 7 days and the last 30 days.
+
+        Returns:
+            Dict with ``today``, ``week`` and ``month``, or None if Redis is
+            unavailable
+        """
+        today = datetime.now(timezone.utc)
+        try:
+            client = await RedisClient.get_client()
+            async with client.pipeline(transaction=False) as pipe:
+                for days_ago in range(30):
+                    pipe.zscore(_day_key(today - timedelta(days=days_ago)), str(ad_id))
+                scores = [int(score or 0) for score in await pipe.execute()]
+        except Exception as exc:
+            print(f"[ad_view_service] Failed to read view stats: {exc}")
+            return None
+        return {
+            "today": scores[0],
+            "week": sum(scores[:7]),
+            "month": sum(scores),
+        }
+
+    async def flush(self, db: AsyncSession) -> int:
+        """
+        Add buffered views to ads.views_count.
+
+        Returns:
+            Number of ads updated
+        """
+        client = await RedisClient.get_client()
+        # Move the buffer aside (new views start a fresh hash) and only delete
+        # it once the UPDATE is committed; the key is unique per flush, so
+        # flushers in other workers never pick up the same views
+        processing = f"{CacheKeys.AD_VIEWS}:flushing:{uuid.uuid4().hex}"
+        try:
+            await client.rename(CacheKeys.AD_VIEWS, processing)
+        except ResponseError:
+            return 0  # Nothing buffered
+
+        buffered = await client.hgetall(processing)
+        deltas = [(int(ad_id), int(count)) for ad_id, count in buffered.items()]
+        try:
+            for start in range(0, len(deltas), FLUSH_CHUNK_SIZE):
+                # UPDATE ads SET views_count = views_count + v.delta
+                # FROM (VALUES ...) AS v(id, delta) WHERE ads.id = v.id
+                v = values(
+                    column("id", Integer),
+                    column("delta", Integer),
+                    name="v",
+                ).data(deltas[start:start + FLUSH_CHUNK_SIZE])
+                await db.execute(
+                    update(Ad)
+                    .where(Ad.id == v.c.id)
+                    # A view is not an edit: keep updated_at as it is
+                    .values(views_count=Ad.views_count + v.c.delta, updated_at=Ad.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+        except BaseException:
+            # Failed or cancelled before the commit: give the views back
+            await self._restore(client, processing, deltas)
+            raise
+
+        await client.delete(processing)
+        return len(deltas)
+
+    async def _restore(self, client, processing: str, deltas: list[tuple[int, int]]) -> None:
+        """Add unflushed deltas back onto the live buffer and drop ``processing``."""
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                for ad_id, count in deltas:
+                    pipe.hincrby(CacheKeys.AD_VIEWS, str(ad_id), count)
+                pipe.delete(processing)
+                await pipe.execute()
+        except Exception as exc:
+            print(f"[ad_view_service] Failed to restore views from {processing}: {exc}")
+
+    async def _run_flusher(self, interval: int) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with async_session_maker() as db:
+                    await self.flush(db)
+            except Exception as exc:
+                print(f"[ad_view_service] views flush failed: {exc}")
+
+    def start(self, interval: int = settings.AD_VIEWS_FLUSH_INTERVAL) -> None:
+        """Start the periodic flusher (called on application startup)."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run_flusher(interval))
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out whatever is still buffered."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            # Let an interrupted flush put its views back before the last one
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        try:
+            async with async_session_maker() as db:
+                await self.flush(db)
+        except Exception as exc:
+            print(f"[ad_view_service] views flush failed: {exc}")
+
+
+ad_view_service = AdViewService()
@@ -0,0 +1,251 @@
+"""
+In-process cache of the vehicle reference tables.
+
+Vehicle types, brands, models, generations and the small spec lookups
+(body types, transmissions, ...) change rarely but are read on almost every
+form and filter sidebar. Each table is loaded once, kept for
+CATALOG_CACHE_TTL seconds and dropped early when it changes. Session hooks
+notice every ORM write to a catalog table (REST endpoints, sqladmin views,
+bulk UPDATE/DELETE statements) and send a PostgreSQL NOTIFY inside the
+writing transaction, so every worker process drops its copy once the change
+commits, and nobody does if it rolls back.
+
+The combined /references payload is also kept encoded, with an ETag derived
+from its bytes, so repeat requests skip the database, pydantic and JSON
+encoding entirely.
+"""
+
+import asyncio
+import hashlib
+import time
+from itertools import chain
+from typing import Any, Optional
+
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.vehicle import (
+    VehicleType,
+    Brand,
+    Model,
+    Generation,
+    BodyType,
+    Transmission,
+    FuelType,
+    DriveType,
+    Color,
+)
+from app.schemas.vehicle import (
+    VehicleTypeResponse,
+    BrandResponse,
+    ModelResponse,
+    GenerationResponse,
+    BodyTypeResponse,
+    TransmissionResponse,
+    FuelTypeResponse,
+    DriveTypeResponse,
+    ColorResponse,
+    VehicleFullHierarchy,
+)
+
+
+CATALOG_CHANNEL = "catalog_change"
+
+# name -> (model, response schema, display order)
+CATALOG_TABLES: dict[str, tuple[Any, Any, tuple]] = {
+    "vehicle_types": (VehicleType, VehicleTypeResponse, (VehicleType.sort_order, VehicleType.name)),
+    "brands": (Brand, BrandResponse, (Brand.sort_order, Brand.name)),
+    "models": (Model, ModelResponse, (Model.sort_order, Model.name)),
+    "generations": (Generation, GenerationResponse, (Generation.year_start.desc(), Generation.sort_order)),
+    "body_types": (BodyType, BodyTypeResponse, (BodyType.sort_order, BodyType.name)),
+    "transmissions": (Transmission, TransmissionResponse, (Transmission.sort_order,)),
+    "fuel_types": (FuelType, FuelTypeResponse, (FuelType.sort_order,)),
+    "drive_types": (DriveType, DriveTypeResponse, (DriveType.sort_order,)),
+    "colors": (Color, ColorResponse, (Color.sort_order, Color.name)),
+}
+
+# Tables making up the /references payload
+REFERENCE_TABLES = (
+    "vehicle_types",
+    "brands",
+    "body_types",
+    "transmissions",
+    "fuel_types",
+    "drive_types",
+    "colors",
+)
+
+
+class CatalogCache:
+    """Caches the active rows of each reference table as response schemas."""
+
+    def __init__(self, ttl: int = settings.CATALOG_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, list]] = {}
+        # (expires, body, etag) of the encoded VehicleFullHierarchy
+        self._references: Optional[tuple[float, bytes, str]] = None
+        self._listener: Optional[asyncio.Task] = None
+        # Bumped by every invalidation, so a build that raced one is not kept
+        self._generation = 0
+
+    async def get(self, db: AsyncSession, name: str) -> list:
+        """
+        Get all active rows of a reference table, in display order.
+
+        Args:
+            name: Key of CATALOG_TABLES, e.g. "brands"
+        """
+        return (await self._get_entry(db, name))[1]
+
+    async def _get_entry(self, db: AsyncSession, name: str) -> tuple[float, list]:
+        """The (expires, items) entry of a reference table, loading it if needed."""
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry
+
+        generation = self._generation
+        model, schema, order_by = CATALOG_TABLES[name]
+        # Only the schema's columns, as plain rows: no ORM objects to build
+        # for tables that are read wholesale
+        columns = [model.__table__.c[field] for field in schema.model_fields]
+        result = await db.execute(
+            select(*columns).where(model.is_active == True).order_by(*order_by)
+        )
+        items = schema.validate_list(result.all())
+        entry = (time.monotonic() + self.ttl, items)
+        # Rows read before a concurrent invalidation may be stale: serve, don't keep
+        if generation == self._generation:
+            self._entries[name] = entry
+        return entry
+
+    async def get_references(self, db: AsyncSession) -> tuple[bytes, str]:
+        """
+        Get the encoded VehicleFullHierarchy and its (strong) ETag.
+
+        The ETag is a digest of the body, so every worker serving the same
+        catalog hands out the same tag.
+        """
+        entry = self._references
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1], entry[2]
+
+        generation = self._generation
+        entries = {name: await self._get_entry(db, name) for name in REFERENCE_TABLES}
+        tables = {name: items for name, (_, items) in entries.items()}
+        tables["brands"] = [b for b in tables["brands"] if b.is_popular]
+        body = VehicleFullHierarchy.model_construct(**tables).model_dump_json().encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+        # Serve it, but only keep it if no table changed while loading the
+        # others, and never beyond the table entries it was built from
+        if generation == self._generation:
+            expires = min(expires for expires, _ in entries.values())
+            self._references = (expires, body, etag)
+        return body, etag
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one table (or everything) from this process's cache."""
+        self._generation += 1
+        if name is None or name in REFERENCE_TABLES:
+            self._references = None
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(name, None)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.invalidate(payload or None)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    raw_connection = (await conn.get_raw_connection()).driver_connection
+                    closed = asyncio.Event()
+                    raw_connection.add_termination_listener(lambda _: closed.set())
+                    await raw_connection.add_listener(CATALOG_CHANNEL, self._on_notify)
+                    try:
+                        # Anything may have changed while we were not listening
+                        self.invalidate()
+                        await closed.wait()
+                    finally:
+                        if not raw_connection.is_closed():
+                            await raw_connection.remove_listener(CATALOG_CHANNEL, self._on_notify)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                print(f"[catalog_cache] listener failed: {exc}")
+            # Connection lost: fall back to the TTL until we reconnect
+            await asyncio.sleep(5)
+
+    def start(self) -> None:
+        """Start listening for catalog changes (called on application startup)."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    def stop(self) -> None:
+        """Stop listening for catalog changes."""
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+
+catalog_cache = CatalogCache()
+
+
+# ============ Change tracking ============
+
+CATALOG_TABLE_NAMES = {model.__table__: name for name, (model, _, _) in CATALOG_TABLES.items()}
+
+# session.info key: catalog tables written in the current transaction
+CHANGED_KEY = "catalog_changed"
+
+
+def _record_changes(session: Session, names: set[str]) -> None:
+    """NOTIFY the changed tables on the session's transaction (sent on commit)."""
+    changed = session.info.setdefault(CHANGED_KEY, set())
+    names = names - changed
+    if not names:
+        return
+    changed.update(names)
+    connection = session.connection()
+    for name in names:
+        connection.execute(
+            text("SELECT pg_notify(:channel, :name)"),
+            {"channel": CATALOG_CHANNEL, "name": name},
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _catalog_after_flush(session: Session, flush_context) -> None:
+    names = {
+        CATALOG_TABLE_NAMES[obj.__table__]
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if getattr(obj, "__table__", None) in CATALOG_TABLE_NAMES
+    }
+    if names:
+        _record_changes(session, names)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _catalog_orm_execute(state: ORMExecuteState) -> None:
+    # insert(Brand), update(Brand), delete(Brand) bypass the flush
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    if mapper is not None and mapper.local_table in CATALOG_TABLE_NAMES:
+        _record_changes(state.session, {CATALOG_TABLE_NAMES[mapper.local_table]})
+
+
+@event.listens_for(Session, "after_commit")
+def _catalog_after_commit(session: Session) -> None:
+    # The listener will get the NOTIFY too; drop this process's copy right away
+    for name in session.info.pop(CHANGED_KEY, ()):
+        catalog_cache.invalidate(name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _catalog_after_rollback(session: Session) -> None:
+    session.info.pop(CHANGED_KEY, None)
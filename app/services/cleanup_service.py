@@ -0,0 +1,163 @@
+"""
+Periodic cleanup of expired auth rows and listings.
+
+Expired sessions, verification codes and reset tokens are never read
+again, but they keep the token/phone/hash indexes growing. They are
+deleted in bounded batches so a single run never holds long locks.
+
+Active ads past their ``expires_at`` are moved to EXPIRED the same way,
+which drops them from the partial "live" indexes and the ad list view
+that the public listing scans.
+
+Each run also makes sure the monthly moderation_logs partitions exist a
+few months ahead, so log rows never pile up in the DEFAULT partition.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, or_, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.ad import Ad, AdStatus
+from app.models.moderation import (
+    moderation_log_attach_partition_ddl,
+    moderation_log_partition_name,
+)
+from app.models.user import (
+    UserSession,
+    EmailVerification,
+    PhoneVerification,
+    PasswordReset,
+)
+
+
+class CleanupService:
+    """Deletes expired auth rows and expires listings in batches."""
+
+    def __init__(self, batch_size: int = settings.CLEANUP_BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    async def _in_batches(self, db: AsyncSession, statement, model, condition) -> int:
+        """Run ``statement`` WHERE id IN (SELECT id ... LIMIT n) until nothing matches."""
+        total = 0
+        while True:
+            batch = select(model.id).where(condition).limit(self.batch_size)
+            result = await db.execute(
+                statement
+                .where(model.id.in_(batch.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            total += result.rowcount
+            if result.rowcount < self.batch_size:
+                return total
+
+    async def _delete_in_batches(self, db: AsyncSession, model, condition) -> int:
+        """DELETE matching rows in batches."""
+        return await self._in_batches(db, delete(model), model, condition)
+
+    async def purge_expired(self, db: AsyncSession) -> dict[str, int]:
+        """
+        Remove expired sessions, verifications and password resets.
+
+        Returns:
+            Number of deleted rows per table
+        """
+        now = datetime.now(timezone.utc)
+        session_cutoff = now - timedelta(days=settings.SESSION_RETENTION_DAYS)
+
+        return {
+            "user_sessions": await self._delete_in_batches(
+                db,
+                UserSession,
+                or_(
+                    UserSession.expires_at < session_cutoff,
+                    (UserSession.revoked == True) & (UserSession.revoked_at < session_cutoff),
+                ),
+            ),
+            "email_verifications": await self._delete_in_batches(
+                db, EmailVerification, EmailVerification.expires_at < now
+            ),
+            "phone_verifications": await self._delete_in_batches(
+                db, PhoneVerification, PhoneVerification.expires_at < now
+            ),
+            "password_resets": await self._delete_in_batches(
+                db, PasswordReset, PasswordReset.expires_at < now
+            ),
+        }
+
+    async def expire_ads(self, db: AsyncSession) -> int:
+        """
+        Move active ads whose ``expires_at`` has passed to EXPIRED.
+
+        Returns:
+            Number of expired ads
+        """
+        return await self._in_batches(
+            db,
+            update(Ad).values(status=AdStatus.EXPIRED),
+            Ad,
+            (Ad.status == AdStatus.ACTIVE)
+            & Ad.deleted_at.is_(None)
+            & (Ad.expires_at < datetime.now(timezone.utc)),
+        )
+
+    async def _missing_table(self, db: AsyncSession, name: str) -> bool:
+        return await db.scalar(text("SELECT to_regclass(:name)"), {"name": name}) is None
+
+    async def ensure_moderation_log_partitions(
+        self,
+        db: AsyncSession,
+        months_ahead: int = settings.MODERATION_LOG_PARTITIONS_AHEAD,
+    ) -> list[str]:
+        """
+        Create missing moderation_logs partitions up to ``months_ahead``
+        months from now.
+
+        Returns:
+            Names of the created partitions
+        """
+        created = []
+        month = datetime.now(timezone.utc).date().replace(day=1)
+        for _ in range(months_ahead + 1):
+            name = moderation_log_partition_name(month)
+            if await self._missing_table(db, name):
+                # Serializes with inserts and with other workers' cleanup runs
+                await db.execute(text("LOCK TABLE moderation_logs_default IN SHARE ROW EXCLUSIVE MODE"))
+                if await self._missing_table(db, name):
+                    for statement in moderation_log_attach_partition_ddl(month):
+                        await db.execute(text(statement))
+                    created.append(name)
+                await db.commit()
+            month = (month + timedelta(days=32)).replace(day=1)
+        return created
+
+    async def _run(self, interval: int) -> None:
+        while True:
+            try:
+                async with async_session_maker() as db:
+                    await self.ensure_moderation_log_partitions(db)
+                    await self.purge_expired(db)
+                    await self.expire_ads(db)
+            except Exception as exc:
+                print(f"[cleanup_service] cleanup failed: {exc}")
+            await asyncio.sleep(interval)
+
+    def start(self, interval: int = settings.CLEANUP_INTERVAL) -> None:
+        """Start the periodic cleanup (called on application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(interval))
+
+    def stop(self) -> None:
+        """Stop the periodic cleanup."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+cleanup_service = CleanupService()
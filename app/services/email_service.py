@@ -3,16 +3,26 @@
 This service will not raise if SMTP is not configured. It lazy-imports
 optional dependencies so the app can run without installing them.
 """
+from email.message import EmailMessage
 from typing import Optional
 import asyncio
 
 from app.core.config import settings
 
 
+VERIFICATION_SUBJECT = "AVTO LAIF — Подтвердите email"
+VERIFICATION_TEMPLATE = "<p>Здравствуйте, {name}.</p><p>Чтобы подтвердить email, перейдите по ссылке: <a href='{frontend_url}/verify-email?token={token}'>подтвердить</a></p>"
+PASSWORD_RESET_SUBJECT = "AVTO LAIF — Сброс пароля"
+PASSWORD_RESET_TEMPLATE = "<p>Здравствуйте, {name}.</p><p>Сбросить пароль: <a href='{frontend_url}/reset-password?token={token}'>ссылка</a></p>"
+WELCOME_SUBJECT = "Добро пожаловать в AVTO LAIF"
+WELCOME_TEMPLATE = "<p>Здравствуйте, {name}.</p><p>Спасибо за регистрацию на AVTO LAIF.</p>"
+
+
 class EmailService:
     """Safe email service: no-op when SMTP not configured; lazy imports.
 
-    Methods are async so they can be scheduled with `asyncio.create_task`.
+    Once `start()` has run, the send methods only enqueue the message and a
+    single worker task delivers it over one reused SMTP connection.
     """
 
     def __init__(self) -> None:
@@ -21,13 +31,32 @@ class EmailService:
         self.user = getattr(settings, "SMTP_USER", None)
         self.password = getattr(settings, "SMTP_PASSWORD", None)
         self.from_email = getattr(settings, "EMAIL_FROM", "noreply@example.com")
+        self.frontend_url = getattr(settings, "FRONTEND_URL", "")
         self.enabled = bool(self.host and self.user and self.password)
+        # One authenticated connection reused across sends; SMTP is strictly
+        # request/response, so sends on it are serialized by the lock.
+        self._client = None
+        self._lock = asyncio.Lock()
+        # Sends are queued for a single worker task once start() has run
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=getattr(settings, "EMAIL_QUEUE_SIZE", 1000))
+        self._worker: Optional[asyncio.Task] = None
+
+    async def _get_client(self):
+        """The open SMTP connection, (re)connecting and logging in if needed."""
+        import aiosmtplib
+
+        if self._client is not None and self._client.is_connected:
+            return self._client
+        client = aiosmtplib.SMTP(hostname=self.host, port=self.port, start_tls=True)
+        await client.connect()
+        await client.login(self.user, self.password)
+        self._client = client
+        return client
 
     async def _send_via_smtp(self, to_email: str, subject: str, html_body: str) -> bool:
         try:
             # Lazy import to avoid introducing a hard dependency in dev
             import aiosmtplib
-            from email.message import EmailMessage
 
             msg = EmailMessage()
             msg["From"] = self.from_email
@@ -35,45 +64,90 @@ class EmailService:
             msg["Subject"] = subject
             msg.set_content(html_body, subtype="html")
 
-            await aiosmtplib.send(
-                msg,
-                hostname=self.host,
-                port=self.port,
-                username=self.user,
-                password=self.password,
-                start_tls=True,
-            )
+            async with self._lock:
+                try:
+                    client = await self._get_client()
+                    await client.send_message(msg)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # The server dropped the idle connection; reconnect once
+                    self._client = None
+                    client = await self._get_client()
+                    await client.send_message(msg)
             return True
         except Exception as exc:  # pragma: no cover - defensive logging
             # Do not surface SMTP errors to callers; log and continue.
             print(f"[email_service] SMTP send failed: {exc}")
             return False
 
+    async def _deliver(self, to_email: str, subject: str, html_body: str) -> bool:
+        """
+        Hand a message to the sender task, or send it inline if none is running.
+
+        Enqueueing never waits: when the queue is full the message is logged
+        and dropped rather than holding up the request that produced it.
+        """
+        if self._worker is None:
+            return await self._send_via_smtp(to_email, subject, html_body)
+        try:
+            self._queue.put_nowait((to_email, subject, html_body))
+        except asyncio.QueueFull:
+            print(f"[email_service] send queue full, dropping email to {to_email}")
+            return False
+        return True
+
+    async def _run_worker(self) -> None:
+        while True:
+            to_email, subject, html_body = await self._queue.get()
+            try:
+                await self._send_via_smtp(to_email, subject, html_body)
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> None:
+        """Start the sender task (called on application startup)."""
+        if self.enabled and self._worker is None:
+            self._worker = asyncio.create_task(self._run_worker())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Send what is still queued, stop the sender task and close the connection."""
+        if self._worker is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                print(f"[email_service] {self._queue.qsize()} queued emails not sent on shutdown")
+            self._worker.cancel()
+            self._worker = None
+        client, self._client = self._client, None
+        if client is not None and client.is_connected:
+            try:
+                await client.quit()
+            except Exception as exc:
+                print(f"[email_service] SMTP quit failed: {exc}")
+
     async def send_verification_email(self, to_email: str, user_name: Optional[str], token: str) -> bool:
-        subject = "AVTO LAIF — Подтвердите email"
-        verify_url = f"{getattr(settings, 'FRONTEND_URL', '')}/verify-email?token={token}"
-        html = f"<p>Здравствуйте, {user_name or to_email}.</p><p>Чтобы подтвердить email, перейдите по ссылке: <a href='{verify_url}'>подтвердить</a></p>"
         if not self.enabled:
             print(f"[email_service] SMTP not configured — skipping verification email to {to_email}")
             return True
-        return await self._send_via_smtp(to_email, subject, html)
+        html = VERIFICATION_TEMPLATE.format_map(
+            {"name": user_name or to_email, "frontend_url": self.frontend_url, "token": token}
+        )
+        return await self._deliver(to_email, VERIFICATION_SUBJECT, html)
 
     async def send_password_reset_email(self, to_email: str, user_name: Optional[str], token: str) -> bool:
-        subject = "AVTO LAIF — Сброс пароля"
-        reset_url = f"{getattr(settings, 'FRONTEND_URL', '')}/reset-password?token={token}"
-        html = f"<p>Здравствуйте, {user_name or to_email}.</p><p>Сбросить пароль: <a href='{reset_url}'>ссылка</a></p>"
         if not self.enabled:
             print(f"[email_service] SMTP not configured — skipping password reset email to {to_email}")
             return True
-        return await self._send_via_smtp(to_email, subject, html)
+        html = PASSWORD_RESET_TEMPLATE.format_map(
+            {"name": user_name or to_email, "frontend_url": self.frontend_url, "token": token}
+        )
+        return await self._deliver(to_email, PASSWORD_RESET_SUBJECT, html)
 
     async def send_welcome_email(self, to_email: str, user_name: Optional[str]) -> bool:
-        subject = "Добро пожаловать в AVTO LAIF"
-        html = f"<p>Здравствуйте, {user_name or to_email}.</p><p>Спасибо за регистрацию на AVTO LAIF.</p>"
         if not self.enabled:
             print(f"[email_service] SMTP not configured — skipping welcome email to {to_email}")
             return True
-        return await self._send_via_smtp(to_email, subject, html)
+        html = WELCOME_TEMPLATE.format_map({"name": user_name or to_email})
+        return await self._deliver(to_email, WELCOME_SUBJECT, html)
 
 
 # Singleton instance for import
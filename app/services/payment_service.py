@@ -7,9 +7,12 @@ from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from typing import Optional, List
 import json
+import time
+from itertools import chain
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import event, select, and_, update
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from app.models.billing import (
     Tariff,
@@ -22,6 +25,17 @@ from app.models.billing import (
 )
 from app.models.ad import Ad
 from app.core.config import settings
+from app.schemas.billing import TariffResponse
+
+
+TARIFF_CACHE_TTL = 60
+
+# Ad flag set by each boost feature type
+FEATURE_FLAGS = {
+    FeatureType.FEATURED: "is_featured",
+    FeatureType.TOP: "is_top",
+    FeatureType.URGENT: "is_urgent",
+}
 
 
 class PaymentService:
@@ -30,11 +44,45 @@ class PaymentService:
     Supports multiple payment providers.
     """
 
+    def __init__(self, tariff_ttl: int = TARIFF_CACHE_TTL) -> None:
+        self.tariff_ttl = tariff_ttl
+        # (expires, id -> tariff, active tariffs in display order)
+        self._tariffs: Optional[
+            tuple[float, dict[int, TariffResponse], list[TariffResponse]]
+        ] = None
+
+    async def _load_tariffs(
+        self,
+        db: AsyncSession,
+    ) -> tuple[dict[int, TariffResponse], list[TariffResponse]]:
+        """
+        All tariffs, kept in process for ``tariff_ttl`` seconds.
+
+        The table has a handful of rows that rarely change, so it is read
+        whole instead of once per lookup. Only plain column values are
+        cached, never ORM objects owned by whichever session loaded them.
+        """
+        entry = self._tariffs
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1], entry[2]
+
+        columns = [Tariff.__table__.c[field] for field in TariffResponse.model_fields]
+        result = await db.execute(select(*columns).order_by(Tariff.sort_order, Tariff.price))
+        tariffs = TariffResponse.validate_list(result.all())
+        by_id = {tariff.id: tariff for tariff in tariffs}
+        active = [tariff for tariff in tariffs if tariff.is_active]
+        self._tariffs = (time.monotonic() + self.tariff_ttl, by_id, active)
+        return by_id, active
+
+    def invalidate_tariffs(self) -> None:
+        """Drop the cached tariffs (done on commit of any Tariff write, see below)."""
+        self._tariffs = None
+
     async def get_active_tariffs(
         self,
         db: AsyncSession,
         feature_type: Optional[FeatureType] = None,
-    ) -> List[Tariff]:
+    ) -> List[TariffResponse]:
         """
         Get active tariffs for purchase.
         
@@ -45,22 +93,15 @@ class PaymentService:
         Returns:
             List of active tariffs
         """
-        query = select(Tariff).where(Tariff.is_active == True)
-        
+        _, active = await self._load_tariffs(db)
         if feature_type:
-            query = query.where(Tariff.feature_type == feature_type)
-        
-        query = query.order_by(Tariff.sort_order, Tariff.price)
-        
-        result = await db.execute(query)
-        return result.scalars().all()
+            return [tariff for tariff in active if tariff.feature_type == feature_type]
+        return active
 
-    async def get_tariff(self, db: AsyncSession, tariff_id: int) -> Optional[Tariff]:
+    async def get_tariff(self, db: AsyncSession, tariff_id: int) -> Optional[TariffResponse]:
         """Get tariff by ID."""
-        result = await db.execute(
-            select(Tariff).where(Tariff.id == tariff_id)
-        )
-        return result.scalar_one_or_none()
+        by_id, _ = await self._load_tariffs(db)
+        return by_id.get(tariff_id)
 
     async def create_payment(
         self,
@@ -83,8 +124,8 @@ class PaymentService:
         Returns:
             Created Payment object
         """
-        # Get tariff
-        tariff = await self.get_tariff(db, tariff_id)
+        # Get tariff (from this session, not the cache: its price is charged)
+        tariff = await db.get(Tariff, tariff_id)
         if not tariff:
             raise ValueError("Tariff not found")
         
@@ -184,21 +225,27 @@ class PaymentService:
         Returns:
             True if successful
         """
+        # Payment, its ad and its tariff in one round trip
         result = await db.execute(
-            select(Payment).where(Payment.id == payment_id)
+            select(Payment, Ad, Tariff)
+            .outerjoin(Ad, Ad.id == Payment.related_ad_id)
+            .outerjoin(Tariff, Tariff.id == Payment.related_tariff_id)
+            .where(Payment.id == payment_id)
         )
-        payment = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not payment:
+        if not row:
             return False
+        payment, ad, tariff = row
         
         # Mark as completed
         payment.mark_completed()
         
-        # Create ad boost
+        # Create ad boost (activate() reads the duration from boost.tariff)
         boost = AdBoost(
             ad_id=payment.related_ad_id,
             tariff_id=payment.related_tariff_id,
+            tariff=tariff,
             payment_id=payment.id,
             amount=payment.amount,
             currency=payment.currency,
@@ -208,23 +255,15 @@ class PaymentService:
         db.add(boost)
         
         # Update ad with boost flags
-        if payment.related_ad_id:
-            result = await db.execute(
-                select(Ad).where(Ad.id == payment.related_ad_id)
-            )
-            ad = result.scalar_one_or_none()
-            
-            if ad and payment.related_tariff_id:
-                tariff = await self.get_tariff(db, payment.related_tariff_id)
-                if tariff:
-                    if tariff.feature_type == FeatureType.FEATURED:
-                        ad.is_featured = True
-                        ad.featured_until = boost.expires_at
-                    elif tariff.feature_type == FeatureType.TOP:
-                        ad.is_top = True
-                        ad.top_until = boost.expires_at
-                    elif tariff.feature_type == FeatureType.URGENT:
-                        ad.is_urgent = True
+        if ad and tariff:
+            if tariff.feature_type == FeatureType.FEATURED:
+                ad.is_featured = True
+                ad.featured_until = boost.expires_at
+            elif tariff.feature_type == FeatureType.TOP:
+                ad.is_top = True
+                ad.top_until = boost.expires_at
+            elif tariff.feature_type == FeatureType.URGENT:
+                ad.is_urgent = True
         
         await db.commit()
         return True
@@ -246,13 +285,19 @@ class PaymentService:
         Returns:
             True if successful
         """
+        # Payment with its boost, the boosted ad and the tariff in one round trip
         result = await db.execute(
-            select(Payment).where(Payment.id == payment_id)
+            select(Payment, AdBoost, Ad, Tariff)
+            .outerjoin(AdBoost, AdBoost.payment_id == Payment.id)
+            .outerjoin(Ad, Ad.id == AdBoost.ad_id)
+            .outerjoin(Tariff, Tariff.id == AdBoost.tariff_id)
+            .where(Payment.id == payment_id)
         )
-        payment = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not payment:
+        if not row:
             return False
+        payment, boost, ad, tariff = row
         
         # Call provider to refund
         # This would be provider-specific
@@ -261,30 +306,14 @@ class PaymentService:
         payment.refund(reason)
         
         # Deactivate related boost
-        result = await db.execute(
-            select(AdBoost).where(AdBoost.payment_id == payment_id)
-        )
-        boost = result.scalar_one_or_none()
-        
         if boost:
             boost.refund(reason)
             
             # Remove boost from ad
-            if boost.ad_id:
-                result = await db.execute(
-                    select(Ad).where(Ad.id == boost.ad_id)
-                )
-                ad = result.scalar_one_or_none()
-                
-                if ad:
-                    tariff = await self.get_tariff(db, boost.tariff_id)
-                    if tariff:
-                        if tariff.feature_type == FeatureType.FEATURED:
-                            ad.is_featured = False
-                        elif tariff.feature_type == FeatureType.TOP:
-                            ad.is_top = False
-                        elif tariff.feature_type == FeatureType.URGENT:
-                            ad.is_urgent = False
+            if ad and tariff:
+                flag = FEATURE_FLAGS.get(tariff.feature_type)
+                if flag:
+                    setattr(ad, flag, False)
         
         await db.commit()
         return True
@@ -331,48 +360,38 @@ class PaymentService:
         """
         now = datetime.now(timezone.utc)
         
-        result = await db.execute(
-            select(AdBoost).where(
-                and_(
-                    AdBoost.is_active == True,
-                    AdBoost.expires_at <= now,
+        expired = and_(AdBoost.is_active == True, AdBoost.expires_at <= now)
+        
+        # Clear each ad flag straight from the expired boosts (one
+        # UPDATE ads ... FROM ad_boosts, tariffs per feature type), then
+        # deactivate the boosts themselves; no rows come back to Python
+        for feature_type, flag in FEATURE_FLAGS.items():
+            await db.execute(
+                update(Ad)
+                .where(
+                    Ad.id == AdBoost.ad_id,
+                    AdBoost.tariff_id == Tariff.id,
+                    Tariff.feature_type == feature_type,
+                    expired,
                 )
+                .values({flag: False})
+                .execution_options(synchronize_session=False)
             )
+        result = await db.execute(
+            update(AdBoost)
+            .where(expired)
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
         )
-        boosts = result.scalars().all()
-        
-        count = 0
-        for boost in boosts:
-            boost.deactivate()
-            
-            # Remove boost flags from ad
-            result = await db.execute(
-                select(Ad).where(Ad.id == boost.ad_id)
-            )
-            ad = result.scalar_one_or_none()
-            
-            if ad:
-                tariff = await self.get_tariff(db, boost.tariff_id)
-                if tariff:
-                    if tariff.feature_type == FeatureType.FEATURED:
-                        ad.is_featured = False
-                    elif tariff.feature_type == FeatureType.TOP:
-                        ad.is_top = False
-                    elif tariff.feature_type == FeatureType.URGENT:
-                        ad.is_urgent = False
-            
-            count += 1
         
-        if count > 0:
-            await db.commit()
-        
-        return count
+        await db.commit()
+        return result.rowcount
 
     async def create_invoice(
         self,
         db: AsyncSession,
         payment_id: int,
-        invoice_number: str,
+        invoice_number: Optional[str] = None,
     ) -> Optional[Invoice]:
         """
         Create invoice for payment.
@@ -380,7 +399,9 @@ class PaymentService:
         Args:
             db: Database session
             payment_id: Payment to invoice
-            invoice_number: Invoice number
+            invoice_number: Explicit invoice number (optional). When omitted
+                the database assigns the next number from ``invoice_seq``
+                and returns it from the INSERT.
         
         Returns:
             Created Invoice object
@@ -395,7 +416,6 @@ class PaymentService:
         
         invoice = Invoice(
             payment_id=payment_id,
-            invoice_number=invoice_number,
             amount=payment.amount,
             currency=payment.currency,
             issued_at=datetime.now(timezone.utc),
@@ -403,6 +423,9 @@ class PaymentService:
             paid_at=payment.completed_at,
         )
         
+        if invoice_number:
+            invoice.invoice_number = invoice_number
+        
         db.add(invoice)
         await db.commit()
         
@@ -410,4 +433,34 @@ class PaymentService:
 
 
 # Global payment service instance
-payment_service = PaymentService()
\ No newline at end of file
+payment_service = PaymentService()
+
+
+# Drop the cached tariffs whenever a transaction that wrote to the table
+# commits, whichever code path (endpoint, admin, script) made the change.
+# Other workers pick the change up within TARIFF_CACHE_TTL.
+TARIFFS_CHANGED_KEY = "tariffs_changed"
+
+
+@event.listens_for(Session, "after_flush")
+def _tariffs_after_flush(session: Session, flush_context) -> None:
+    if any(isinstance(obj, Tariff) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info[TARIFFS_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _tariffs_orm_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        if state.bind_mapper is not None and state.bind_mapper.class_ is Tariff:
+            state.session.info[TARIFFS_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _tariffs_after_commit(session: Session) -> None:
+    if session.info.pop(TARIFFS_CHANGED_KEY, False):
+        payment_service.invalidate_tariffs()
+
+
+@event.listens_for(Session, "after_rollback")
+def _tariffs_after_rollback(session: Session) -> None:
+    session.info.pop(TARIFFS_CHANGED_KEY, None)
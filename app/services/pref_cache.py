@@ -0,0 +1,79 @@
+"""
+Redis cache of notification channel preferences.
+
+Preferences change a few times a year but are read for every notification,
+so they are served from Redis keyed by user id. Whatever changes a
+NotificationPreference row calls ``invalidate_prefs`` after its commit (the
+PATCH /notifications/preferences endpoint); a row created with the defaults
+needs nothing, since a missing row is cached as DEFAULT_PREFERENCES.
+"""
+
+from typing import Optional
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import CacheKeys, cache_get, cache_set, cache_delete
+from app.models.notification import NotificationPreference
+
+
+PREFERENCES_CACHE_TTL = 3600
+DEFAULT_PREFERENCES = {"email": True, "sms": False, "push": True}
+
+
+def prefs_cache_key(user_id: int) -> str:
+    return f"{CacheKeys.NOTIFICATION_PREFS}{user_id}"
+
+
+async def cached_prefs(user_id: int) -> Optional[dict[str, bool]]:
+    """Channel preferences from Redis only; None on a miss or when Redis is down."""
+    try:
+        cached = await cache_get(prefs_cache_key(user_id))
+    except Exception:
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+async def load_prefs(db: AsyncSession, user_id: int) -> dict[str, bool]:
+    """
+    Channel preferences from the database, stored in Redis for next time.
+
+    Falls back to DEFAULT_PREFERENCES when the user has no preference row.
+    """
+    result = await db.execute(
+        select(
+            NotificationPreference.email,
+            NotificationPreference.sms,
+            NotificationPreference.push,
+        ).where(NotificationPreference.user_id == user_id)
+    )
+    row = result.one_or_none()
+    prefs = dict(row._mapping) if row else dict(DEFAULT_PREFERENCES)
+
+    try:
+        await cache_set(prefs_cache_key(user_id), orjson.dumps(prefs).decode(), PREFERENCES_CACHE_TTL)
+    except Exception:
+        pass
+    return prefs
+
+
+async def get_prefs(db: AsyncSession, user_id: int) -> dict[str, bool]:
+    """
+    Channel preferences of a user, served from Redis when possible.
+
+    Falls back to the database on a cache miss (or when Redis is down).
+    """
+    prefs = await cached_prefs(user_id)
+    if prefs is None:
+        prefs = await load_prefs(db, user_id)
+    return prefs
+
+
+async def invalidate_prefs(user_id: int) -> None:
+    """Drop the cached preferences of a user (best effort)."""
+    try:
+        await cache_delete(prefs_cache_key(user_id))
+    except Exception as exc:
+        print(f"[pref_cache] Failed to invalidate preferences of user {user_id}: {exc}")
+
@@ -4,16 +4,34 @@ This module stores verification codes in-memory by default so the app can
 run without Twilio credentials. If Twilio credentials exist, it will attempt
 to send messages but won't raise on failure.
 """
-from datetime import datetime, timedelta
-import random
-from typing import Dict, Tuple
+from collections import OrderedDict
+import secrets
+import time
+from typing import Tuple
 
 from app.core.config import settings
 from app.core.redis import RedisClient
 
 
-# In-memory store: phone -> (code, expires_at)
-_SMS_STORE: Dict[str, Tuple[str, datetime]] = {}
+SMS_STORE_SIZE = 10_000
+
+# In-memory fallback when Redis is down: phone -> (code, expires_at as
+# time.monotonic()), oldest write first
+_SMS_STORE: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+
+
+def _store_code(phone: str, code: str, ttl_seconds: int) -> None:
+    """Remember a code, evicting expired entries and the oldest beyond SMS_STORE_SIZE."""
+    now = time.monotonic()
+    _SMS_STORE.pop(phone, None)
+    _SMS_STORE[phone] = (code, now + ttl_seconds)
+    # Codes not verified would otherwise stay forever; the oldest writes
+    # sit at the front, so the sweep stops at the first live entry
+    while _SMS_STORE:
+        _, oldest_expires = next(iter(_SMS_STORE.values()))
+        if oldest_expires > now and len(_SMS_STORE) <= SMS_STORE_SIZE:
+            break
+        _SMS_STORE.popitem(last=False)
 
 
 class SmsService:
@@ -27,14 +45,14 @@ class SmsService:
         )
 
     async def send_verification_code(self, phone: str, length: int = 6, ttl_seconds: int = 300) -> str:
-        code = "".join(str(random.randint(0, 9)) for _ in range(length))
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
+        # One CSPRNG draw, zero-padded (random.randint is not meant for secrets)
+        code = f"{secrets.randbelow(10 ** length):0{length}d}"
         # Try to persist in Redis if available for cross-process safety
         try:
             client = await RedisClient.get_client()
             await client.setex(f"sms:{phone}", ttl_seconds, code)
         except Exception:
-            _SMS_STORE[phone] = (code, expires_at)
+            _store_code(phone, code, ttl_seconds)
 
         if not self.enabled:
             print(f"[sms_service] Twilio not configured — generated code for {phone}: {code}")
@@ -67,7 +85,7 @@ class SmsService:
             if not entry:
                 return False
             stored_code, expires_at = entry
-            if datetime.utcnow() > expires_at:
+            if time.monotonic() > expires_at:
                 del _SMS_STORE[phone]
                 return False
             if stored_code == code:
@@ -3,23 +3,61 @@ WebSocket service for real-time chat.
 Handles connections, message routing, and online status.
 """
 
-import json
 import asyncio
 from datetime import datetime, timezone
 from typing import Optional, Dict, Set
 from dataclasses import dataclass, field
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Integer, any_, case, column, insert, select, update, values
+from sqlalchemy.dialects.postgresql import ARRAY
 
+from app.core.config import settings
+from app.core.database import async_session_maker
 from app.core.security import verify_token_type
 from app.core.redis import RedisClient, CacheKeys
 from app.models.user import User
 from app.models.chat import Dialog, Message
+from app.schemas.chat import WSIncoming
 
 
-@dataclass
+def encode_event(event: dict) -> str:
+    """Serialize a WebSocket event once; the text can be sent to any number of sockets."""
+    return orjson.dumps(event).decode()
+
+
+incoming_adapter = TypeAdapter(WSIncoming)
+
+
+def decode_incoming(raw: str) -> Optional[dict]:
+    """
+    Parse and validate a client frame in one pass (pydantic-core).
+
+    Returns None for frames of an unknown type or with missing/mistyped
+    fields, which are ignored; raises ValueError if ``raw`` isn't JSON.
+    """
+    try:
+        return incoming_adapter.validate_json(raw)
+    except ValidationError as exc:
+        if any(error["type"] == "json_invalid" for error in exc.errors()):
+            raise ValueError("Invalid JSON") from exc
+        return None
+
+
+# Constant replies, encoded once at import
+PONG_EVENT = encode_event({"type": "pong"})
+INVALID_JSON_EVENT = encode_event({"type": "error", "message": "Invalid JSON"})
+
+
+async def send_event(websocket: WebSocket, event: dict) -> None:
+    """Send an event as a text frame (orjson instead of Starlette's json.dumps)."""
+    await websocket.send_text(encode_event(event))
+
+
+@dataclass(slots=True)
 class ConnectionInfo:
     """Information about a WebSocket connection."""
     websocket: WebSocket
@@ -44,7 +82,10 @@ class ConnectionManager:
         self.active_connections: Dict[int, list[ConnectionInfo]] = {}
         # dialog_id -> set of user_ids subscribed to this dialog
         self.dialog_subscribers: Dict[int, Set[int]] = {}
-        self._lock = asyncio.Lock()
+        # user_id -> dialog_ids the user is subscribed to (reverse of the above)
+        self.user_dialogs: Dict[int, Set[int]] = {}
+        # No lock: the maps are only changed between awaits on the event
+        # loop, so each update below runs without interruption
 
     async def connect(
         self,
@@ -63,10 +104,7 @@ class ConnectionManager:
             user_name=user_name,
         )
 
-        async with self._lock:
-            if user_id not in self.active_connections:
-                self.active_connections[user_id] = []
-            self.active_connections[user_id].append(connection)
+        self.active_connections.setdefault(user_id, []).append(connection)
 
         # Update online status in Redis
         await self._set_online_status(user_id, True)
@@ -82,53 +120,91 @@ class ConnectionManager:
         """
         user_id = connection.user_id
 
-        async with self._lock:
-            if user_id in self.active_connections:
-                self.active_connections[user_id] = [
-                    c for c in self.active_connections[user_id]
-                    if c.websocket != connection.websocket
-                ]
-                if not self.active_connections[user_id]:
-                    del self.active_connections[user_id]
-                    # Only mark offline if no connections left
-                    await self._set_online_status(user_id, False)
-                    await self._broadcast_online_status(user_id, False)
-
-            # Remove from dialog subscribers
-            for dialog_id, subscribers in list(self.dialog_subscribers.items()):
+        went_offline = False
+        connections = self.active_connections.get(user_id)
+        if connections is not None:
+            # In place: senders iterate over their own snapshot of the list
+            try:
+                connections.remove(connection)
+            except ValueError:
+                pass  # Already dropped after a failed send
+            if not connections:
+                del self.active_connections[user_id]
+                went_offline = True
+
+        # Remove from dialog subscribers (only the user's own dialogs)
+        for dialog_id in self.user_dialogs.pop(user_id, ()):
+            subscribers = self.dialog_subscribers.get(dialog_id)
+            if subscribers is not None:
                 subscribers.discard(user_id)
                 if not subscribers:
                     del self.dialog_subscribers[dialog_id]
 
+        if went_offline:
+            # Only mark offline if no connections left
+            await self._set_online_status(user_id, False)
+            await self._broadcast_online_status(user_id, False)
+
     async def subscribe_to_dialog(self, user_id: int, dialog_id: int):
         """
         Subscribe user to receive messages from a dialog.
         """
-        async with self._lock:
-            if dialog_id not in self.dialog_subscribers:
-                self.dialog_subscribers[dialog_id] = set()
-            self.dialog_subscribers[dialog_id].add(user_id)
+        self.dialog_subscribers.setdefault(dialog_id, set()).add(user_id)
+        self.user_dialogs.setdefault(user_id, set()).add(dialog_id)
 
     async def unsubscribe_from_dialog(self, user_id: int, dialog_id: int):
         """
         Unsubscribe user from a dialog.
         """
-        async with self._lock:
-            if dialog_id in self.dialog_subscribers:
-                self.dialog_subscribers[dialog_id].discard(user_id)
+        subscribers = self.dialog_subscribers.get(dialog_id)
+        if subscribers is not None:
+            subscribers.discard(user_id)
+            if not subscribers:
+                del self.dialog_subscribers[dialog_id]
+        dialogs = self.user_dialogs.get(user_id)
+        if dialogs is not None:
+            dialogs.discard(dialog_id)
+            if not dialogs:
+                del self.user_dialogs[user_id]
 
     async def send_personal_message(self, user_id: int, message: dict):
         """
         Send message to all connections of a specific user.
         """
         if user_id in self.active_connections:
-            message_text = json.dumps(message)
-            for connection in self.active_connections[user_id]:
-                try:
-                    await connection.websocket.send_text(message_text)
-                except Exception:
-                    # Connection might be closed
-                    pass
+            await self.send_personal_text(user_id, encode_event(message))
+
+    async def send_personal_text(self, user_id: int, message_text: str):
+        """
+        Send an already encoded event (see ``encode_event``) to all
+        connections of a specific user.
+        """
+        connections = list(self.active_connections.get(user_id, ()))
+        if not connections:
+            return
+        # All devices at once, so one stalled socket doesn't hold up the rest
+        results = await asyncio.gather(
+            *(connection.websocket.send_text(message_text) for connection in connections),
+            return_exceptions=True,
+        )
+        dead = [connection for connection, result in zip(connections, results) if isinstance(result, Exception)]
+        if dead:
+            # Connection was closed under us
+            await self._drop_connections(user_id, dead)
+
+    async def _drop_connections(self, user_id: int, dead: list[ConnectionInfo]):
+        """
+        Forget connections that failed a send; the user goes offline if none are left.
+        """
+        remaining = [
+            c for c in self.active_connections.get(user_id, ())
+            if not any(c is d for d in dead)
+        ]
+        if remaining:
+            self.active_connections[user_id] = remaining
+            return
+        self.active_connections.pop(user_id, None)
+        await self._set_online_status(user_id, False)
 
     async def broadcast_to_dialog(self, dialog_id: int, message: dict, exclude_user: Optional[int] = None):
         """
@@ -137,9 +213,16 @@ class ConnectionManager:
         if dialog_id not in self.dialog_subscribers:
             return
 
-        for user_id in self.dialog_subscribers[dialog_id]:
-            if user_id != exclude_user:
-                await self.send_personal_message(user_id, message)
+        # Encoded once, not once per subscriber, and sent to everyone concurrently
+        message_text = encode_event(message)
+        await asyncio.gather(
+            *(
+                self.send_personal_text(user_id, message_text)
+                for user_id in list(self.dialog_subscribers[dialog_id])
+                if user_id != exclude_user
+            ),
+            return_exceptions=True,
+        )
 
     async def send_new_message(
         self,
@@ -156,22 +239,27 @@ class ConnectionManager:
             "message": message,
         })
 
-    async def send_message_read(
+    async def send_messages_read(
         self,
         dialog_id: int,
-        message_id: int,
+        message_ids: list[int],
         reader_id: int,
         sender_id: int,
+        read_at: Optional[str] = None,
     ):
         """
-        Notify sender that message was read.
+        Notify sender that a batch of their messages was read (one event per batch).
+
+        Callers fanning out several events pass one preformatted ``read_at``.
         """
+        if read_at is None:
+            read_at = datetime.now(timezone.utc).isoformat()
         await self.send_personal_message(sender_id, {
-            "type": "message_read",
+            "type": "messages_read",
             "dialog_id": dialog_id,
-            "message_id": message_id,
+            "message_ids": message_ids,
             "reader_id": reader_id,
-            "read_at": datetime.now(timezone.utc).isoformat(),
+            "read_at": read_at,
         })
 
     async def send_typing_indicator(
@@ -194,8 +282,11 @@ class ConnectionManager:
     def is_user_online(self, user_id: int) -> bool:
         """
         Check if user has any active connections.
+
+        connect/disconnect/_drop_connections never leave an empty list
+        behind, so membership is enough.
         """
-        return user_id in self.active_connections and len(self.active_connections[user_id]) > 0
+        return user_id in self.active_connections
 
     def get_online_users(self) -> list[int]:
         """
@@ -213,9 +304,11 @@ class ConnectionManager:
             if is_online:
                 await client.set(key, "1", ex=300)  # 5 min TTL, refreshed periodically
             else:
-                await client.delete(key)
-                # Store last seen
-                await client.set(f"{key}:last_seen", datetime.now(timezone.utc).isoformat())
+                # Clear the flag and store last seen in one round trip
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.delete(key)
+                    pipe.set(f"{key}:last_seen", datetime.now(timezone.utc).isoformat())
+                    await pipe.execute()
         except Exception:
             # Redis might not be available
             pass
@@ -233,6 +326,176 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+class ReadReceiptBatcher:
+    """
+    Applies WebSocket mark_read requests in batches.
+
+    Chat clients mark messages read as the user scrolls, so requests arrive
+    in bursts of a few ids each. They are buffered and written every
+    READ_RECEIPTS_FLUSH_INTERVAL (or once READ_RECEIPTS_BATCH_SIZE ids are
+    waiting) with one UPDATE for the messages and one for the dialogs'
+    unread counters. Senders get their messages_read events after the
+    commit.
+    """
+
+    def __init__(self, batch_size: int = settings.READ_RECEIPTS_BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        # (dialog_id, reader_id) -> message ids
+        self._pending: Dict[tuple[int, int], Set[int]] = {}
+        self._pending_count = 0
+        self._full = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def mark_read(self, db: AsyncSession, dialog_id: int, reader_id: int, message_ids: list[int]):
+        """Mark messages of a dialog read by ``reader_id`` (buffered while the flusher runs)."""
+        if self._flusher is None:
+            # No background flusher (scripts, tests): apply right away
+            await self._apply(db, {(dialog_id, reader_id): set(message_ids)})
+            return
+        self._pending.setdefault((dialog_id, reader_id), set()).update(message_ids)
+        self._pending_count += len(message_ids)
+        if self._pending_count >= self.batch_size:
+            self._full.set()
+
+    async def flush(self) -> None:
+        """Write out everything buffered so far."""
+        if not self._pending:
+            return
+        pending, self._pending, self._pending_count = self._pending, {}, 0
+        self._full.clear()
+        try:
+            async with async_session_maker() as db:
+                await self._apply(db, pending)
+        except Exception as exc:
+            # One bad group must not hold up everyone else's receipts: apply
+            # the groups one by one and drop whichever still fails
+            print(f"[read_receipts] batch failed, applying per dialog: {exc}")
+            groups = list(pending.items())
+            while groups:
+                key, message_ids = groups[0]
+                try:
+                    async with async_session_maker() as db:
+                        await self._apply(db, {key: message_ids})
+                except Exception as exc:
+                    print(f"[read_receipts] dropped receipts of dialog {key[0]}: {exc}")
+                except BaseException:
+                    self._requeue(dict(groups))
+                    raise
+                groups.pop(0)
+        except BaseException:
+            # Interrupted (shutdown): merge back with whatever arrived meanwhile
+            # for the final flush
+            self._requeue(pending)
+            raise
+
+    def _requeue(self, pending: Dict[tuple[int, int], Set[int]]) -> None:
+        for key, message_ids in pending.items():
+            self._pending.setdefault(key, set()).update(message_ids)
+            self._pending_count += len(message_ids)
+
+    async def _apply(self, db: AsyncSession, pending: Dict[tuple[int, int], Set[int]]):
+        read_at = datetime.now(timezone.utc)
+
+        # UPDATE messages ... FROM (VALUES ...) AS v(id, dialog_id, reader_id):
+        # only still-unread messages of the other participant come back
+        v = values(
+            column("id", Integer),
+            column("dialog_id", Integer),
+            column("reader_id", Integer),
+            name="v",
+        ).data([
+            (message_id, dialog_id, reader_id)
+            for (dialog_id, reader_id), message_ids in pending.items()
+            for message_id in message_ids
+        ])
+        result = await db.execute(
+            update(Message)
+            .where(
+                Message.id == v.c.id,
+                Message.dialog_id == v.c.dialog_id,
+                Message.sender_id != v.c.reader_id,
+                Message.is_read == False,
+            )
+            .values(is_read=True, read_at=read_at)
+            .returning(Message.id, Message.dialog_id, Message.sender_id, v.c.reader_id)
+            .execution_options(synchronize_session=False)
+        )
+        read = result.all()
+
+        # Reset the readers' unread counters of each dialog (Dialog.reset_unread_count).
+        # One VALUES row per dialog: an UPDATE ... FROM applies only one joined
+        # row per target, so buyer and seller reading in the same batch must
+        # arrive together as reader_ids
+        readers: Dict[int, list[int]] = {}
+        for dialog_id, reader_id in pending:
+            readers.setdefault(dialog_id, []).append(reader_id)
+        d = values(
+            column("dialog_id", Integer),
+            column("reader_ids", ARRAY(Integer)),
+            name="d",
+        ).data(list(readers.items()))
+        await db.execute(
+            update(Dialog)
+            .where(Dialog.id == d.c.dialog_id)
+            .values(
+                seller_unread_count=case(
+                    (Dialog.seller_id == any_(d.c.reader_ids), 0),
+                    else_=Dialog.seller_unread_count,
+                ),
+                buyer_unread_count=case(
+                    (Dialog.buyer_id == any_(d.c.reader_ids), 0),
+                    else_=Dialog.buyer_unread_count,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        # Notify senders, one event per dialog and reader
+        read_by_sender: Dict[tuple[int, int, int], list[int]] = {}
+        for message_id, dialog_id, sender_id, reader_id in read:
+            read_by_sender.setdefault((dialog_id, sender_id, reader_id), []).append(message_id)
+        read_at_text = read_at.isoformat()
+        await asyncio.gather(
+            *(
+                manager.send_messages_read(dialog_id, read_ids, reader_id, sender_id, read_at_text)
+                for (dialog_id, sender_id, reader_id), read_ids in read_by_sender.items()
+            ),
+            return_exceptions=True,
+        )
+
+    async def _run_flusher(self, interval: float) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as exc:
+                print(f"[read_receipts] flush failed: {exc}")
+
+    def start(self, interval: float = settings.READ_RECEIPTS_FLUSH_INTERVAL) -> None:
+        """Start the periodic flusher (called on application startup)."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run_flusher(interval))
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out whatever is still buffered."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            # An interrupted flush puts its receipts back before the last one
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        try:
+            await self.flush()
+        except Exception as exc:
+            print(f"[read_receipts] flush failed: {exc}")
+
+
+read_receipts = ReadReceiptBatcher()
+
+
 async def authenticate_websocket(websocket: WebSocket, db: AsyncSession) -> Optional[User]:
     """
     Authenticate WebSocket connection using access token from query params or headers.
@@ -269,150 +532,145 @@ async def authenticate_websocket(websocket: WebSocket, db: AsyncSession) -> Opti
     return None
 
 
-async def handle_websocket_message(
-    connection: ConnectionInfo,
-    data: dict,
-    db: AsyncSession,
-):
-    """
-    Handle incoming WebSocket message.
-    """
-    message_type = data.get("type")
+async def _handle_ping(connection: ConnectionInfo, data: dict, db: AsyncSession):
+    """Heartbeat."""
+    await connection.websocket.send_text(PONG_EVENT)
 
-    if message_type == "ping":
-        # Heartbeat
-        await connection.websocket.send_json({"type": "pong"})
 
-    elif message_type == "subscribe":
-        # Subscribe to a dialog
-        dialog_id = data.get("dialog_id")
-        if dialog_id:
-            # Verify user is participant
-            result = await db.execute(
-                select(Dialog).where(Dialog.id == dialog_id)
-            )
-            dialog = result.scalar_one_or_none()
-            if dialog and dialog.is_participant(connection.user_id):
-                await manager.subscribe_to_dialog(connection.user_id, dialog_id)
-                await connection.websocket.send_json({
-                    "type": "subscribed",
-                    "dialog_id": dialog_id,
-                })
+async def _handle_subscribe(connection: ConnectionInfo, data: dict, db: AsyncSession):
+    """Subscribe to a dialog."""
+    dialog_id = data["dialog_id"]
+    # Verify user is participant
+    result = await db.execute(
+        select(Dialog).where(Dialog.id == dialog_id)
+    )
+    dialog = result.scalar_one_or_none()
+    if dialog and dialog.is_participant(connection.user_id):
+        await manager.subscribe_to_dialog(connection.user_id, dialog_id)
+        await send_event(connection.websocket, {
+            "type": "subscribed",
+            "dialog_id": dialog_id,
+        })
 
-    elif message_type == "unsubscribe":
-        # Unsubscribe from a dialog
-        dialog_id = data.get("dialog_id")
-        if dialog_id:
-            await manager.unsubscribe_from_dialog(connection.user_id, dialog_id)
 
-    elif message_type == "typing":
-        # Typing indicator
-        dialog_id = data.get("dialog_id")
-        is_typing = data.get("is_typing", False)
+async def _handle_unsubscribe(connection: ConnectionInfo, data: dict, db: AsyncSession):
+    """Unsubscribe from a dialog."""
+    await manager.unsubscribe_from_dialog(connection.user_id, data["dialog_id"])
 
-        if dialog_id:
-            result = await db.execute(
-                select(Dialog).where(Dialog.id == dialog_id)
-            )
-            dialog = result.scalar_one_or_none()
-            if dialog and dialog.is_participant(connection.user_id):
-                recipient_id = dialog.get_other_user_id(connection.user_id)
-                await manager.send_typing_indicator(
-                    dialog_id,
-                    connection.user_id,
-                    is_typing,
-                    recipient_id,
-                )
-
-    elif message_type == "message":
-        # New message (can also be handled via REST API)
-        dialog_id = data.get("dialog_id")
-        text = data.get("text")
-
-        if dialog_id and text:
-            result = await db.execute(
-                select(Dialog).where(Dialog.id == dialog_id)
-            )
-            dialog = result.scalar_one_or_none()
-
-            if dialog and dialog.is_participant(connection.user_id):
-                if dialog.is_blocked():
-                    await connection.websocket.send_json({
-                        "type": "error",
-                        "message": "Cannot send messages in blocked dialog",
-                    })
-                    return
-
-                # Create message
-                message = Message(
-                    dialog_id=dialog_id,
-                    sender_id=connection.user_id,
-                    text=text,
-                )
-                db.add(message)
-
-                # Update dialog
-                dialog.last_message_id = message.id
-                dialog.last_message_at = message.created_at
-                dialog.last_message_text = text[:255]
-
-                recipient_id = dialog.get_other_user_id(connection.user_id)
-                dialog.increment_unread_count(recipient_id)
-
-                await db.commit()
-                await db.refresh(message)
-
-                # Notify sender
-                await connection.websocket.send_json({
-                    "type": "message_sent",
-                    "message_id": message.id,
-                    "dialog_id": dialog_id,
-                    "created_at": message.created_at.isoformat(),
+
+async def _handle_typing(connection: ConnectionInfo, data: dict, db: AsyncSession):
+    """Typing indicator."""
+    dialog_id = data["dialog_id"]
+    is_typing = data.get("is_typing", False)
+
+    result = await db.execute(
+        select(Dialog).where(Dialog.id == dialog_id)
+    )
+    dialog = result.scalar_one_or_none()
+    if dialog and dialog.is_participant(connection.user_id):
+        recipient_id = dialog.get_other_user_id(connection.user_id)
+        await manager.send_typing_indicator(
+            dialog_id,
+            connection.user_id,
+            is_typing,
+            recipient_id,
+        )
+
+
+async def _handle_message(connection: ConnectionInfo, data: dict, db: AsyncSession):
+    """New message (can also be handled via REST API)."""
+    dialog_id = data["dialog_id"]
+    text = data["text"]
+
+    if text:
+        result = await db.execute(
+            select(Dialog).where(Dialog.id == dialog_id)
+        )
+        dialog = result.scalar_one_or_none()
+
+        if dialog and dialog.is_participant(connection.user_id):
+            if dialog.is_blocked():
+                await send_event(connection.websocket, {
+                    "type": "error",
+                    "message": "Cannot send messages in blocked dialog",
                 })
+                return
 
-                # Notify recipient
-                await manager.send_new_message(
-                    dialog_id,
-                    {
-                        "id": message.id,
-                        "sender_id": connection.user_id,
-                        "text": text,
-                        "created_at": message.created_at.isoformat(),
-                    },
-                    recipient_id,
-                )
-
-    elif message_type == "mark_read":
-        # Mark messages as read
-        dialog_id = data.get("dialog_id")
-        message_ids = data.get("message_ids", [])
-
-        if dialog_id and message_ids:
+            # Create message; RETURNING gives the id and timestamp
+            # without a flush of an ORM object or a refresh after commit
             result = await db.execute(
-                select(Dialog).where(Dialog.id == dialog_id)
+                insert(Message)
+                .values(dialog_id=dialog_id, sender_id=connection.user_id, text=text)
+                .returning(Message.id, Message.created_at)
             )
-            dialog = result.scalar_one_or_none()
-
-            if dialog and dialog.is_participant(connection.user_id):
-                for msg_id in message_ids:
-                    result = await db.execute(
-                        select(Message).where(
-                            Message.id == msg_id,
-                            Message.dialog_id == dialog_id,
-                            Message.sender_id != connection.user_id,
-                        )
-                    )
-                    message = result.scalar_one_or_none()
-                    if message and not message.is_read:
-                        message.mark_as_read()
-                        # Notify sender
-                        await manager.send_message_read(
-                            dialog_id,
-                            msg_id,
-                            connection.user_id,
-                            message.sender_id,
-                        )
-
-                dialog.reset_unread_count(connection.user_id)
-                await db.commit()
+            message_id, created_at = result.one()
+
+            # Update dialog
+            dialog.last_message_id = message_id
+            dialog.last_message_at = created_at
+            dialog.last_message_text = text[:255]
+
+            recipient_id = dialog.get_other_user_id(connection.user_id)
+            dialog.increment_unread_count(recipient_id)
+
+            await db.commit()
+
+            # Notify sender
+            sent_at = created_at.isoformat()
+            await send_event(connection.websocket, {
+                "type": "message_sent",
+                "message_id": message_id,
+                "dialog_id": dialog_id,
+                "created_at": sent_at,
+            })
+
+            # Notify recipient
+            await manager.send_new_message(
+                dialog_id,
+                {
+                    "id": message_id,
+                    "sender_id": connection.user_id,
+                    "text": text,
+                    "created_at": sent_at,
+                },
+                recipient_id,
+            )
+
+
+async def _handle_mark_read(connection: ConnectionInfo, data: dict, db: AsyncSession):
+    """Mark messages as read."""
+    dialog_id = data["dialog_id"]
+    message_ids = data["message_ids"]
+
+    if message_ids:
+        result = await db.execute(
+            select(Dialog).where(Dialog.id == dialog_id)
+        )
+        dialog = result.scalar_one_or_none()
 
+        if dialog and dialog.is_participant(connection.user_id):
+            # Written with other readers' receipts by the batcher, which
+            # also sends the messages_read events
+            await read_receipts.mark_read(db, dialog_id, connection.user_id, message_ids)
+
+
+# Incoming message type -> handler
+MESSAGE_HANDLERS = {
+    "ping": _handle_ping,
+    "subscribe": _handle_subscribe,
+    "unsubscribe": _handle_unsubscribe,
+    "typing": _handle_typing,
+    "message": _handle_message,
+    "mark_read": _handle_mark_read,
+}
+
+
+async def handle_websocket_message(
+    connection: ConnectionInfo,
+    data: dict,
+    db: AsyncSession,
+):
+    """
+    Handle incoming WebSocket message (a frame from ``decode_incoming``).
+    """
+    await MESSAGE_HANDLERS[data["type"]](connection, data, db)
@@ -5,78 +5,107 @@ Run this after deployment to create your first admin user.
 Usage:
     python scripts/create_admin.py
     or
-    railway run python scripts/create_admin.py
+    railway run python scripts/create_admin.py --email admin@example.com --password ...
+
+Values come from --email/--password/--name, then the ADMIN_EMAIL,
+ADMIN_PASSWORD and ADMIN_NAME environment variables; missing ones are
+prompted for only when running in a terminal.
+
+The app creates the schema on startup; pass --init-db to create it from
+here when the script runs against a fresh database before the app has.
 """
 
+import argparse
 import asyncio
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import select
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.core.database import async_session_maker, init_db
 from app.core.security import hash_password
 from app.models.user import User, UserRole
 
 
-async def create_admin_user():
+DEFAULT_EMAIL = "admin@avtolaif.ru"
+DEFAULT_NAME = "Admin"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Create or promote an admin user.")
+    parser.add_argument("--email", default=os.environ.get("ADMIN_EMAIL"))
+    parser.add_argument("--password", default=os.environ.get("ADMIN_PASSWORD"))
+    parser.add_argument("--name", default=os.environ.get("ADMIN_NAME"))
+    parser.add_argument(
+        "--init-db",
+        action="store_true",
+        help="create missing tables first (the app already does this on startup)",
+    )
+    args = parser.parse_args()
+
+    # Only stop for input when someone is there to type it
+    if sys.stdin.isatty():
+        if args.email is None:
+            args.email = input(f"Enter admin email (default: {DEFAULT_EMAIL}): ").strip()
+        if args.password is None:
+            args.password = input("Enter admin password: ").strip()
+        if args.name is None:
+            args.name = input(f"Enter admin name (default: {DEFAULT_NAME}): ").strip()
+
+    args.email = args.email or DEFAULT_EMAIL
+    args.name = args.name or DEFAULT_NAME
+    if not args.password:
+        parser.error("a password is required (--password or ADMIN_PASSWORD)")
+    return args
+
+
+async def create_admin_user(email: str, password: str, name: str, init: bool = False):
     """Create an admin user."""
-    # Initialize database
-    await init_db()
-    
-    email = input("Enter admin email (default: admin@avtolaif.ru): ").strip() or "admin@avtolaif.ru"
-    password = input("Enter admin password: ").strip()
+    if init:
+        await init_db()
     
-    if not password:
-        print("Error: Password is required")
-        return
-    
-    name = input("Enter admin name (default: Admin): ").strip() or "Admin"
+    password_hash = hash_password(password)
     
     async with async_session_maker() as session:
-        # Check if user already exists
-        result = await session.execute(
-            select(User).where(User.email == email)
-        )
-        existing_user = result.scalar_one_or_none()
-        
-        if existing_user:
-            print(f"User with email {email} already exists.")
-            update = input("Do you want to update this user to admin? (y/n): ").strip().lower()
-            if update == 'y':
-                existing_user.role = UserRole.ADMIN
-                existing_user.password_hash = hash_password(password)
-                existing_user.is_active = True
-                existing_user.email_verified = True
-                await session.commit()
-                print(f"✓ Updated user {email} to admin")
-            else:
-                print("Cancelled.")
-            return
-        
-        # Create new admin user
-        admin_user = User(
+        # Create the admin, or promote an existing user with this email, in
+        # one statement. xmax is 0 only for a freshly inserted row.
+        stmt = pg_insert(User).values(
             email=email,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
             name=name,
             role=UserRole.ADMIN,
             is_active=True,
             email_verified=True,
             phone_verified=False,
         )
-        
-        session.add(admin_user)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.email],
+            set_={
+                "role": UserRole.ADMIN,
+                "password_hash": password_hash,
+                "is_active": True,
+                "email_verified": True,
+                "updated_at": func.now(),
+            },
+        ).returning(literal_column("xmax = 0").label("created"))
+        created = (await session.execute(stmt)).scalar_one()
         await session.commit()
         
+        if not created:
+            print(f"✓ Updated user {email} to admin")
+            return
+        
         print(f"✓ Admin user created successfully!")
         print(f"  Email: {email}")
         print(f"  Name: {name}")
         print(f"  Role: ADMIN")
         print(f"\nYou can now log in to the admin panel at /admin")
 
-
 if __name__ == "__main__":
-    asyncio.run(create_admin_user())
+    args = parse_args()
+    asyncio.run(create_admin_user(args.email, args.password, args.name, args.init_db))
 
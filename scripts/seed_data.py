@@ -4,8 +4,11 @@ Includes categories, vehicle types, brands, body types, etc.
 """
 
 import asyncio
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.bulk import bulk_copy
 from app.core.database import async_session_maker
 from app.models.category import Category
 from app.models.vehicle import (
@@ -24,6 +27,11 @@ from app.models.user import User, UserRole
 from app.core.security import hash_password
 
 
+async def insert_missing(db: AsyncSession, model, rows: list[dict]):
+    """Insert ``rows`` into ``model``'s table, skipping slugs already present."""
+    await db.execute(pg_insert(model).on_conflict_do_nothing(index_elements=[model.slug]), rows)
+
+
 async def seed_categories(db: AsyncSession):
     """Seed categories."""
     categories = [
@@ -37,11 +45,7 @@ async def seed_categories(db: AsyncSession):
         {"name": "Ещё", "slug": "more", "icon": "more", "sort_order": 8},
     ]
 
-    for cat_data in categories:
-        category = Category(**cat_data)
-        db.add(category)
-
-    await db.commit()
+    await insert_missing(db, Category, categories)
     print(f"Seeded {len(categories)} categories")
 
 
@@ -55,11 +59,7 @@ async def seed_vehicle_types(db: AsyncSession):
         {"name": "Спецтехника", "slug": "special", "sort_order": 5},
     ]
 
-    for type_data in types:
-        vt = VehicleType(**type_data)
-        db.add(vt)
-
-    await db.commit()
+    await insert_missing(db, VehicleType, types)
     print(f"Seeded {len(types)} vehicle types")
 
 
@@ -79,11 +79,7 @@ async def seed_body_types(db: AsyncSession):
         {"name": "Лифтбек", "slug": "liftback", "sort_order": 11},
     ]
 
-    for bt_data in body_types:
-        bt = BodyType(**bt_data)
-        db.add(bt)
-
-    await db.commit()
+    await insert_missing(db, BodyType, body_types)
     print(f"Seeded {len(body_types)} body types")
 
 
@@ -96,11 +92,7 @@ async def seed_transmissions(db: AsyncSession):
         {"name": "Вариатор", "slug": "cvt", "short_name": "CVT", "sort_order": 4},
     ]
 
-    for t_data in transmissions:
-        t = Transmission(**t_data)
-        db.add(t)
-
-    await db.commit()
+    await insert_missing(db, Transmission, transmissions)
     print(f"Seeded {len(transmissions)} transmissions")
 
 
@@ -115,11 +107,7 @@ async def seed_fuel_types(db: AsyncSession):
         {"name": "Газ-бензин", "slug": "gas-petrol", "sort_order": 6},
     ]
 
-    for ft_data in fuel_types:
-        ft = FuelType(**ft_data)
-        db.add(ft)
-
-    await db.commit()
+    await insert_missing(db, FuelType, fuel_types)
     print(f"Seeded {len(fuel_types)} fuel types")
 
 
@@ -132,11 +120,7 @@ async def seed_drive_types(db: AsyncSession):
         {"name": "Подключаемый полный", "slug": "4wd", "short_name": "4WD", "sort_order": 4},
     ]
 
-    for dt_data in drive_types:
-        dt = DriveType(**dt_data)
-        db.add(dt)
-
-    await db.commit()
+    await insert_missing(db, DriveType, drive_types)
     print(f"Seeded {len(drive_types)} drive types")
 
 
@@ -158,20 +142,16 @@ async def seed_colors(db: AsyncSession):
         {"name": "Золотой", "slug": "gold", "hex_code": "#FFD700", "sort_order": 13},
     ]
 
-    for c_data in colors:
-        c = Color(**c_data)
-        db.add(c)
-
-    await db.commit()
+    await insert_missing(db, Color, colors)
     print(f"Seeded {len(colors)} colors")
 
 
 async def seed_brands(db: AsyncSession):
     """Seed popular car brands."""
-    # Get passenger vehicle type
-    from sqlalchemy import select
-    result = await db.execute(select(VehicleType).where(VehicleType.slug == "passenger"))
-    passenger_type = result.scalar_one()
+    # Only the passenger vehicle type's id is needed
+    passenger_type_id = (
+        await db.execute(select(VehicleType.id).where(VehicleType.slug == "passenger"))
+    ).scalar_one()
 
     brands = [
         {"name": "Toyota", "slug": "toyota", "country": "Japan", "is_popular": True},
@@ -196,29 +176,43 @@ async def seed_brands(db: AsyncSession):
         {"name": "Volvo", "slug": "volvo", "country": "Sweden", "is_popular": False},
     ]
 
-    for i, b_data in enumerate(brands):
-        b_data["vehicle_type_id"] = passenger_type.id
-        b_data["sort_order"] = i
-        b = Brand(**b_data)
-        db.add(b)
+    # Brand slugs are only unique per vehicle type, so skip existing ones by hand
+    existing = set(
+        (
+            await db.execute(
+                select(Brand.slug).where(Brand.vehicle_type_id == passenger_type_id)
+            )
+        ).scalars()
+    )
+    brands = [
+        {**b_data, "vehicle_type_id": passenger_type_id, "sort_order": i}
+        for i, b_data in enumerate(brands)
+        if b_data["slug"] not in existing
+    ]
 
-    await db.commit()
+    # COPY once the catalog outgrows a plain multi-row INSERT
+    await bulk_copy(db, Brand, brands)
     print(f"Seeded {len(brands)} brands")
 
 
 async def seed_locations(db: AsyncSession):
     """Seed locations (Russia)."""
     # Create Russia
-    russia = Country(
-        name="Россия",
-        slug="russia",
-        code="RU",
-        phone_code="+7",
-        flag_emoji="🇷🇺",
-        sort_order=1,
+    await db.execute(
+        pg_insert(Country)
+        .values(
+            name="Россия",
+            slug="russia",
+            code="RU",
+            phone_code="+7",
+            flag_emoji="🇷🇺",
+            sort_order=1,
+        )
+        .on_conflict_do_nothing(index_elements=[Country.slug])
     )
-    db.add(russia)
-    await db.flush()
+    russia_id = (
+        await db.execute(select(Country.id).where(Country.slug == "russia"))
+    ).scalar_one()
 
     # Create regions and cities
     regions_cities = [
@@ -273,68 +267,108 @@ async def seed_locations(db: AsyncSession):
         },
     ]
 
-    for i, reg_data in enumerate(regions_cities):
-        region = Region(
-            country_id=russia.id,
+    # Region and city slugs are only unique per parent; keep what an earlier
+    # run already stored and add the rest
+    regions = {
+        region.slug: region
+        for region in (
+            await db.execute(select(Region).where(Region.country_id == russia_id))
+        ).scalars()
+    }
+    new_regions = [
+        Region(
+            country_id=russia_id,
             name=reg_data["name"],
             slug=reg_data["slug"],
             sort_order=i,
         )
-        db.add(region)
-        await db.flush()
-
-        for j, city_data in enumerate(reg_data["cities"]):
-            city = City(
-                region_id=region.id,
-                name=city_data["name"],
-                slug=city_data["slug"],
-                latitude=city_data.get("latitude"),
-                longitude=city_data.get("longitude"),
-                population=city_data.get("population"),
-                is_major=city_data.get("is_major", False),
-                sort_order=j,
+        for i, reg_data in enumerate(regions_cities)
+        if reg_data["slug"] not in regions
+    ]
+    db.add_all(new_regions)
+    # One batched INSERT ... RETURNING fills in every region id
+    await db.flush()
+    regions.update((region.slug, region) for region in new_regions)
+
+    existing_cities = set(
+        (
+            await db.execute(
+                select(City.region_id, City.slug).where(
+                    City.region_id.in_([region.id for region in regions.values()])
+                )
             )
-            db.add(city)
-
-    await db.commit()
+        ).tuples()
+    )
+    cities = []
+    for reg_data in regions_cities:
+        region = regions[reg_data["slug"]]
+        for j, city_data in enumerate(reg_data["cities"]):
+            if (region.id, city_data["slug"]) in existing_cities:
+                continue
+            cities.append({
+                "region_id": region.id,
+                "name": city_data["name"],
+                "slug": city_data["slug"],
+                "latitude": city_data.get("latitude"),
+                "longitude": city_data.get("longitude"),
+                "population": city_data.get("population"),
+                "is_major": city_data.get("is_major", False),
+                "sort_order": j,
+            })
+
+    await bulk_copy(db, City, cities)
     print(f"Seeded locations for Russia")
 
 
 async def seed_admin_user(db: AsyncSession):
-    """Seed admin user."""
-    admin = User(
-        email="admin@avtolaif.ru",
-        phone="+79001234567",
-        password_hash=hash_password("admin123"),
-        name="Admin",
-        role=UserRole.ADMIN,
-        email_verified=True,
-        phone_verified=True,
+    """Seed admin user (skipped if the email is already registered)."""
+    await db.execute(
+        pg_insert(User)
+        .values(
+            email="admin@avtolaif.ru",
+            phone="+79001234567",
+            password_hash=hash_password("admin123"),
+            name="Admin",
+            role=UserRole.ADMIN,
+            email_verified=True,
+            phone_verified=True,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
     )
-    db.add(admin)
-    await db.commit()
     print("Seeded admin user (email: admin@avtolaif.ru, password: admin123)")
 
+async def seed_in_session(*seeds):
+    """Run ``seeds`` in order on a session of their own and commit them together."""
+    async with async_session_maker() as db:
+        # Every seed skips rows that are already there, so a run cut short
+        # (even a commit lost in a crash) is fixed by running it again;
+        # don't wait for the WAL flush on commit
+        await db.execute(text("SET LOCAL synchronous_commit TO off"))
+        for seed in seeds:
+            await seed(db)
+        await db.commit()
+
 
 async def main():
     """Run all seed functions."""
     print("Starting database seeding...")
 
-    async with async_session_maker() as db:
-        await seed_categories(db)
-        await seed_vehicle_types(db)
-        await seed_body_types(db)
-        await seed_transmissions(db)
-        await seed_fuel_types(db)
-        await seed_drive_types(db)
-        await seed_colors(db)
-        await seed_brands(db)
-        await seed_locations(db)
-        await seed_admin_user(db)
+    # Independent tables load concurrently, each on its own pooled connection;
+    # brands look up the passenger vehicle type, so they follow it in one session
+    await asyncio.gather(
+        seed_in_session(seed_categories),
+        seed_in_session(seed_vehicle_types, seed_brands),
+        seed_in_session(seed_body_types),
+        seed_in_session(seed_transmissions),
+        seed_in_session(seed_fuel_types),
+        seed_in_session(seed_drive_types),
+        seed_in_session(seed_colors),
+        seed_in_session(seed_locations),
+        seed_in_session(seed_admin_user),
+    )
 
     print("Database seeding complete!")
 
-
 if __name__ == "__main__":
     asyncio.run(main())
 
@@ -2,13 +2,19 @@
 Pytest configuration and fixtures.
 """
 
-import asyncio
-from typing import AsyncGenerator, Generator
+import os
+from typing import AsyncGenerator
+
+# bcrypt's minimum work factor: hashes stay real (verify_password still runs
+# bcrypt) but cost well under a millisecond. Must be set before app imports.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
 
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.main import app
@@ -18,13 +24,30 @@ from app.models.user import User, UserRole
 from app.core.security import hash_password, create_access_token
 
 
-# Test database URL
-TEST_DATABASE_URL = settings.DATABASE_URL.replace(
-    "/avto_laif", "/avto_laif_test"
+# Test database URL. The schema relies on PostgreSQL (JSONB, TSVECTOR, GIN and
+# partial indexes), so tests need a real PostgreSQL; point TEST_DATABASE_URL at
+# a local one (unix socket, tmpfs data dir) to keep round trips cheap.
+TEST_DATABASE_URL = os.environ.get(
+    "TEST_DATABASE_URL",
+    settings.DATABASE_URL.replace("/avto_laif", "/avto_laif_test"),
 )
 
-# Create test engine
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+# Under pytest-xdist each worker (gw0, gw1, ...) gets a database of its own
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    _url = make_url(TEST_DATABASE_URL)
+    TEST_DATABASE_URL = _url.set(database=f"{_url.database}_{XDIST_WORKER}").render_as_string(
+        hide_password=False
+    )
+
+# Create test engine. Tests run one at a time and each holds a single
+# connection (see db_session), so one pooled connection serves the whole suite.
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=False,
+    pool_size=1,
+    max_overflow=0,
+)
 
 # Create test session factory
 test_session_maker = async_sessionmaker(
@@ -34,76 +57,142 @@ test_session_maker = async_sessionmaker(
 )
 
 
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test on the session event loop.
+
+    The pooled connection is opened by the session-scoped fixtures and asyncpg
+    connections can't move between loops, so fixtures (see
+    asyncio_default_fixture_loop_scope in pytest.ini) and tests share one loop.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def user_password_hash() -> str:
+    """bcrypt hash of the test user's password, computed once per run."""
+    return hash_password("testpassword123")
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a fresh database session for each test."""
+@pytest.fixture(scope="session")
+def admin_password_hash() -> str:
+    """bcrypt hash of the test admin's password, computed once per run."""
+    return hash_password("adminpassword123")
+
+
+async def _create_worker_database() -> None:
+    """Create this xdist worker's database if it doesn't exist yet."""
+    url = make_url(TEST_DATABASE_URL)
+    admin_engine = create_async_engine(
+        url.set(database="postgres"),
+        isolation_level="AUTOCOMMIT",
+    )
+    try:
+        async with admin_engine.connect() as conn:
+            exists = await conn.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": url.database},
+            )
+            if not exists:
+                await conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+    finally:
+        await admin_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_schema() -> AsyncGenerator[None, None]:
+    """Create the schema once for the whole test session."""
+    if XDIST_WORKER:
+        await _create_worker_database()
+
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with test_session_maker() as session:
-        yield session
+    yield
 
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client with overridden database dependency."""
+async def db_session(db_schema) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a database session for each test.
+
+    The session runs inside an outer transaction that is rolled back after
+    the test; its commits only release savepoints, so nothing persists.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        async with test_session_maker(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """One AsyncClient/ASGITransport for the whole test session."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    http_client: AsyncClient,
+    db_session: AsyncSession,
+) -> AsyncGenerator[AsyncClient, None]:
+    """The shared test client, with the database dependency bound to this test's session."""
 
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    http_client.cookies.clear()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as ac:
-        yield ac
+    yield http_client
 
     app.dependency_overrides.clear()
 
 
 @pytest_asyncio.fixture
-async def test_user(db_session: AsyncSession) -> User:
+async def test_user(db_session: AsyncSession, user_password_hash: str) -> User:
     """Create a test user."""
     user = User(
         email="test@example.com",
         phone="+79001234567",
-        password_hash=hash_password("testpassword123"),
+        password_hash=user_password_hash,
         name="Test User",
         role=UserRole.USER,
         email_verified=True,
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
     return user
 
 
 @pytest_asyncio.fixture
-async def test_admin(db_session: AsyncSession) -> User:
+async def test_admin(db_session: AsyncSession, admin_password_hash: str) -> User:
     """Create a test admin user."""
     user = User(
         email="admin@example.com",
         phone="+79009876543",
-        password_hash=hash_password("adminpassword123"),
+        password_hash=admin_password_hash,
         name="Admin User",
         role=UserRole.ADMIN,
         email_verified=True,
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
     return user
 
 
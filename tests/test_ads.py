@@ -0,0 +1,95 @@
+"""
+Tests for ad listing endpoints.
+"""
+
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.ad import Ad, AdStatus, features_mask
+from app.models.category import Category
+from app.models.location import City, Country, Region
+from app.models.user import User
+from app.models.vehicle import Brand, Model, VehicleType
+
+
+@pytest_asyncio.fixture
+async def equipped_ads(db_session: AsyncSession, test_user: User) -> dict[str, int]:
+    """Three active ads with different equipment, keyed by a short label."""
+    category = Category(name="Автомобили", slug="auto")
+    vehicle_type = VehicleType(name="Легковые", slug="passenger")
+    country = Country(name="Россия", slug="russia", code="RU")
+    db_session.add_all([category, vehicle_type, country])
+    await db_session.flush()
+
+    brand = Brand(name="Toyota", slug="toyota", vehicle_type_id=vehicle_type.id)
+    region = Region(name="Москва", slug="moscow-region", country_id=country.id)
+    db_session.add_all([brand, region])
+    await db_session.flush()
+
+    model = Model(name="Camry", slug="camry", brand_id=brand.id)
+    city = City(name="Москва", slug="moscow", region_id=region.id)
+    db_session.add_all([model, city])
+    await db_session.flush()
+
+    equipment = {
+        "bare": [],
+        "abs": ["abs"],
+        "abs_esp": ["abs", "esp", "navigation"],
+    }
+    ads = {
+        label: Ad(
+            user_id=test_user.id,
+            status=AdStatus.ACTIVE,
+            category_id=category.id,
+            vehicle_type_id=vehicle_type.id,
+            brand_id=brand.id,
+            model_id=model.id,
+            city_id=city.id,
+            year=2020,
+            mileage=10000,
+            price=Decimal("1000000"),
+            title=f"Toyota Camry ({label})",
+            features_mask=features_mask(features),
+        )
+        for label, features in equipment.items()
+    }
+    db_session.add_all(ads.values())
+    await db_session.commit()
+
+    # The public list may be served from ad_list_mv; bring it up to date
+    # inside the test's transaction (rolled back with everything else)
+    await db_session.execute(text("REFRESH MATERIALIZED VIEW ad_list_mv"))
+    return {label: ad.id for label, ad in ads.items()}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_list_view", [True, False])
+async def test_list_ads_filters_by_features(
+    client: AsyncClient,
+    equipped_ads: dict[str, int],
+    monkeypatch,
+    use_list_view: bool,
+):
+    """Repeated ?features= query parameters require all listed features."""
+    monkeypatch.setattr(settings, "AD_LIST_MV_ENABLED", use_list_view)
+
+    response = await client.get("/api/v1/ads/", params=[("features", "abs"), ("features", "esp")])
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == [equipped_ads["abs_esp"]]
+
+    response = await client.get("/api/v1/ads/", params={"features": "abs"})
+    assert response.status_code == 200
+    assert {item["id"] for item in response.json()["items"]} == {
+        equipped_ads["abs"],
+        equipped_ads["abs_esp"],
+    }
+
+    response = await client.get("/api/v1/ads/")
+    assert response.status_code == 200
+    assert response.json()["total"] == 3